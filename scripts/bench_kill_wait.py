@@ -0,0 +1,97 @@
+"""Benchmark kill_process latency: pidfd wait vs polling.
+
+Kills real child processes and reports how long kill_process takes,
+for a graceful exit (the child exits shortly after SIGTERM) and a forced
+one (the child ignores SIGTERM and is SIGKILLed after --timeout). Compares
+the pidfd wait, the backoff-polling fallback, and the old fixed loop
+(0.5s polls, then a flat 1s after SIGKILL).
+
+Usage:
+    python scripts/bench_kill_wait.py [--runs N] [--exit-delay S] [--timeout S]
+"""
+
+import argparse
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.recovery.killer import is_process_running, kill_process  # noqa: E402
+
+CHILD = """
+import signal, sys, time
+delay = float(sys.argv[1])
+if delay < 0:
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+else:
+    signal.signal(signal.SIGTERM, lambda *a: (time.sleep(delay), sys.exit(0)))
+print("ready", flush=True)
+time.sleep(60)
+"""
+
+
+def _fixed_loop_kill(pid: int, timeout: float) -> None:
+    """The previous kill_process wait: 0.5s polls, 1s after SIGKILL."""
+    os.kill(pid, signal.SIGTERM)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not is_process_running(pid):
+            return
+        time.sleep(0.5)
+    os.kill(pid, signal.SIGKILL)
+    time.sleep(1.0)
+
+
+def _pidfd_kill(pid: int, timeout: float) -> None:
+    kill_process(pid, timeout=timeout)
+
+
+def _polling_kill(pid: int, timeout: float) -> None:
+    with patch("src.recovery.killer.open_pidfd", return_value=None):
+        kill_process(pid, timeout=timeout)
+
+
+METHODS = {"pidfd": _pidfd_kill, "backoff": _polling_kill, "fixed": _fixed_loop_kill}
+
+
+def _measure(method, exit_delay: float, timeout: float, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.Popen(
+            [sys.executable, "-c", CHILD, str(exit_delay)], stdout=subprocess.PIPE
+        )
+        proc.stdout.readline()
+        t0 = time.perf_counter()
+        method(proc.pid, timeout)
+        samples.append(time.perf_counter() - t0)
+        proc.wait()
+        proc.stdout.close()
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    ms = sorted(s * 1000 for s in samples)
+    return (f"n={len(ms):3d}  p50={statistics.median(ms):8.2f}ms  "
+            f"max={ms[-1]:8.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--exit-delay", type=float, default=0.05,
+                        help="seconds a graceful child takes to exit after SIGTERM")
+    parser.add_argument("--timeout", type=float, default=0.5,
+                        help="kill_timeout before SIGKILL in the forced case")
+    args = parser.parse_args()
+    cases = (("graceful", args.exit_delay, 10.0), ("forced", -1.0, args.timeout))
+    for case, delay, timeout in cases:
+        for name, method in METHODS.items():
+            samples = _measure(method, delay, timeout, args.runs)
+            print(f"[{case:8s}] {name:7s}  {_summary(samples)}")
@@ -0,0 +1,108 @@
+"""Benchmark concurrent writer/reader latency on the Watchdog store.
+
+Runs a writer process (one record_report per cycle for a simulated fleet)
+and a reader process (history queries on a read-only connection) at the
+same time, then prints latency percentiles for each. Compares WAL against the
+legacy rollback journal.
+
+Usage:
+    python scripts/bench_store_concurrency.py [--processes N] [--seconds S]
+"""
+
+import argparse
+import multiprocessing as mp
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.config.constants import ProcessHealth  # noqa: E402
+from src.database.connection import open_connection  # noqa: E402
+from src.database.store import WatchdogStore  # noqa: E402
+from src.monitor.models import CheckResult, MonitorReport  # noqa: E402
+
+
+def _report(n: int, cycle: int) -> MonitorReport:
+    health = ProcessHealth.HEALTHY if cycle % 5 else ProcessHealth.TIMED_OUT
+    return MonitorReport(
+        timestamp=datetime.now(timezone.utc),
+        results=[
+            CheckResult(f"proc_{i}", f"proc_{i}", health, 1000 + i,
+                        datetime.now(timezone.utc), 1.0, 60)
+            for i in range(n)
+        ],
+    )
+
+
+def _percentiles(samples: list[float]) -> str:
+    if not samples:
+        return "no samples"
+    ms = sorted(s * 1000 for s in samples)
+    p99 = ms[min(len(ms) - 1, int(len(ms) * 0.99))]
+    return (f"n={len(ms):5d}  p50={statistics.median(ms):7.2f}ms  "
+            f"p99={p99:7.2f}ms  max={ms[-1]:7.2f}ms")
+
+
+def _writer(db_path, journal_mode, processes, stop, out) -> None:
+    store = WatchdogStore(db_path)
+    store._conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    samples, cycle = [], 0
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        store.record_report(_report(processes, cycle), threshold=2)
+        samples.append(time.perf_counter() - t0)
+        cycle += 1
+    store.close()
+    out.put(("writer", samples))
+
+
+def _reader(db_path, stop, out) -> None:
+    conn = open_connection(db_path, read_only=True)
+    samples = []
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        conn.execute(
+            "SELECT * FROM check_history WHERE process_key = ? "
+            "ORDER BY id DESC LIMIT 100", ("proc_0",),
+        ).fetchall()
+        samples.append(time.perf_counter() - t0)
+    conn.close()
+    out.put(("reader", samples))
+
+
+def run(journal_mode: str, processes: int, seconds: float) -> None:
+    """Run writer and reader as separate processes, like cron and the TUI."""
+    db_path = str(Path(tempfile.mkdtemp()) / "bench.db")
+    store = WatchdogStore(db_path)
+    store._conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    store.close()
+
+    stop, out = mp.Event(), mp.Queue()
+    workers = [
+        mp.Process(target=_writer, args=(db_path, journal_mode, processes, stop, out)),
+        mp.Process(target=_reader, args=(db_path, stop, out)),
+    ]
+    for w in workers:
+        w.start()
+    time.sleep(seconds)
+    stop.set()
+    results = dict(out.get() for _ in workers)
+    for w in workers:
+        w.join()
+
+    for role in ("writer", "reader"):
+        print(f"[{journal_mode:6s}] {role}  {_percentiles(results[role])}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    for mode in ("delete", "wal"):
+        run(mode, args.processes, args.seconds)
@@ -9,13 +9,21 @@ from src.config.config_loader import get_global_options, get_process_configs
 from src.config.constants import (
     ProcessHealth,
     DEFAULT_LOCK_PATH,
-    DEFAULT_DB_PATH,
     DEFAULT_CONSECUTIVE_FAILURES,
 )
+from src.cli.store_ops import (
+    apply_retention,
+    log_held,
+    log_recovery,
+    open_store,
+    recovery_gates,
+)
+from src.collector.agent import CollectorAgent, agent_from_options
 from src.database.store import WatchdogStore
 from src.logging.logger import get_logger
-from src.monitor.checker import check_all_processes
+from src.monitor.checker import HeartbeatReader, check_all_processes
 from src.pipeline.recovery_pipeline import run_recovery
+from src.pipeline.scheduler import run_recoveries
 
 logger = get_logger("check")
 
@@ -38,37 +46,50 @@ def handle_check(config: dict) -> int:
         logger.info("Another Watchdog instance is running, exiting")
         return 0
 
-    db_path = config.get("db_path", DEFAULT_DB_PATH)
     threshold = config.get(
         "consecutive_failures_threshold", DEFAULT_CONSECUTIVE_FAILURES
     )
-    store = WatchdogStore(db_path)
+    store = open_store(config, global_opts)
+    agent = agent_from_options(global_opts)
 
     try:
-        return _run_checks(config, store, threshold, global_opts)
+        return _run_checks(config, store, threshold, global_opts, agent=agent)
     finally:
         store.close()
+        if agent:
+            agent.close()
         lock.close()
 
 
 def _run_checks(
-    config: dict, store: WatchdogStore, threshold: int, global_opts: dict
+    config: dict,
+    store: WatchdogStore,
+    threshold: int,
+    global_opts: dict,
+    reader: HeartbeatReader | None = None,
+    agent: CollectorAgent | None = None,
 ) -> int:
-    """Check all processes and recover unhealthy ones."""
-    report = check_all_processes(config)
+    """Check all processes and recover unhealthy ones.
+
+    Recoveries for all processes past the threshold, unless held back by
+    crash-loop backoff (see recovery_gates), run concurrently (see
+    run_recoveries) and are recorded afterwards in report order. With an
+    agent, the cycle and its recoveries are also shipped to the collector
+    at the end.
+    """
+    report = check_all_processes(config, reader=reader)
     enabled = get_process_configs(config)
+    due = []
     any_failed = False
 
-    for result in report.results:
-        heartbeat_ts = (
-            result.last_heartbeat.isoformat() if result.last_heartbeat else None
-        )
+    gates = recovery_gates(store, report.results, global_opts)
+    held = {key for key, gate in gates.items() if not gate.allowed}
+    failures_by_key = store.record_report(report, threshold, held)
+    if agent:
+        agent.add_report(report, threshold, failures_by_key, held)
 
+    for result in report.results:
         if result.health == ProcessHealth.HEALTHY:
-            store.record_check(
-                result.process_key, result.health.value,
-                result.pid, heartbeat_ts, None,
-            )
             logger.info("%s: healthy", result.display_name)
             continue
 
@@ -78,12 +99,15 @@ def _run_checks(
             result.pid, result.elapsed_seconds,
         )
 
-        failures = store.record_check(
-            result.process_key, result.health.value,
-            result.pid, heartbeat_ts, None,
-            action="waiting_for_consecutive" if threshold > 1 else None,
-        )
+        if result.health == ProcessHealth.READ_TIMEOUT:
+            # no PID was read, so recovery could not kill the old instance
+            logger.info(
+                "%s: heartbeat unreadable, not recovering until a read succeeds",
+                result.display_name,
+            )
+            continue
 
+        failures = failures_by_key[result.process_key]
         if failures < threshold:
             logger.info(
                 "%s: failure %d/%d, waiting before recovery",
@@ -91,23 +115,31 @@ def _run_checks(
             )
             continue
 
+        if result.process_key in held:
+            gate = gates[result.process_key]
+            log_held(result, gate, global_opts)
+            any_failed = any_failed or gate.circuit_open
+            continue
+
         logger.warning(
             "%s: %d consecutive failures, triggering recovery",
             result.display_name, failures,
         )
+        due.append(result)
 
-        proc_config = enabled[result.process_key]
-        recovery = run_recovery(
-            process_key=result.process_key,
-            pid=result.pid,
-            proc_config=proc_config,
-            global_opts=global_opts,
-        )
+    recoveries = run_recoveries(due, enabled, global_opts, run=run_recovery)
+    for result, recovery in zip(due, recoveries):
+        log_recovery(store, recovery, result.health.value, result.pid)
+        if agent:
+            agent.add_recovery(recovery, result.health.value, result.pid)
         if recovery.fully_recovered:
             store.reset_failures(result.process_key)
         else:
             any_failed = True
 
+    apply_retention(store, global_opts)
+    if agent:
+        agent.flush()
     logger.info(
         "Check complete: %d checked, %d healthy, %d unhealthy",
         report.processes_checked,
@@ -0,0 +1,40 @@
+# Area: CLI Commands
+# PRD: docs/prd-cli-commands.md
+"""Collector handler: run the central ingest service until signalled."""
+
+import threading
+
+from src.cli.daemon import _install_signal_handlers, _restore_signal_handlers
+from src.collector.server import create_server
+from src.config.config_loader import get_global_options
+from src.logging.logger import get_logger
+
+logger = get_logger("collector")
+
+
+def handle_collector(
+    config: dict, listen: str | None = None, db_path: str | None = None
+) -> int:
+    """Serve agents on `listen`, writing to `db_path`, until SIGTERM/SIGINT."""
+    global_opts = get_global_options(config)
+    listen = listen or global_opts["collector_listen"]
+    db_path = db_path or global_opts["collector_db_path"]
+    try:
+        server = create_server(listen, db_path)
+    except (OSError, ValueError) as e:
+        logger.error("Cannot start collector on %s: %s", listen, e)
+        return 2
+
+    stop = threading.Event()
+    previous = _install_signal_handlers(stop)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logger.info("Collector listening on %s, writing %s", listen, db_path)
+    try:
+        stop.wait()
+    finally:
+        server.shutdown()
+        server.server_close()
+        _restore_signal_handlers(previous)
+    logger.info("Collector stopped")
+    return 0
@@ -0,0 +1,117 @@
+# Area: CLI Commands
+# PRD: docs/prd-cli-commands.md
+"""Daemon mode: run check cycles in one long-lived process."""
+
+import signal
+import threading
+import time
+
+from src.cli.check import _run_checks, acquire_lock
+from src.cli.store_ops import open_store
+from src.collector.agent import agent_from_options
+from src.config.config_loader import get_global_options, get_process_configs
+from src.config.constants import DEFAULT_CONSECUTIVE_FAILURES
+from src.heartbeat.cache import HeartbeatCache
+from src.heartbeat.reader import read_heartbeat
+from src.heartbeat.source import uses_shm
+from src.heartbeat.watcher import HeartbeatWatcher
+from src.logging.logger import get_logger
+
+logger = get_logger("daemon")
+
+
+def handle_daemon(
+    config: dict,
+    interval: float | None = None,
+    max_cycles: int | None = None,
+) -> int:
+    """Run check cycles every `interval` seconds until SIGTERM/SIGINT.
+
+    Config, store connection and lock are set up once and kept for the
+    life of the process, so each cycle pays only for the checks. Process
+    state is cached in memory and written to SQLite behind the loop.
+    """
+    global_opts = get_global_options(config)
+    lock = acquire_lock(global_opts["lock_path"])
+    if lock is None:
+        logger.info("Another Watchdog instance is running, exiting")
+        return 0
+
+    interval = interval if interval is not None else global_opts["daemon_interval"]
+    threshold = config.get(
+        "consecutive_failures_threshold", DEFAULT_CONSECUTIVE_FAILURES
+    )
+    store = open_store(config, global_opts, cached=True)
+    agent = agent_from_options(global_opts)
+    cache_size = global_opts["heartbeat_cache_size"]
+    cache = HeartbeatCache(cache_size) if cache_size > 0 else None
+    fallback = cache.read if cache else read_heartbeat
+    watcher = (
+        _build_watcher(config, fallback)
+        if global_opts["heartbeat_watch"] else None
+    )
+    reader = watcher.read if watcher else fallback
+    stop = threading.Event()
+    previous = _install_signal_handlers(stop)
+
+    logger.info("Daemon started (interval %.1fs)", interval)
+    try:
+        cycles = 0
+        while not stop.is_set():
+            started = time.monotonic()
+            try:
+                if watcher:
+                    watcher.refresh()
+                _run_checks(config, store, threshold, global_opts, reader, agent)
+            except Exception:
+                logger.exception("Check cycle failed")
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            stop.wait(max(0.0, interval - (time.monotonic() - started)))
+    finally:
+        _restore_signal_handlers(previous)
+        if watcher:
+            watcher.close()
+        if cache:
+            logger.info("Heartbeat cache: %s", cache.stats())
+        store.close()
+        if agent:
+            agent.close()
+        lock.close()
+    logger.info("Daemon stopped")
+    return 0
+
+
+def _build_watcher(config: dict, fallback) -> HeartbeatWatcher:
+    """Watch every enabled heartbeat file; unwatchable ones use fallback."""
+    paths = [
+        p["heartbeat_path"] for p in get_process_configs(config).values()
+        if not uses_shm(p)
+    ]
+    watcher = HeartbeatWatcher(paths, fallback=fallback)
+    logger.info(
+        "Watching %d/%d heartbeat files via inotify",
+        len(watcher.watched_paths), len(paths),
+    )
+    return watcher
+
+
+def _install_signal_handlers(stop: threading.Event) -> dict:
+    """Make SIGTERM/SIGINT end the loop after the current cycle."""
+    if threading.current_thread() is not threading.main_thread():
+        return {}
+
+    def _handler(signum, frame):
+        logger.info("Received signal %d, stopping", signum)
+        stop.set()
+
+    return {
+        sig: signal.signal(sig, _handler)
+        for sig in (signal.SIGTERM, signal.SIGINT)
+    }
+
+
+def _restore_signal_handlers(previous: dict) -> None:
+    for sig, handler in previous.items():
+        signal.signal(sig, handler)
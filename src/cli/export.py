@@ -0,0 +1,108 @@
+# Area: CLI Commands
+# PRD: docs/prd-cli-commands.md
+"""Export handler: stream history or recovery rows as NDJSON or CSV."""
+
+import csv
+import gzip
+import io
+import json
+import os
+import sqlite3
+import sys
+from collections.abc import Iterable
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TextIO
+
+from src.config.constants import DEFAULT_DB_PATH
+from src.database.export import EXPORT_KEYS, iter_export
+from src.database.store import WatchdogStore
+from src.logging.logger import get_logger
+
+logger = get_logger("export")
+
+
+def _mark_key(table: str, process_key: str | None) -> str:
+    """Marks of a --process export are kept apart from the whole table's."""
+    return table if process_key is None else f"{table}:{process_key}"
+
+
+def read_mark(path: str | None, table: str, process_key: str | None = None) -> int:
+    """Last exported key for `table` from a high-water mark file (0 if none)."""
+    if path is None or not Path(path).exists():
+        return 0
+    marks = json.loads(Path(path).read_text())
+    return int(marks.get(_mark_key(table, process_key), 0))
+
+
+def write_mark(path: str, table: str, key: int, process_key: str | None = None) -> None:
+    """Record `key` as exported for `table`, replacing the file atomically."""
+    marks = json.loads(Path(path).read_text()) if Path(path).exists() else {}
+    marks[_mark_key(table, process_key)] = key
+    tmp = f"{path}.tmp"
+    Path(tmp).write_text(json.dumps(marks, indent=2) + "\n")
+    os.replace(tmp, path)
+
+
+def _open_output(stack: ExitStack, output: str, compress: bool) -> TextIO:
+    """Text stream for a path or '-' (stdout), gzip-compressed if asked."""
+    if output == "-":
+        if not compress:
+            return sys.stdout
+        raw = stack.enter_context(gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb"))
+        return stack.enter_context(io.TextIOWrapper(raw, encoding="utf-8", newline=""))
+    if compress:
+        return stack.enter_context(gzip.open(output, "wt", encoding="utf-8", newline=""))
+    return stack.enter_context(open(output, "w", encoding="utf-8", newline=""))
+
+
+def write_rows(rows: Iterable[dict], out: TextIO, fmt: str) -> tuple[int, dict | None]:
+    """Write rows as NDJSON or CSV. Returns (count, last row)."""
+    count, last, writer = 0, None, None
+    for last in rows:
+        if fmt == "ndjson":
+            out.write(json.dumps(last, separators=(",", ":")) + "\n")
+        else:
+            if writer is None:
+                writer = csv.DictWriter(out, fieldnames=list(last))
+                writer.writeheader()
+            writer.writerow(last)
+        count += 1
+    return count, last
+
+
+def handle_export(
+    config: dict,
+    table: str = "history",
+    fmt: str = "ndjson",
+    output: str = "-",
+    compress: bool = False,
+    mark_path: str | None = None,
+    process_key: str | None = None,
+) -> int:
+    """Export rows above the saved mark, then advance the mark.
+
+    With process_key the mark is kept per (table, process). In
+    history_mode "changes" a row already exported keeps changing
+    (repeats, last_checked_at) while its process stays in that state;
+    those updates are not exported again, only the rows after it.
+    """
+    after = read_mark(mark_path, table, process_key)
+    try:
+        store = WatchdogStore(config.get("db_path", DEFAULT_DB_PATH), read_only=True)
+    except sqlite3.OperationalError as e:
+        print(f"Cannot open history database: {e}", file=sys.stderr)
+        return 2
+    try:
+        with ExitStack() as stack:
+            out = _open_output(stack, output, compress)
+            rows = iter_export(store.connection, table, after, process_key)
+            count, last = write_rows(rows, out, fmt)
+            out.flush()
+    finally:
+        store.close()
+
+    if mark_path and last is not None:
+        write_mark(mark_path, table, last[EXPORT_KEYS[table]], process_key)
+    logger.info("Exported %d %s rows after key %d", count, table, after)
+    return 0
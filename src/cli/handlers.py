@@ -2,14 +2,13 @@
 # PRD: docs/prd-cli-commands.md
 """Command handlers for the Watchdog CLI."""
 
-from pathlib import Path
-
 from src.config.config_loader import (
     get_global_options,
     get_process_configs,
     get_single_process_config,
 )
 from src.heartbeat.reader import read_heartbeat
+from src.heartbeat.source import read_process_heartbeat
 from src.logging.logger import get_logger
 from src.pipeline.recovery_pipeline import run_recovery
 from src.recovery.killer import kill_process
@@ -47,14 +46,17 @@ def handle_off(config: dict, process_key: str) -> int:
         logger.error("Unknown process: %s", process_key)
         return 2
 
-    heartbeat = read_heartbeat(Path(proc["heartbeat_path"]))
+    heartbeat = read_process_heartbeat(process_key, proc, read_heartbeat)
     if heartbeat is None:
         logger.warning("No heartbeat for %s, nothing to kill", process_key)
         return 0
 
     opts = get_global_options(config)
     logger.info("Killing %s (PID %d)", process_key, heartbeat.pid)
-    result = kill_process(heartbeat.pid, timeout=opts["kill_timeout"])
+    result = kill_process(
+        heartbeat.pid, timeout=opts["kill_timeout"],
+        start_time=heartbeat.start_time,
+    )
     if result.success:
         logger.info("%s stopped", process_key)
         return 0
@@ -69,11 +71,14 @@ def handle_restart(config: dict, process_key: str) -> int:
         logger.error("Unknown process: %s", process_key)
         return 2
 
-    heartbeat = read_heartbeat(Path(proc["heartbeat_path"]))
+    heartbeat = read_process_heartbeat(process_key, proc, read_heartbeat)
     pid = heartbeat.pid if heartbeat else None
+    start_time = heartbeat.start_time if heartbeat else None
 
     opts = get_global_options(config)
-    result = run_recovery(process_key, pid, proc, global_opts=opts)
+    result = run_recovery(
+        process_key, pid, proc, global_opts=opts, start_time=start_time
+    )
     return 0 if result.fully_recovered else 1
 
 
@@ -2,46 +2,15 @@
 # PRD: docs/prd-cli-commands.md
 """Watchdog CLI — process supervisor with subcommands."""
 
-import argparse
 import sys
 
+from src.cli.parser import build_parser
 from src.config.config_loader import load_config, validate_config
 from src.logging.logger import setup_logging, get_logger
 
 logger = get_logger("main")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build the CLI argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="watchdog",
-        description="Process supervisor for Gmail league system",
-    )
-    parser.add_argument(
-        "-c", "--config", default="config.json",
-        help="Path to config.json",
-    )
-    sub = parser.add_subparsers(dest="command")
-
-    sub.add_parser("check", help="Check all processes (cron mode)")
-
-    p_on = sub.add_parser("on", help="Start a process")
-    p_on.add_argument("process", help="Process key from config")
-
-    p_off = sub.add_parser("off", help="Stop a process")
-    p_off.add_argument("process", help="Process key from config")
-
-    p_restart = sub.add_parser("restart", help="Restart a process")
-    p_restart.add_argument("process", help="Process key from config")
-
-    sub.add_parser("stop-all", help="Stop all enabled processes")
-    sub.add_parser("start-all", help="Start all enabled processes")
-
-    sub.add_parser("menu", help="Open interactive TUI menu")
-
-    return parser
-
-
 def main(argv: list[str] | None = None) -> int:
     """Main entry point. Returns 0 on success, 1 on failure, 2 on error."""
     parser = build_parser()
@@ -68,6 +37,11 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     from src.cli.check import handle_check
+    from src.cli.collector import handle_collector
+    from src.cli.daemon import handle_daemon
+    from src.cli.export import handle_export
+    from src.cli.replay import handle_replay
+    from src.cli.stats import handle_stats
     from src.cli.handlers import (
         handle_on, handle_off, handle_restart,
         handle_stop_all, handle_start_all,
@@ -76,6 +50,18 @@ def main(argv: list[str] | None = None) -> int:
     command = args.command or "check"
     dispatch = {
         "check": lambda: handle_check(config),
+        "daemon": lambda: handle_daemon(config, args.interval),
+        "stats": lambda: handle_stats(
+            config, args.days, args.since, args.process
+        ),
+        "replay": lambda: handle_replay(
+            config, args.timeouts, args.thresholds, args.days, args.process
+        ),
+        "export": lambda: handle_export(
+            config, args.table, args.format, args.output, args.gzip,
+            args.mark, args.process,
+        ),
+        "collector": lambda: handle_collector(config, args.listen, args.db),
         "on": lambda: handle_on(config, args.process),
         "off": lambda: handle_off(config, args.process),
         "restart": lambda: handle_restart(config, args.process),
@@ -3,9 +3,9 @@
 """Action handlers for the interactive menu."""
 
 import subprocess
-from pathlib import Path
 
 from src.heartbeat.reader import read_heartbeat
+from src.heartbeat.source import read_process_heartbeat
 from src.recovery.killer import kill_process
 from src.recovery.restarter import restart_process
 from src.recovery.cleaner import run_cleanup
@@ -38,8 +38,7 @@ def start_process(process_key: str, proc: dict) -> tuple[bool, str]:
 
 def kill_process_by_key(process_key: str, proc: dict) -> tuple[bool, str]:
     """Kill a process by its key. Returns (success, message)."""
-    heartbeat_path = Path(proc.get("heartbeat_path", ""))
-    heartbeat = read_heartbeat(heartbeat_path)
+    heartbeat = read_process_heartbeat(process_key, proc, read_heartbeat)
 
     if not heartbeat or not heartbeat.pid:
         return False, f"No running process found for {process_key}"
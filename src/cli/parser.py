@@ -0,0 +1,91 @@
+# Area: CLI Commands
+# PRD: docs/prd-cli-commands.md
+"""Argument parser for the watchdog CLI."""
+
+import argparse
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="watchdog",
+        description="Process supervisor for Gmail league system",
+    )
+    parser.add_argument(
+        "-c", "--config", default="config.json",
+        help="Path to config.json",
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    sub.add_parser("check", help="Check all processes (cron mode)")
+
+    p_daemon = sub.add_parser("daemon", help="Run checks continuously")
+    p_daemon.add_argument(
+        "--interval", type=float, default=None,
+        help="Seconds between check cycles (default: daemon_interval)",
+    )
+
+    p_stats = sub.add_parser("stats", help="Show availability, MTBF and MTTR")
+    p_stats.add_argument(
+        "--days", type=float, default=7.0,
+        help="Window length in days, ending now (default: 7)",
+    )
+    p_stats.add_argument("--since", help="Window start (ISO timestamp)")
+    p_stats.add_argument("--process", help="Only show this process key")
+
+    p_replay = sub.add_parser(
+        "replay", help="Replay history under candidate timeouts/thresholds"
+    )
+    p_replay.add_argument(
+        "--timeouts", type=float, nargs="+", default=[60, 120, 300, 600],
+        help="timeout_seconds candidates",
+    )
+    p_replay.add_argument(
+        "--thresholds", type=int, nargs="+", default=[1, 2, 3, 5],
+        help="consecutive_failures_threshold candidates",
+    )
+    p_replay.add_argument(
+        "--days", type=float, default=30.0,
+        help="History to replay, in days (default: 30)",
+    )
+    p_replay.add_argument("--process", help="Only replay this process key")
+
+    p_export = sub.add_parser("export", help="Stream history or recoveries")
+    p_export.add_argument(
+        "table", nargs="?", default="history",
+        choices=["history", "recoveries", "actions"],
+    )
+    p_export.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    p_export.add_argument("--gzip", action="store_true", help="gzip the output")
+    p_export.add_argument("-o", "--output", default="-", help="File (default: stdout)")
+    p_export.add_argument(
+        "--mark", help="High-water mark file: export newer rows, then update it"
+    )
+    p_export.add_argument("--process", help="Only export this process key")
+
+    p_collector = sub.add_parser(
+        "collector", help="Receive check results from watchdog agents"
+    )
+    p_collector.add_argument(
+        "--listen", default=None,
+        help="tcp://host:port or unix:///path (default: collector_listen)",
+    )
+    p_collector.add_argument(
+        "--db", default=None, help="Central database (default: collector_db_path)"
+    )
+
+    p_on = sub.add_parser("on", help="Start a process")
+    p_on.add_argument("process", help="Process key from config")
+
+    p_off = sub.add_parser("off", help="Stop a process")
+    p_off.add_argument("process", help="Process key from config")
+
+    p_restart = sub.add_parser("restart", help="Restart a process")
+    p_restart.add_argument("process", help="Process key from config")
+
+    sub.add_parser("stop-all", help="Stop all enabled processes")
+    sub.add_parser("start-all", help="Start all enabled processes")
+
+    sub.add_parser("menu", help="Open interactive TUI menu")
+
+    return parser
@@ -0,0 +1,57 @@
+# Area: CLI Commands
+# PRD: docs/prd-cli-commands.md
+"""Replay handler: compare candidate timeouts and thresholds on history."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from src.cli.stats import format_duration
+from src.config.constants import DEFAULT_DB_PATH
+from src.database.store import WatchdogStore
+from src.monitor.replay import ReplayOutcome, load_traces, sweep
+
+HEADER = (
+    f"{'TIMEOUT':>8} {'THRESH':>6} {'RECOVERIES':>10} {'FALSE+':>7} "
+    f"{'MISSED':>7} {'LAT.AVG':>8} {'LAT.MAX':>8}"
+)
+
+
+def format_row(o: ReplayOutcome) -> str:
+    return (
+        f"{o.timeout_seconds:>8g} {o.threshold:>6} "
+        f"{o.recoveries:>10} {o.false_positives:>7} {o.missed:>7} "
+        f"{format_duration(o.mean_latency):>8} "
+        f"{format_duration(o.max_latency):>8}"
+    )
+
+
+def handle_replay(
+    config: dict,
+    timeouts: list[float],
+    thresholds: list[int],
+    days: float = 30.0,
+    process_key: str | None = None,
+) -> int:
+    """Replay the last `days` of history for every parameter pair."""
+    if not timeouts or not thresholds or min(thresholds) < 1:
+        print("replay needs at least one timeout and thresholds >= 1")
+        return 2
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    try:
+        store = WatchdogStore(
+            config.get("db_path", DEFAULT_DB_PATH), read_only=True
+        )
+    except sqlite3.OperationalError as e:
+        print(f"Cannot open history database: {e}")
+        return 2
+    try:
+        traces = load_traces(store.connection, since, process_key)
+    finally:
+        store.close()
+
+    checks = sum(len(t.checked) for t in traces.values())
+    print(f"Replayed {checks} checks of {len(traces)} processes since {since}")
+    print(HEADER)
+    for outcome in sweep(traces, timeouts, thresholds):
+        print(format_row(outcome))
+    return 0
@@ -0,0 +1,68 @@
+# Area: CLI Commands
+# PRD: docs/prd-cli-commands.md
+"""Stats handler: print availability, MTBF and MTTR per process."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.cli.store_ops import open_store
+from src.config.config_loader import get_global_options
+from src.database.stats import ProcessStats, StatsEngine
+
+HEADER = (
+    f"{'PROCESS':<20} {'AVAIL%':>8} {'CHECKS':>8} {'FAILURES':>8} "
+    f"{'MTBF':>8} {'MTTR':>8} {'RECOVERIES':>10} {'RESTARTS':>8}"
+)
+
+
+def format_duration(seconds: float | None) -> str:
+    """Compact duration such as 45s, 12m, 3h05m or 2d04h; '-' if unknown."""
+    if seconds is None:
+        return "-"
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    if seconds < 86400:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    return f"{seconds // 86400}d{seconds % 86400 // 3600:02d}h"
+
+
+def format_row(s: ProcessStats) -> str:
+    avail = "-" if s.availability is None else f"{s.availability:.2f}"
+    return (
+        f"{s.process_key:<20} {avail:>8} {s.checks:>8} {s.failures:>8} "
+        f"{format_duration(s.mtbf_seconds):>8} "
+        f"{format_duration(s.mttr_seconds):>8} "
+        f"{s.recovery_attempts:>10} {s.restarts:>8}"
+    )
+
+
+def handle_stats(
+    config: dict,
+    days: float = 7.0,
+    since: str | None = None,
+    process_key: str | None = None,
+) -> int:
+    """Print reliability stats for the last `days` (or since an ISO time)."""
+    now = datetime.now(timezone.utc)
+    if since is not None:
+        start = datetime.fromisoformat(since)
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+    else:
+        start = now - timedelta(days=days)
+
+    store = open_store(config, get_global_options(config))
+    try:
+        stats = StatsEngine(store.connection).compute(start, now)
+    finally:
+        store.close()
+
+    if process_key is not None:
+        stats = {k: v for k, v in stats.items() if k == process_key}
+    print(f"Window: {start.isoformat()} .. {now.isoformat()}")
+    print(HEADER)
+    for s in stats.values():
+        print(format_row(s))
+    return 0
@@ -0,0 +1,114 @@
+# Area: CLI Commands
+# PRD: docs/prd-cli-commands.md
+"""Store setup and per-cycle bookkeeping shared by check and daemon."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from src.config.constants import DEFAULT_DB_PATH, ProcessHealth
+from src.database.cached_store import CachedWatchdogStore
+from src.database.recovery_log import recent_attempts, record_recovery
+from src.database.retention import RetentionEngine
+from src.database.store import WatchdogStore
+from src.logging.logger import get_logger
+from src.monitor.models import CheckResult
+from src.pipeline.backoff import RecoveryGate, recovery_gate
+from src.pipeline.recovery_pipeline import PipelineResult
+
+logger = get_logger("check")
+
+
+def open_store(
+    config: dict, global_opts: dict, cached: bool = False
+) -> WatchdogStore:
+    """Open the configured store with the configured history mode.
+
+    cached=True (daemon) keeps process_state in memory and writes history
+    and state behind on a thread every state_flush_interval seconds.
+    """
+    db_path = config.get("db_path", DEFAULT_DB_PATH)
+    history = {
+        "history_mode": global_opts["history_mode"],
+        "keyframe_seconds": global_opts["history_keyframe_seconds"],
+        "partitioned": global_opts["history_partitioned"],
+    }
+    if cached:
+        return CachedWatchdogStore(
+            db_path, **history,
+            flush_interval=global_opts["state_flush_interval"],
+            queue_size=global_opts["history_queue_size"],
+        )
+    return WatchdogStore(db_path, **history)
+
+
+def log_recovery(
+    store: WatchdogStore, recovery: PipelineResult, health: str, pid: int | None
+) -> None:
+    """Persist a recovery attempt; a write failure must not stop recovery."""
+    try:
+        record_recovery(store.connection, recovery, health, pid)
+    except sqlite3.Error as e:
+        logger.warning("Could not record recovery of %s: %s", recovery.process_key, e)
+
+
+def recovery_gates(
+    store: WatchdogStore, results: list[CheckResult], global_opts: dict
+) -> dict[str, RecoveryGate]:
+    """Crash-loop gate (see recovery_gate) for each unhealthy result.
+
+    Reads recent attempts from recovery_attempts once, so the state
+    carries over between cron runs. Computed before the cycle is
+    recorded, so history can tell held-back processes from recovered
+    ones. A process without a gate may be recovered.
+    """
+    unhealthy = [
+        r for r in results
+        if r.health not in (ProcessHealth.HEALTHY, ProcessHealth.READ_TIMEOUT)
+    ]
+    if not unhealthy:
+        return {}
+    now = datetime.now(timezone.utc)
+    since = now - timedelta(seconds=global_opts["crash_loop_window"])
+    try:
+        recent = recent_attempts(store.connection, since.isoformat())
+    except sqlite3.Error as e:
+        logger.warning("Could not read recent recoveries, not backing off: %s", e)
+        return {}
+    return {
+        r.process_key: recovery_gate(
+            r.process_key, recent.get(r.process_key, []), now, global_opts
+        )
+        for r in unhealthy
+    }
+
+
+def log_held(result: CheckResult, gate: RecoveryGate, global_opts: dict) -> None:
+    """Explain why a due recovery is not run this cycle."""
+    if gate.circuit_open:
+        logger.error(
+            "%s: %d recoveries in %.0fs, crash loop; recovery suspended until %s",
+            result.display_name, gate.attempts,
+            global_opts["crash_loop_window"], gate.retry_at.isoformat(),
+        )
+    else:
+        logger.warning(
+            "%s: backing off after %d recent recoveries, next attempt after %s",
+            result.display_name, gate.attempts, gate.retry_at.isoformat(),
+        )
+
+
+def apply_retention(store: WatchdogStore, global_opts: dict) -> None:
+    """Roll expired history into aggregates within the cycle's time budget."""
+    max_age = global_opts["history_retention_hours"]
+    if not max_age:
+        return
+    engine = RetentionEngine(
+        store.connection, max_age, global_opts["rollup_hourly_retention_days"]
+    )
+    try:
+        moved = engine.run(global_opts["retention_budget_ms"] / 1000)
+    except sqlite3.Error as e:
+        logger.warning("History retention failed: %s", e)
+        return
+    if moved:
+        logger.info("Rolled %d history rows into aggregates", moved)
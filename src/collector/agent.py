@@ -0,0 +1,140 @@
+# Area: Collector
+# PRD: docs/prd-collector.md
+"""Agent side: batch check results and recoveries, ship them to the collector."""
+
+import socket
+from collections.abc import Collection
+
+from src.collector.protocol import (
+    ACK,
+    NAK,
+    ProtocolError,
+    encode_batch,
+    parse_address,
+    write_frame,
+)
+from src.collector.spool import Spool
+from src.config.constants import DEFAULT_COLLECTOR_FLUSH_MAX_BATCHES
+from src.database.recovery_log import recovery_rows
+from src.database.store import report_rows
+from src.logging.logger import get_logger
+from src.monitor.models import MonitorReport
+from src.pipeline.recovery_pipeline import PipelineResult
+
+logger = get_logger("collector")
+
+DEFAULT_SEND_TIMEOUT = 2.0
+
+
+class CollectorAgent:
+    """Collects one host's cycles and delivers them in order, at least once.
+
+    add_report/add_recovery build the same rows the local store writes.
+    flush() compresses them into one batch, appends it to the spool, and
+    sends up to max_batches spooled batches, oldest first, removing each
+    once the collector acknowledges it, so a backlog after an outage
+    drains over several cycles instead of stalling one. While the
+    collector is unreachable batches stay in the bounded spool and go out
+    with a later flush. A batch the collector rejects (NAK) is moved to
+    the spool's `rejected` table so it cannot block the ones behind it.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        spool: Spool,
+        host: str | None = None,
+        timeout: float = DEFAULT_SEND_TIMEOUT,
+        max_batches: int = DEFAULT_COLLECTOR_FLUSH_MAX_BATCHES,
+    ):
+        self._family, self._address = parse_address(address)
+        self._spool = spool
+        self._timeout = timeout
+        self._max_batches = max_batches
+        self.host = host or socket.gethostname()
+        self._pending = self._empty()
+
+    def _empty(self) -> dict:
+        return {
+            "host": self.host, "spool": self._spool.spool_id,
+            "checks": [], "states": [], "recoveries": [],
+        }
+
+    def add_report(
+        self,
+        report: MonitorReport,
+        threshold: int,
+        failures: dict[str, int],
+        held: Collection[str] = (),
+    ) -> None:
+        """Queue a cycle given the failure counts the store returned for it."""
+        previous = {key: count - 1 for key, count in failures.items() if count}
+        _, states, checks = report_rows(
+            report, threshold, previous, report.timestamp.isoformat(), held
+        )
+        self._pending["states"].extend(states)
+        self._pending["checks"].extend(checks)
+
+    def add_recovery(
+        self, result: PipelineResult, trigger_health: str | None, pid: int | None
+    ) -> None:
+        self._pending["recoveries"].append(recovery_rows(result, trigger_health, pid))
+
+    def flush(self) -> int:
+        """Spool pending rows and send up to max_batches. Returns batches delivered."""
+        if any(self._pending[k] for k in ("checks", "states", "recoveries")):
+            self._spool.push(encode_batch(self._pending))
+            self._pending = self._empty()
+        sent = 0
+        try:
+            batches = self._spool.peek(self._max_batches)
+            if not batches:
+                return 0
+            with self._connect() as sock:
+                for seq, payload in batches:
+                    write_frame(sock, seq, payload)
+                    reply = sock.recv(1)
+                    if reply == NAK:
+                        logger.error("Collector rejected batch %d, moved to rejected", seq)
+                        self._spool.reject(seq)
+                        continue
+                    if reply != ACK:
+                        raise ProtocolError("Collector did not acknowledge batch")
+                    self._spool.ack(seq)
+                    sent += 1
+        except (OSError, ProtocolError) as e:
+            logger.warning(
+                "Collector unreachable (%s), %d batches spooled", e, len(self._spool)
+            )
+        return sent
+
+    def _connect(self) -> socket.socket:
+        if self._family == socket.AF_UNIX:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self._timeout)
+            try:
+                sock.connect(self._address)
+            except OSError:
+                sock.close()
+                raise
+            return sock
+        return socket.create_connection(self._address, timeout=self._timeout)
+
+    def close(self) -> None:
+        """Try a last delivery, then close the spool."""
+        self.flush()
+        self._spool.close()
+
+
+def agent_from_options(global_opts: dict) -> CollectorAgent | None:
+    """Agent for the configured collector_address, None when unset."""
+    address = global_opts["collector_address"]
+    if not address:
+        return None
+    spool = Spool(
+        global_opts["collector_spool_path"], global_opts["collector_spool_max_batches"]
+    )
+    return CollectorAgent(
+        address, spool, host=global_opts["collector_host"],
+        max_batches=global_opts["collector_flush_max_batches"],
+    )
@@ -0,0 +1,77 @@
+# Area: Collector
+# PRD: docs/prd-collector.md
+"""Wire format between watchdog agents and the collector.
+
+A frame is a big-endian header (payload length, 8-byte batch seq)
+followed by the payload: a zlib-compressed JSON batch. The collector
+answers each frame with ACK once the batch is committed (or was already
+ingested), or with NAK if the batch can never be ingested (undecodable or
+malformed); the connection stays open either way.
+"""
+
+import json
+import socket
+import struct
+import zlib
+
+HEADER = struct.Struct(">IQ")
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+MAX_BATCH_BYTES = 64 * 1024 * 1024  # decompressed
+ACK = b"\x01"
+NAK = b"\x02"
+COMPRESS_LEVEL = 6
+
+
+class ProtocolError(Exception):
+    """A peer sent something that is not a valid frame."""
+
+
+def encode_batch(batch: dict) -> bytes:
+    """Compress a batch into a frame payload."""
+    data = json.dumps(batch, separators=(",", ":")).encode()
+    return zlib.compress(data, COMPRESS_LEVEL)
+
+
+def decode_batch(payload: bytes) -> dict:
+    """Inverse of encode_batch; refuses batches over MAX_BATCH_BYTES unpacked."""
+    inflater = zlib.decompressobj()
+    try:
+        data = inflater.decompress(payload, MAX_BATCH_BYTES)
+        if inflater.unconsumed_tail:
+            raise ProtocolError(f"Batch exceeds {MAX_BATCH_BYTES} bytes decompressed")
+        if not inflater.eof:
+            raise ProtocolError("Truncated batch payload")
+        return json.loads(data)
+    except (zlib.error, ValueError) as e:
+        raise ProtocolError(f"Bad batch payload: {e}") from e
+
+
+def write_frame(sock: socket.socket, seq: int, payload: bytes) -> None:
+    sock.sendall(HEADER.pack(len(payload), seq) + payload)
+
+
+def read_frame(rfile) -> tuple[int, bytes] | None:
+    """Read one (seq, payload) frame from a binary file; None at a clean EOF."""
+    header = rfile.read(HEADER.size)
+    if not header:
+        return None
+    if len(header) < HEADER.size:
+        raise ProtocolError("Truncated frame header")
+    length, seq = HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ProtocolError(f"Frame of {length} bytes exceeds limit")
+    payload = rfile.read(length)
+    if len(payload) < length:
+        raise ProtocolError("Truncated frame")
+    return seq, payload
+
+
+def parse_address(address: str) -> tuple[int, str | tuple[str, int]]:
+    """'tcp://host:port' or 'unix:///path' -> (socket family, address)."""
+    if address.startswith("unix://"):
+        return socket.AF_UNIX, address[len("unix://"):]
+    if address.startswith("tcp://"):
+        host, _, port = address[len("tcp://"):].rpartition(":")
+        if host and port.isdigit():
+            return socket.AF_INET, (host.strip("[]"), int(port))
+    raise ValueError(f"Collector address must be tcp://host:port or unix:///path: {address}")
@@ -0,0 +1,125 @@
+# Area: Collector
+# PRD: docs/prd-collector.md
+"""Collector service: receive agent batches and bulk-insert them."""
+
+import os
+import socket
+import socketserver
+import sqlite3
+from datetime import datetime, timezone
+from itertools import groupby
+
+from src.collector.protocol import ACK, NAK, ProtocolError, decode_batch, parse_address, read_frame
+from src.database.connection import open_connection
+from src.database.history import HistoryWriter
+from src.database.recovery_log import insert_recovery
+from src.database.schema import UPSERT_STATE, apply_schema
+from src.logging.logger import get_logger
+
+logger = get_logger("collector")
+
+HANDLER_TIMEOUT_SECONDS = 30.0
+
+_BATCHES_SCHEMA = """CREATE TABLE IF NOT EXISTS collector_batches (
+    host TEXT NOT NULL,
+    spool_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    received_at TEXT NOT NULL,
+    PRIMARY KEY (host, spool_id, seq)
+)"""
+
+
+class CollectorStore:
+    """Central store fed by agents; process keys become 'host/process_key'.
+
+    Uses the WatchdogStore schema with day-partitioned history, so stats,
+    replay, export and the TUI work on it unchanged. Each batch is one
+    transaction, recorded in collector_batches so a batch resent after a
+    lost ACK is acknowledged but not inserted twice.
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = open_connection(db_path)
+        apply_schema(self._conn)
+        self._conn.execute(_BATCHES_SCHEMA)
+        self._history = HistoryWriter(self._conn, False, 0, partitioned=True)
+
+    def ingest(self, seq: int, batch: dict) -> bool:
+        """Insert a batch unless already seen. Returns True if inserted."""
+        host = batch["host"]
+        received = datetime.now(timezone.utc).isoformat()
+        with self._conn:
+            if not self._conn.execute(
+                "INSERT OR IGNORE INTO collector_batches VALUES (?, ?, ?, ?)",
+                (host, batch["spool"], seq, received),
+            ).rowcount:
+                return False
+            self._conn.executemany(UPSERT_STATE, [
+                (f"{host}/{key}", *rest) for key, *rest in batch["states"]
+            ])
+            checks = [(f"{host}/{key}", *rest) for key, *rest in batch["checks"]]
+            for _, rows in groupby(checks, key=lambda row: row[1][:10]):
+                rows = list(rows)
+                self._history.write(rows[0][1], rows, {})
+            for (key, *attempt), actions in batch["recoveries"]:
+                insert_recovery(self._conn, (f"{host}/{key}", *attempt), actions)
+        return True
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    timeout = HANDLER_TIMEOUT_SECONDS
+
+    def handle(self) -> None:
+        store = CollectorStore(self.server.db_path)
+        try:
+            while (frame := read_frame(self.rfile)) is not None:
+                self.wfile.write(self._ingest(store, *frame))
+        except ProtocolError as e:
+            logger.warning("Bad frame from %s: %s", self.client_address, e)
+        except sqlite3.Error as e:  # transient: no reply, the agent resends later
+            logger.warning("Could not store batch from %s: %s", self.client_address, e)
+        except OSError as e:
+            logger.warning("Agent connection failed: %s", e)
+        finally:
+            store.close()
+
+    def _ingest(self, store: CollectorStore, seq: int, payload: bytes) -> bytes:
+        """ACK a stored (or duplicate) batch, NAK one that can never be stored."""
+        try:
+            batch = decode_batch(payload)
+            if not store.ingest(seq, batch):
+                logger.info("Duplicate batch %d from %s", seq, batch["host"])
+            return ACK
+        except (ProtocolError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Rejected batch %d from %s: %s", seq, self.client_address, e)
+            return NAK
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(address: str, db_path: str) -> socketserver.BaseServer:
+    """Bind a collector on tcp://host:port or unix:///path (not yet serving).
+
+    Each agent connection is handled on its own thread with its own
+    SQLite connection; WAL and the busy timeout serialize the writes.
+    """
+    CollectorStore(db_path).close()  # create the schema once, up front
+    family, bind = parse_address(address)
+    if family == socket.AF_UNIX:
+        if os.path.exists(bind):
+            os.unlink(bind)
+        server = _UnixServer(bind, _Handler)
+    else:
+        server = _TCPServer(bind, _Handler)
+    server.db_path = db_path
+    return server
@@ -0,0 +1,100 @@
+# Area: Collector
+# PRD: docs/prd-collector.md
+"""Bounded on-disk queue of encoded batches waiting for the collector."""
+
+import uuid
+from datetime import datetime, timezone
+
+from src.config.constants import DEFAULT_COLLECTOR_SPOOL_MAX_BATCHES
+from src.database.connection import open_connection
+from src.logging.logger import get_logger
+
+logger = get_logger("collector")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS spool (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rejected (
+    seq INTEGER PRIMARY KEY,
+    payload BLOB NOT NULL,
+    rejected_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS spool_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    spool_id TEXT NOT NULL
+);
+"""
+
+
+class Spool:
+    """SQLite-backed FIFO of frame payloads, at most max_batches long.
+
+    seq never repeats within a spool (AUTOINCREMENT), and spool_id is
+    random per spool file, so (host, spool_id, seq) identifies a batch
+    for the collector's duplicate check. When full, the oldest batches
+    are dropped.
+    """
+
+    def __init__(self, path: str, max_batches: int = DEFAULT_COLLECTOR_SPOOL_MAX_BATCHES):
+        self._conn = open_connection(path)
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO spool_meta VALUES (0, ?)", (uuid.uuid4().hex,)
+            )
+        self.spool_id = self._conn.execute(
+            "SELECT spool_id FROM spool_meta"
+        ).fetchone()[0]
+        self._max_batches = max_batches
+        self.dropped = 0
+
+    def push(self, payload: bytes) -> int:
+        """Append a payload, trimming the oldest past max_batches. Returns seq."""
+        with self._conn:
+            seq = self._conn.execute(
+                "INSERT INTO spool (payload) VALUES (?)", (payload,)
+            ).lastrowid
+            dropped = self._conn.execute(
+                "DELETE FROM spool WHERE seq <= ?", (seq - self._max_batches,)
+            ).rowcount
+        if dropped:
+            self.dropped += dropped
+            logger.warning("Collector spool full, dropped %d oldest batches", dropped)
+        return seq
+
+    def peek(self, limit: int) -> list[tuple[int, bytes]]:
+        """Oldest `limit` (seq, payload) pairs."""
+        return [tuple(r) for r in self._conn.execute(
+            "SELECT seq, payload FROM spool ORDER BY seq LIMIT ?", (limit,)
+        )]
+
+    def ack(self, seq: int) -> None:
+        """Remove every batch up to and including seq."""
+        with self._conn:
+            self._conn.execute("DELETE FROM spool WHERE seq <= ?", (seq,))
+
+    def reject(self, seq: int) -> None:
+        """Move a batch the collector refused into the bounded `rejected` table.
+
+        It no longer blocks the batches behind it but is kept for
+        inspection; only the newest max_batches rejects are retained.
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rejected SELECT seq, payload, ? FROM spool WHERE seq = ?",
+                (datetime.now(timezone.utc).isoformat(), seq),
+            )
+            self._conn.execute("DELETE FROM spool WHERE seq = ?", (seq,))
+            self._conn.execute(
+                "DELETE FROM rejected WHERE seq <= ?", (seq - self._max_batches,)
+            )
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
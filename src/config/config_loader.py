@@ -7,15 +7,13 @@ from pathlib import Path
 
 from src.config.constants import (
     BUILTIN_ACTIONS,
-    DEFAULT_CLEANUP_ARGS,
-    DEFAULT_CLEANUP_TIMEOUT,
-    DEFAULT_KILL_TIMEOUT,
-    DEFAULT_LOCK_PATH,
-    DEFAULT_LOG_DIR,
     DEFAULT_RECOVERY_ACTIONS,
-    DEFAULT_VERIFY_DELAY,
+    GLOBAL_OPTION_DEFAULTS,
+    HEARTBEAT_TRANSPORTS,
+    HISTORY_MODES,
     REQUIRED_PROCESS_FIELDS,
 )
+from src.pipeline.dag import action_graph, find_cycle
 
 
 def load_config(config_path: str) -> dict:
@@ -38,12 +36,8 @@ def save_config(config: dict, config_path: str) -> None:
 def get_global_options(config: dict) -> dict:
     """Extract global options with defaults for lock_path, log_dir, timeouts."""
     return {
-        "lock_path": config.get("lock_path", DEFAULT_LOCK_PATH),
-        "log_dir": config.get("log_dir", DEFAULT_LOG_DIR),
-        "kill_timeout": config.get("kill_timeout", DEFAULT_KILL_TIMEOUT),
-        "cleanup_timeout": config.get("cleanup_timeout", DEFAULT_CLEANUP_TIMEOUT),
-        "verify_delay": config.get("verify_delay", DEFAULT_VERIFY_DELAY),
-        "cleanup_args": config.get("cleanup_args", DEFAULT_CLEANUP_ARGS),
+        key: config.get(key, default)
+        for key, default in GLOBAL_OPTION_DEFAULTS.items()
     }
 
 
@@ -105,6 +99,15 @@ def validate_config(config: dict) -> list[str]:
         errors.append("Missing required field: processes")
         return errors
 
+    history_mode = config.get("history_mode", "full")
+    if history_mode not in HISTORY_MODES:
+        errors.append(f"Unknown history_mode '{history_mode}'")
+
+    for option in ("collector_address", "collector_listen"):
+        address = config.get(option)
+        if address and not address.startswith(("tcp://", "unix://")):
+            errors.append(f"{option} must start with tcp:// or unix://")
+
     for key, raw_proc in config["processes"].items():
         proc = normalize_process_config(raw_proc)
 
@@ -114,6 +117,12 @@ def validate_config(config: dict) -> list[str]:
                     f"Process '{key}' missing required field: {field}"
                 )
 
+        transport = proc.get("heartbeat_transport", "file")
+        if transport not in HEARTBEAT_TRANSPORTS:
+            errors.append(
+                f"Process '{key}' has unknown heartbeat_transport '{transport}'"
+            )
+
         commands = proc.get("commands", {})
         if "start" not in commands:
             errors.append(
@@ -127,4 +136,37 @@ def validate_config(config: dict) -> list[str]:
                     f"has no matching command"
                 )
 
+        errors.extend(_dependency_errors(key, proc))
+
+    return errors
+
+
+def _dependency_errors(key: str, proc: dict) -> list[str]:
+    """Check action_dependencies names known actions, keeps kill first and
+    start last, and has no cycle."""
+    dependencies = proc.get("action_dependencies")
+    if dependencies is None:
+        return []
+    actions = proc.get("recovery_actions", DEFAULT_RECOVERY_ACTIONS)
+    errors = [
+        f"Process '{key}' action_dependencies names unknown action '{name}'"
+        for action, deps in dependencies.items()
+        for name in [action, *deps]
+        if name not in actions
+    ]
+    if dependencies.get("kill"):
+        errors.append(f"Process '{key}' action_dependencies: 'kill' always runs first")
+    errors.extend(
+        f"Process '{key}' action_dependencies: '{action}' cannot wait for "
+        f"'start', which always runs last"
+        for action, deps in dependencies.items()
+        if action != "start" and "start" in deps
+    )
+    if errors:
+        return errors
+    cycle = find_cycle(action_graph(actions, dependencies))
+    if cycle:
+        errors.append(
+            f"Process '{key}' action_dependencies has a cycle: {' -> '.join(cycle)}"
+        )
     return errors
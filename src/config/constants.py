@@ -11,6 +11,8 @@ class ProcessHealth(Enum):
     NO_HEARTBEAT = "no_heartbeat"
     STALE_PID = "stale_pid"
     ERROR_STATUS = "error_status"
+    READ_TIMEOUT = "read_timeout"
+    DEGRADED = "degraded"
 
 
 DEFAULT_TIMEOUT_SECONDS = 300
@@ -22,7 +24,69 @@ DEFAULT_LOG_DIR = "logs"
 DEFAULT_KILL_TIMEOUT = 10.0
 DEFAULT_CLEANUP_TIMEOUT = 60.0
 DEFAULT_VERIFY_DELAY = 2.0
+DEFAULT_READY_TIMEOUT = 30.0
+DEFAULT_CRASH_BACKOFF_BASE = 60.0
+DEFAULT_CRASH_BACKOFF_MAX = 3600.0
+DEFAULT_CRASH_BACKOFF_JITTER = 0.2
+DEFAULT_CRASH_LOOP_WINDOW = 3600.0
+DEFAULT_CRASH_LOOP_MAX_ATTEMPTS = 5
 DEFAULT_CLEANUP_ARGS = ["--force"]
+DEFAULT_CHECK_WORKERS = 8
+DEFAULT_RECOVERY_CONCURRENCY = 4
+DEFAULT_READ_DEADLINE = 5.0
+DEFAULT_DAEMON_INTERVAL = 15.0
+DEFAULT_HEARTBEAT_WATCH = True
+DEFAULT_HEARTBEAT_CACHE_SIZE = 4096
+DEFAULT_HISTORY_RETENTION_HOURS = 168
+DEFAULT_ROLLUP_HOURLY_RETENTION_DAYS = 90
+DEFAULT_RETENTION_BUDGET_MS = 50
+DEFAULT_HISTORY_MODE = "full"
+DEFAULT_HISTORY_KEYFRAME_SECONDS = 3600.0
+DEFAULT_HISTORY_PARTITIONED = False
+DEFAULT_STATE_FLUSH_INTERVAL = 5.0
+DEFAULT_HISTORY_QUEUE_SIZE = 10000
+DEFAULT_COLLECTOR_SPOOL_PATH = "watchdog-spool.db"
+DEFAULT_COLLECTOR_SPOOL_MAX_BATCHES = 10000
+DEFAULT_COLLECTOR_FLUSH_MAX_BATCHES = 100
+DEFAULT_COLLECTOR_LISTEN = "tcp://127.0.0.1:9750"
+DEFAULT_COLLECTOR_DB_PATH = "collector.db"
+
+# Global options returned by get_global_options, with their defaults
+GLOBAL_OPTION_DEFAULTS = {
+    "lock_path": DEFAULT_LOCK_PATH,
+    "log_dir": DEFAULT_LOG_DIR,
+    "kill_timeout": DEFAULT_KILL_TIMEOUT,
+    "cleanup_timeout": DEFAULT_CLEANUP_TIMEOUT,
+    "verify_delay": DEFAULT_VERIFY_DELAY,
+    "ready_timeout": DEFAULT_READY_TIMEOUT,
+    "crash_backoff_base": DEFAULT_CRASH_BACKOFF_BASE,
+    "crash_backoff_max": DEFAULT_CRASH_BACKOFF_MAX,
+    "crash_backoff_jitter": DEFAULT_CRASH_BACKOFF_JITTER,
+    "crash_loop_window": DEFAULT_CRASH_LOOP_WINDOW,
+    "crash_loop_max_attempts": DEFAULT_CRASH_LOOP_MAX_ATTEMPTS,
+    "cleanup_args": DEFAULT_CLEANUP_ARGS,
+    "check_workers": DEFAULT_CHECK_WORKERS,
+    "recovery_concurrency": DEFAULT_RECOVERY_CONCURRENCY,
+    "read_deadline": DEFAULT_READ_DEADLINE,
+    "daemon_interval": DEFAULT_DAEMON_INTERVAL,
+    "heartbeat_watch": DEFAULT_HEARTBEAT_WATCH,
+    "heartbeat_cache_size": DEFAULT_HEARTBEAT_CACHE_SIZE,
+    "history_retention_hours": DEFAULT_HISTORY_RETENTION_HOURS,
+    "rollup_hourly_retention_days": DEFAULT_ROLLUP_HOURLY_RETENTION_DAYS,
+    "retention_budget_ms": DEFAULT_RETENTION_BUDGET_MS,
+    "history_mode": DEFAULT_HISTORY_MODE,
+    "history_keyframe_seconds": DEFAULT_HISTORY_KEYFRAME_SECONDS,
+    "history_partitioned": DEFAULT_HISTORY_PARTITIONED,
+    "state_flush_interval": DEFAULT_STATE_FLUSH_INTERVAL,
+    "history_queue_size": DEFAULT_HISTORY_QUEUE_SIZE,
+    "collector_address": None,
+    "collector_host": None,
+    "collector_spool_path": DEFAULT_COLLECTOR_SPOOL_PATH,
+    "collector_spool_max_batches": DEFAULT_COLLECTOR_SPOOL_MAX_BATCHES,
+    "collector_flush_max_batches": DEFAULT_COLLECTOR_FLUSH_MAX_BATCHES,
+    "collector_listen": DEFAULT_COLLECTOR_LISTEN,
+    "collector_db_path": DEFAULT_COLLECTOR_DB_PATH,
+}
 
 REQUIRED_PROCESS_FIELDS = [
     "display_name",
@@ -31,5 +95,10 @@ REQUIRED_PROCESS_FIELDS = [
     "enabled",
 ]
 
+HEARTBEAT_TRANSPORTS = {"file", "shm"}
+
+# "full" writes a history row per check; "changes" only on health/PID/action change
+HISTORY_MODES = {"full", "changes"}
+
 BUILTIN_ACTIONS = {"kill"}
 DEFAULT_RECOVERY_ACTIONS = ["kill", "clear_db", "start"]
@@ -0,0 +1,138 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""WatchdogStore variant that keeps process_state in memory (daemon mode)."""
+
+import threading
+from collections.abc import Collection
+from datetime import datetime, timezone
+
+from src.config.constants import (
+    DEFAULT_HISTORY_KEYFRAME_SECONDS,
+    DEFAULT_HISTORY_MODE,
+    DEFAULT_HISTORY_QUEUE_SIZE,
+    DEFAULT_STATE_FLUSH_INTERVAL,
+)
+from src.database.store import WatchdogStore, report_rows
+from src.database.write_behind import StoreWriter
+from src.monitor.models import MonitorReport
+
+_SELECT_STATE = """SELECT process_key, consecutive_failures, last_check_at,
+   last_health, last_pid, last_heartbeat_ts, last_iteration FROM process_state"""
+
+
+class CachedWatchdogStore(WatchdogStore):
+    """process_state lives in memory; SQLite is written behind by a thread.
+
+    record_check/record_report update the in-memory state and queue their
+    history rows, so a cycle does no database I/O. A StoreWriter drains the
+    queue and upserts changed state every flush_interval seconds; flush()
+    waits for both and close() flushes first. A full queue drops history
+    rows (counted in `dropped`), never state.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        history_mode: str = DEFAULT_HISTORY_MODE,
+        keyframe_seconds: float = DEFAULT_HISTORY_KEYFRAME_SECONDS,
+        flush_interval: float = DEFAULT_STATE_FLUSH_INTERVAL,
+        queue_size: int = DEFAULT_HISTORY_QUEUE_SIZE,
+        partitioned: bool = False,
+    ) -> None:
+        super().__init__(
+            db_path, history_mode=history_mode, keyframe_seconds=keyframe_seconds,
+            partitioned=partitioned,
+        )
+        self._state = {r[0]: tuple(r) for r in self._conn.execute(_SELECT_STATE)}
+        self._dirty: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._writer = StoreWriter(
+            db_path, history_mode, keyframe_seconds, flush_interval, queue_size,
+            self._take_dirty, self._restore_dirty, partitioned,
+        )
+        self._writer.start()
+
+    @property
+    def dropped(self) -> int:
+        """History rows dropped because the write queue was full."""
+        return self._writer.dropped
+
+    def record_check(
+        self,
+        process_key: str,
+        health: str,
+        pid: int | None,
+        heartbeat_ts: str | None,
+        iteration: int | None,
+        action: str | None = None,
+        elapsed_seconds: float | None = None,
+    ) -> int:
+        """Record a check result in memory. Returns consecutive failures."""
+        now = datetime.now(timezone.utc).isoformat()
+        failures = 0
+        if health != "healthy":
+            failures = self.get_consecutive_failures(process_key) + 1
+        self._update(
+            [(process_key, failures, now, health, pid, heartbeat_ts, iteration)]
+        )
+        self._writer.submit(now, [
+            (process_key, now, health, pid, heartbeat_ts, iteration, action,
+             elapsed_seconds),
+        ])
+        return failures
+
+    def record_report(
+        self, report: MonitorReport, threshold: int, held: Collection[str] = ()
+    ) -> dict[str, int]:
+        """Record a check cycle in memory and queue its history rows."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            current = {key: row[1] for key, row in self._state.items()}
+        failures, state_rows, history_rows = report_rows(
+            report, threshold, current, now, held
+        )
+        self._update(state_rows)
+        self._writer.submit(now, history_rows)
+        return failures
+
+    def get_consecutive_failures(self, process_key: str) -> int:
+        """Return the in-memory consecutive failure count."""
+        with self._lock:
+            row = self._state.get(process_key)
+        return row[1] if row else 0
+
+    def reset_failures(self, process_key: str) -> None:
+        """Reset consecutive failures in memory (written with the next flush)."""
+        with self._lock:
+            row = self._state.get(process_key)
+            if row is not None:
+                row = (row[0], 0, *row[2:])
+                self._state[process_key] = self._dirty[process_key] = row
+
+    def get_history(self, process_key: str, expand: bool = False) -> list[dict]:
+        """Return check history after writing out everything queued."""
+        self.flush()
+        return super().get_history(process_key, expand)
+
+    def flush(self) -> None:
+        """Block until queued history and changed state are in SQLite."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Flush, stop the writer thread and close the connection."""
+        self._writer.stop()
+        super().close()
+
+    def _update(self, state_rows: list[tuple]) -> None:
+        with self._lock:
+            for row in state_rows:
+                self._state[row[0]] = self._dirty[row[0]] = row
+
+    def _take_dirty(self) -> dict[str, tuple]:
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+        return dirty
+
+    def _restore_dirty(self, dirty: dict[str, tuple]) -> None:
+        with self._lock:
+            self._dirty = {**dirty, **self._dirty}
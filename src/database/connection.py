@@ -0,0 +1,41 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""SQLite connection setup shared by the store and read-only consumers."""
+
+import sqlite3
+from pathlib import Path
+
+BUSY_TIMEOUT_SECONDS = 5.0
+STATEMENT_CACHE_SIZE = 256
+
+
+def open_connection(
+    db_path: str,
+    read_only: bool = False,
+    journal_mode: str = "wal",
+    busy_timeout: float = BUSY_TIMEOUT_SECONDS,
+) -> sqlite3.Connection:
+    """Open a connection configured for concurrent cron/daemon/TUI access.
+
+    Writers switch the database to WAL with synchronous=NORMAL, so readers
+    never block the writer and vice versa, and a commit is not an fsync of
+    the main file. Readers open with mode=ro and cannot take write locks.
+    Both wait up to busy_timeout for a lock instead of failing, and keep a
+    larger statement cache so the fixed SQL used per cycle stays prepared.
+    """
+    if read_only:
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(
+            uri, uri=True, timeout=busy_timeout,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+    else:
+        conn = sqlite3.connect(
+            db_path, timeout=busy_timeout,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={int(busy_timeout * 1000)}")
+    conn.row_factory = sqlite3.Row
+    return conn
@@ -0,0 +1,64 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""Chunked, key-ordered reads of history and recovery tables for export."""
+
+import sqlite3
+from collections.abc import Iterator
+
+from src.database.partitions import history_tables
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Export name -> key column the high-water mark is kept on
+EXPORT_KEYS = {
+    "history": "id",
+    "recoveries": "id",
+    "actions": "attempt_id",
+}
+
+
+def _sources(
+    conn: sqlite3.Connection, name: str, after: int, process_key: str | None
+) -> list[tuple[str, list]]:
+    """(SQL, params) for each table to read, in key order."""
+    where = "process_key = ?" if process_key is not None else "1"
+    extra = [process_key] if process_key is not None else []
+    if name == "history":
+        return [
+            (f"SELECT * FROM {table} WHERE id > ? AND {where} ORDER BY id", extra)
+            for table in history_tables(conn, after_id=after)
+        ]
+    if name == "recoveries":
+        return [(
+            f"SELECT * FROM recovery_attempts WHERE id > ? AND {where} ORDER BY id",
+            extra,
+        )]
+    if name == "actions":
+        return [(
+            "SELECT * FROM recovery_actions WHERE attempt_id > ? AND attempt_id"
+            f" IN (SELECT id FROM recovery_attempts WHERE {where})"
+            " ORDER BY attempt_id, seq",
+            extra,
+        )]
+    raise ValueError(f"Unknown export table: {name}")
+
+
+def iter_export(
+    conn: sqlite3.Connection,
+    name: str,
+    after: int = 0,
+    process_key: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict]:
+    """Yield rows of an export table whose key is above `after`, in key order.
+
+    Each table is read through one cursor, chunk_size rows per fetch, so
+    memory stays flat however large the table is. History ids increase
+    across day partitions, so a mark taken from the last row exported
+    resumes after it on the next run.
+    """
+    for sql, params in _sources(conn, name, after, process_key):
+        cursor = conn.execute(sql, [after, *params])
+        while rows := cursor.fetchmany(chunk_size):
+            for row in rows:
+                yield dict(row)
@@ -0,0 +1,146 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""Helpers for reading check_history, including change-only rows."""
+
+import sqlite3
+from datetime import datetime
+
+from src.database.partitions import (
+    BASE_TABLE,
+    ensure_partition,
+    list_partitions,
+    partition_name,
+    table_for_id,
+)
+from src.database.schema import (
+    EXTEND_HISTORY,
+    INSERT_HISTORY,
+    LINK_HISTORY,
+    SELECT_LAST,
+    SELECT_STATE,
+)
+
+
+def load_last_rows(
+    conn: sqlite3.Connection,
+    process_key: str | None = None,
+    table: str = BASE_TABLE,
+    with_rows: bool = True,
+) -> dict[str, sqlite3.Row]:
+    """Failure count and last written history row per process.
+
+    SELECT_LAST joins `table` (the partition being written, if any); a
+    last row in another table is looked up in its own table and merged
+    in. with_rows=False reads process_state alone, for callers that
+    never look at the last row (full history mode).
+    """
+    sql = SELECT_LAST.replace(BASE_TABLE, table) if with_rows else SELECT_STATE
+    if process_key is None:
+        rows = conn.execute(sql).fetchall()
+    else:
+        rows = conn.execute(sql + " WHERE s.process_key = ?", (process_key,)).fetchall()
+    last = {r["process_key"]: r for r in rows}
+    if not with_rows:
+        return last
+    for r in rows:
+        link = r["last_history_id"]
+        if r["id"] is None and link is not None and table_for_id(link) != table:
+            h = conn.execute(
+                "SELECT id, checked_at, health, pid, action_taken"
+                f" FROM {table_for_id(link)} WHERE id = ?", (link,),
+            ).fetchone()
+            if h is not None:
+                last[r["process_key"]] = {**dict(r), **dict(h)}
+    return last
+
+
+class HistoryWriter:
+    """Writes check_history rows, optionally suppressing unchanged checks.
+
+    With changes_only, a check whose health, PID and action match the
+    process's last row extends that row (repeats, last_checked_at) instead
+    of inserting, until the row is keyframe_seconds old. Callers own the
+    transaction and must upsert process_state before write(). With
+    partitioned, rows go to the day partition of their check time.
+    """
+
+    def __init__(
+        self, conn: sqlite3.Connection, changes_only: bool,
+        keyframe_seconds: float, partitioned: bool = False,
+    ):
+        self._conn = conn
+        self._changes_only = changes_only
+        self._keyframe_seconds = keyframe_seconds
+        self._partitioned = partitioned
+        self._insert = (None, INSERT_HISTORY)  # (partition day, statement)
+
+    def write(
+        self, now: str, rows: list[tuple], last: dict[str, sqlite3.Row]
+    ) -> None:
+        """Insert INSERT_HISTORY rows, or extend each process's last row."""
+        extended: dict[str, list] = {}
+        links = []
+        insert = self._insert_statement(now[:10])
+        for row in rows:
+            prev = last.get(row[0])
+            if self._is_repeat(prev, row, now):
+                extended.setdefault(table_for_id(prev["id"]), []).append((now, prev["id"]))
+            else:
+                cursor = self._conn.execute(insert, row)
+                links.append((cursor.lastrowid, row[0]))
+        for table, params in extended.items():
+            self._conn.executemany(EXTEND_HISTORY.replace(BASE_TABLE, table, 1), params)
+        self._conn.executemany(LINK_HISTORY, links)
+
+    def last_rows(self, process_key: str | None = None) -> dict[str, sqlite3.Row]:
+        """load_last_rows for this writer's mode, in one SELECT per cycle.
+
+        Full mode never reads the last row, so only process_state is read.
+        Partitioned, the join goes to the partition currently written.
+        """
+        if not self._changes_only:
+            return load_last_rows(self._conn, process_key, with_rows=False)
+        table = BASE_TABLE
+        if self._partitioned:
+            day = self._insert[0] or max(list_partitions(self._conn), default=None)
+            table = partition_name(day) if day else BASE_TABLE
+        return load_last_rows(self._conn, process_key, table)
+
+    def _insert_statement(self, day: str) -> str:
+        if self._partitioned and self._insert[0] != day:
+            self._insert = (day, ensure_partition(self._conn, day))
+        return self._insert[1]
+
+    def _is_repeat(self, prev: sqlite3.Row | None, row: tuple, now: str) -> bool:
+        if not self._changes_only or prev is None or prev["id"] is None:
+            return False
+        _, _, health, pid, _, _, action, _ = row
+        if (prev["health"], prev["pid"], prev["action_taken"]) != (health, pid, action):
+            return False
+        age = datetime.fromisoformat(now) - datetime.fromisoformat(prev["checked_at"])
+        return age.total_seconds() < self._keyframe_seconds
+
+
+def expand_history(rows: list[dict]) -> list[dict]:
+    """Expand rows with repeats into one row per check.
+
+    A row written in change-only mode covers 1 + repeats checks from
+    checked_at to last_checked_at. Checks run on a fixed interval, so the
+    suppressed check times are interpolated evenly between the two.
+    """
+    expanded = []
+    for row in rows:
+        repeats = row.get("repeats") or 0
+        if not repeats or not row.get("last_checked_at"):
+            expanded.append(row)
+            continue
+        start = datetime.fromisoformat(row["checked_at"])
+        step = (datetime.fromisoformat(row["last_checked_at"]) - start) / repeats
+        for i in range(repeats + 1):
+            expanded.append({
+                **row,
+                "checked_at": (start + step * i).isoformat(),
+                "repeats": 0,
+                "last_checked_at": None,
+            })
+    return expanded
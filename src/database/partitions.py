@@ -0,0 +1,116 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""Day-partitioned check_history: one table per UTC day of checked_at."""
+
+import re
+import sqlite3
+from datetime import date
+
+BASE_TABLE = "check_history"
+
+# Ids in a partition start at its day's ordinal * ID_SPAN, so ids stay
+# unique and increasing across partitions and an id names its table.
+ID_SPAN = 1 << 32
+
+_NAME = re.compile(r"check_history_(\d{4})(\d{2})(\d{2})")
+
+_COLUMNS = """id, process_key, checked_at, health, pid, heartbeat_ts,
+   iteration, action_taken, elapsed_seconds, repeats, last_checked_at"""
+
+# Same columns as check_history; ids are assigned by _INSERT
+_CREATE_TABLE = """CREATE TABLE IF NOT EXISTS {table} (
+    id INTEGER PRIMARY KEY,
+    process_key TEXT NOT NULL,
+    checked_at TEXT NOT NULL,
+    health TEXT NOT NULL,
+    pid INTEGER,
+    heartbeat_ts TEXT,
+    iteration INTEGER,
+    action_taken TEXT,
+    elapsed_seconds REAL,
+    repeats INTEGER NOT NULL DEFAULT 0,
+    last_checked_at TEXT
+)"""
+
+_CREATE_INDEX = """CREATE INDEX IF NOT EXISTS idx_{table}_process_time
+    ON {table} (process_key, checked_at)"""
+
+_INSERT = """INSERT INTO {table}
+   (id, process_key, checked_at, health, pid, heartbeat_ts,
+    iteration, action_taken, elapsed_seconds)
+   VALUES ((SELECT IFNULL(MAX(id), {base}) + 1 FROM {table}),
+           ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def partition_name(day: str) -> str:
+    """Table holding checks whose checked_at falls on `day` (YYYY-MM-DD)."""
+    return f"{BASE_TABLE}_{day.replace('-', '')}"
+
+
+def table_for_id(history_id: int) -> str:
+    """Table that holds the history row with this id."""
+    ordinal = history_id // ID_SPAN
+    return partition_name(date.fromordinal(ordinal).isoformat()) if ordinal else BASE_TABLE
+
+
+def list_partitions(conn: sqlite3.Connection) -> list[str]:
+    """Days (YYYY-MM-DD) that have a partition, oldest first."""
+    names = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ?",
+        (f"{BASE_TABLE}_[0-9]*",),
+    )
+    days = [m.groups() for (name,) in names if (m := _NAME.fullmatch(name))]
+    return sorted("-".join(d) for d in days)
+
+
+def history_tables(
+    conn: sqlite3.Connection,
+    since: str | None = None,
+    until: str | None = None,
+    after_id: int | None = None,
+) -> list[str]:
+    """check_history plus the partitions that can hold matching rows.
+
+    since/until are checked_at bounds (ISO); after_id keeps partitions
+    that can hold ids above it. Tables are in check-time order.
+    """
+    tables = [BASE_TABLE] if after_id is None or after_id < ID_SPAN else []
+    for day in list_partitions(conn):
+        if since is not None and day < since[:10]:
+            continue
+        if until is not None and day > until[:10]:
+            continue
+        if after_id is not None and _base_id(day) + ID_SPAN <= after_id:
+            continue
+        tables.append(partition_name(day))
+    return tables
+
+
+def history_source(conn: sqlite3.Connection, **bounds) -> str:
+    """FROM-clause source over history_tables(**bounds), for full scans."""
+    tables = history_tables(conn, **bounds)
+    if tables == [BASE_TABLE]:
+        return BASE_TABLE
+    return "(" + " UNION ALL ".join(
+        f"SELECT {_COLUMNS} FROM {table}" for table in tables
+    ) + ")"
+
+
+def ensure_partition(conn: sqlite3.Connection, day: str) -> str:
+    """Create `day`'s partition if missing (in the caller's transaction).
+
+    Returns the INSERT_HISTORY equivalent for it.
+    """
+    table = partition_name(day)
+    conn.execute(_CREATE_TABLE.format(table=table))
+    conn.execute(_CREATE_INDEX.format(table=table))
+    return _INSERT.format(table=table, base=_base_id(day))
+
+
+def drop_partition(conn: sqlite3.Connection, day: str) -> None:
+    """Drop a whole day of history; its pages return to the free list."""
+    conn.execute(f"DROP TABLE IF EXISTS {partition_name(day)}")
+
+
+def _base_id(day: str) -> int:
+    return date.fromisoformat(day).toordinal() * ID_SPAN
@@ -0,0 +1,120 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""Streaming, index-backed queries over check_history."""
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from src.database.partitions import history_tables
+
+
+class HistoryRow(NamedTuple):
+    id: int
+    process_key: str
+    checked_at: str
+    health: str
+    pid: int | None
+    heartbeat_ts: str | None
+    iteration: int | None
+    action_taken: str | None
+    elapsed_seconds: float | None
+    repeats: int
+    last_checked_at: str | None
+
+    @property
+    def cursor(self) -> tuple[str, int]:
+        """Pass as after= to continue a query from this row."""
+        return (self.checked_at, self.id)
+
+
+COLUMNS = ", ".join(HistoryRow._fields)
+
+# Newest `limit` rows per process, one index range scan per process
+_LATEST = f"""SELECT {", ".join("h." + f for f in HistoryRow._fields)}
+   FROM process_state s
+   JOIN {{table}} h ON h.id IN (
+       SELECT id FROM {{table}}
+       WHERE process_key = s.process_key
+       ORDER BY checked_at DESC, id DESC LIMIT ?)
+   ORDER BY h.process_key, h.checked_at DESC, h.id DESC"""
+
+
+def _as_row(cursor: sqlite3.Cursor, row: tuple) -> HistoryRow:
+    return HistoryRow(*row)
+
+
+def iter_history(
+    conn: sqlite3.Connection,
+    process_key: str,
+    since: str | None = None,
+    until: str | None = None,
+    health: Iterable[str] | None = None,
+    limit: int | None = None,
+    after: tuple[str, int] | None = None,
+    newest_first: bool = False,
+) -> Iterator[HistoryRow]:
+    """Yield a process's history rows ordered by check time.
+
+    since/until bound checked_at (ISO, inclusive/exclusive), health keeps
+    only the given states, and after=row.cursor resumes a previous page.
+    Rows are read from the (process_key, checked_at) index as they are
+    consumed, so a large range never sits in memory at once. Day
+    partitions outside since/until are skipped; the others are read one
+    after another in order.
+    """
+    clauses, params = ["process_key = ?"], [process_key]
+    if since is not None:
+        clauses.append("checked_at >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("checked_at < ?")
+        params.append(until)
+    if health is not None:
+        states = list(health)
+        clauses.append(f"health IN ({', '.join('?' * len(states))})")
+        params.extend(states)
+    if after is not None:
+        clauses.append(f"(checked_at, id) {'<' if newest_first else '>'} (?, ?)")
+        params.extend(after)
+    order = "DESC" if newest_first else "ASC"
+    sql = (
+        f"SELECT {COLUMNS} FROM {{table}} WHERE {' AND '.join(clauses)}"
+        f" ORDER BY checked_at {order}, id {order}"
+    )
+    if limit is not None:
+        sql += " LIMIT ?"
+    tables = history_tables(conn, since=since, until=until)
+    remaining = limit
+    for table in reversed(tables) if newest_first else tables:
+        if remaining == 0:
+            return
+        cursor = conn.cursor()
+        cursor.row_factory = _as_row
+        args = params if remaining is None else [*params, remaining]
+        for row in cursor.execute(sql.format(table=table), args):
+            if remaining is not None:
+                remaining -= 1
+            yield row
+
+
+def latest_history(
+    conn: sqlite3.Connection, limit: int
+) -> dict[str, list[HistoryRow]]:
+    """Newest `limit` rows for every process, newest first.
+
+    One statement per history table, newest day partition first, stopping
+    once every process in process_state has `limit` rows.
+    """
+    keys = {key for (key,) in conn.execute("SELECT process_key FROM process_state")}
+    latest: dict[str, list[HistoryRow]] = {}
+    for table in reversed(history_tables(conn)):
+        if all(len(latest.get(key, ())) >= limit for key in keys):
+            break
+        cursor = conn.cursor()
+        cursor.row_factory = _as_row
+        for row in cursor.execute(_LATEST.format(table=table), (limit,)):
+            rows = latest.setdefault(row.process_key, [])
+            if len(rows) < limit:
+                rows.append(row)
+    return latest
@@ -0,0 +1,104 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""Persist recovery attempts and their per-action timings."""
+
+import sqlite3
+from datetime import datetime, timezone
+
+from src.pipeline.recovery_pipeline import PipelineResult
+
+STDERR_TAIL_CHARS = 2000
+
+INSERT_ATTEMPT = """INSERT INTO recovery_attempts
+   (process_key, trigger_health, pid, started_at, ended_at,
+    duration_seconds, fully_recovered, stage_failed)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+INSERT_ACTION = """INSERT INTO recovery_actions
+   (attempt_id, seq, action, started_at, ended_at, duration_seconds,
+    success, return_code, error, stderr_tail)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Total and worst time per (process, action), most expensive first
+ACTION_COSTS = """SELECT a.process_key, r.action, COUNT(*) AS runs,
+   SUM(r.duration_seconds) AS total_seconds,
+   AVG(r.duration_seconds) AS avg_seconds,
+   MAX(r.duration_seconds) AS max_seconds,
+   SUM(1 - r.success) AS failures
+   FROM recovery_actions r JOIN recovery_attempts a ON a.id = r.attempt_id
+   WHERE a.started_at >= ?
+   GROUP BY a.process_key, r.action
+   ORDER BY total_seconds DESC"""
+
+RECENT_ATTEMPTS = """SELECT process_key, started_at FROM recovery_attempts
+   WHERE started_at >= ? ORDER BY started_at"""
+
+
+def _tail(text: str | None, limit: int = STDERR_TAIL_CHARS) -> str | None:
+    if not text:
+        return None
+    return text[-limit:]
+
+
+def _span(start: datetime | None, end: datetime | None) -> tuple[str, str, float]:
+    start = start or datetime.now(timezone.utc)
+    end = end or start
+    return start.isoformat(), end.isoformat(), (end - start).total_seconds()
+
+
+def recovery_rows(
+    result: PipelineResult, trigger_health: str | None = None, pid: int | None = None
+) -> tuple[tuple, list[tuple]]:
+    """INSERT_ATTEMPT params plus INSERT_ACTION params without attempt_id."""
+    started, ended, duration = _span(result.started_at, result.ended_at)
+    attempt = (
+        result.process_key, trigger_health, pid, started, ended,
+        duration, int(result.fully_recovered), result.stage_failed,
+    )
+    actions = []
+    for seq, (action, res) in enumerate(result.action_results):
+        spans = result.action_spans
+        span = spans[seq] if seq < len(spans) else (None, None)
+        actions.append((
+            seq, action, *_span(*span),
+            int(res.success), getattr(res, "return_code", None),
+            res.error, _tail(getattr(res, "stderr", None)),
+        ))
+    return attempt, actions
+
+
+def insert_recovery(
+    conn: sqlite3.Connection, attempt: tuple | list, actions: list
+) -> int:
+    """Insert recovery_rows() output in the caller's transaction."""
+    attempt_id = conn.execute(INSERT_ATTEMPT, attempt).lastrowid
+    conn.executemany(INSERT_ACTION, [(attempt_id, *a) for a in actions])
+    return attempt_id
+
+
+def record_recovery(
+    conn: sqlite3.Connection,
+    result: PipelineResult,
+    trigger_health: str | None = None,
+    pid: int | None = None,
+) -> int:
+    """Write an attempt and all its action rows in one transaction.
+
+    stderr is kept as its last STDERR_TAIL_CHARS characters, which is where
+    cleanup scripts report what went wrong. Returns the attempt id.
+    """
+    with conn:
+        return insert_recovery(conn, *recovery_rows(result, trigger_health, pid))
+
+
+def action_costs(conn: sqlite3.Connection, since: str = "") -> list[dict]:
+    """Per-process, per-action recovery time since an ISO timestamp."""
+    return [dict(r) for r in conn.execute(ACTION_COSTS, (since,)).fetchall()]
+
+
+def recent_attempts(conn: sqlite3.Connection, since: str) -> dict[str, list[datetime]]:
+    """Start times of each process's recovery attempts since an ISO timestamp, oldest first."""
+    attempts: dict[str, list[datetime]] = {}
+    for key, started in conn.execute(RECENT_ATTEMPTS, (since,)):
+        attempts.setdefault(key, []).append(datetime.fromisoformat(started))
+    return attempts
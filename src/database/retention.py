@@ -0,0 +1,138 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""Incremental retention for check_history: roll old rows up, then delete.
+
+Day partitions are rolled up and dropped whole instead of row by row.
+"""
+
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.database.partitions import drop_partition, list_partitions, partition_name
+from src.database.store import ACTION_RECOVERY
+
+DEFAULT_BATCH_SIZE = 500
+
+# Rollup table -> length of the checked_at prefix used as its bucket
+GRAINS = {
+    "history_rollup_hourly": 13,  # 2026-02-05T12
+    "history_rollup_daily": 10,   # 2026-02-05
+}
+
+# checked_at has no index, but ids grow with it: the first id not yet
+# expired bounds every batch to a rowid range, found by scanning only the
+# expired rows in front of it.
+_BOUND = """SELECT COALESCE(
+     (SELECT id FROM check_history WHERE checked_at >= ? ORDER BY id LIMIT 1),
+     (SELECT MAX(id) + 1 FROM check_history), 0)"""
+
+_BATCH = """SELECT MIN(id), MAX(id) FROM (
+   SELECT id FROM check_history
+   WHERE id < ? AND checked_at < ? ORDER BY id LIMIT ?)"""
+
+_RANGE = "id BETWEEN ? AND ? AND checked_at < ?"
+
+_ROLLUP = """INSERT INTO {table}
+   (process_key, bucket, health, checks, recoveries, max_elapsed)
+   SELECT process_key, substr(checked_at, 1, {width}), health,
+          SUM(1 + repeats), SUM((action_taken IS ?) * (1 + repeats)),
+          MAX(elapsed_seconds)
+   FROM {source}
+   GROUP BY 1, 2, 3
+   ON CONFLICT(process_key, bucket, health) DO UPDATE SET
+     checks = checks + excluded.checks,
+     recoveries = recoveries + excluded.recoveries,
+     max_elapsed = MAX(COALESCE(max_elapsed, excluded.max_elapsed),
+                       COALESCE(excluded.max_elapsed, max_elapsed))"""
+
+_DELETE = f"DELETE FROM check_history WHERE {_RANGE}"
+
+
+class RetentionEngine:
+    """Move raw check_history rows older than max_age_hours into rollups.
+
+    Each batch aggregates and deletes the same rows in one transaction, so a
+    crash never double-counts. An expired day partition is aggregated and
+    dropped in one transaction, with no row deletes to fragment the file.
+    run() stops once its time budget is spent and picks up where it left
+    off on the next call.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        max_age_hours: float,
+        hourly_retention_days: float = 0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self._conn = conn
+        self._max_age = timedelta(hours=max_age_hours)
+        self._hourly_age = timedelta(days=hourly_retention_days)
+        self._batch_size = batch_size
+
+    def run(self, budget_seconds: float, now: datetime | None = None) -> int:
+        """Roll up expired rows until done or out of budget. Returns rows moved."""
+        now = now or datetime.now(timezone.utc)
+        deadline = time.monotonic() + budget_seconds
+        cutoff = (now - self._max_age).isoformat()
+        moved = 0
+        for day in list_partitions(self._conn):
+            # a partition expires once its whole day is older than cutoff
+            if day >= cutoff[:10] or time.monotonic() >= deadline:
+                break
+            moved += self._roll_partition(day)
+        bound = self._conn.execute(_BOUND, (cutoff,)).fetchone()[0]
+        while True:
+            batch = self._roll_batch(cutoff, bound)
+            moved += batch
+            if batch < self._batch_size or time.monotonic() >= deadline:
+                break
+        if self._hourly_age:
+            self._prune_hourly(now)
+        return moved
+
+    def _roll_batch(self, cutoff: str, bound: int) -> int:
+        with self._conn:
+            lo, hi = self._conn.execute(
+                _BATCH, (bound, cutoff, self._batch_size)
+            ).fetchone()
+            if lo is None:
+                return 0
+            params = (lo, hi, cutoff)
+            self._roll_up(f"check_history WHERE {_RANGE}", params)
+            return self._conn.execute(_DELETE, params).rowcount
+
+    def _roll_partition(self, day: str) -> int:
+        table = partition_name(day)
+        with self._conn:
+            self._roll_up(table, ())
+            rows = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            drop_partition(self._conn, day)
+        return rows
+
+    def _roll_up(self, source: str, params: tuple) -> None:
+        for table, width in GRAINS.items():
+            sql = _ROLLUP.format(table=table, width=width, source=source)
+            self._conn.execute(sql, (ACTION_RECOVERY, *params))
+
+    def _prune_hourly(self, now: datetime) -> None:
+        bucket = (now - self._hourly_age).isoformat()[:GRAINS["history_rollup_hourly"]]
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM history_rollup_hourly WHERE bucket < ?", (bucket,)
+            )
+
+
+def get_rollups(
+    conn: sqlite3.Connection, process_key: str, grain: str = "hourly"
+) -> list[dict]:
+    """Aggregates for a process at 'hourly' or 'daily' grain, oldest first."""
+    table = f"history_rollup_{grain}"
+    if table not in GRAINS:
+        raise ValueError(f"Unknown rollup grain: {grain}")
+    rows = conn.execute(
+        f"SELECT * FROM {table} WHERE process_key = ? ORDER BY bucket, health",
+        (process_key,),
+    ).fetchall()
+    return [dict(r) for r in rows]
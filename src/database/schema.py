@@ -0,0 +1,134 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""SQLite schema and shared statements for the Watchdog store."""
+
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS process_state (
+    process_key TEXT PRIMARY KEY,
+    consecutive_failures INTEGER DEFAULT 0,
+    last_check_at TEXT,
+    last_health TEXT,
+    last_pid INTEGER,
+    last_heartbeat_ts TEXT,
+    last_iteration INTEGER,
+    last_history_id INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS check_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    process_key TEXT NOT NULL,
+    checked_at TEXT NOT NULL,
+    health TEXT NOT NULL,
+    pid INTEGER,
+    heartbeat_ts TEXT,
+    iteration INTEGER,
+    action_taken TEXT,
+    elapsed_seconds REAL,
+    repeats INTEGER NOT NULL DEFAULT 0,
+    last_checked_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_check_history_process_time
+    ON check_history (process_key, checked_at);
+
+CREATE TABLE IF NOT EXISTS history_rollup_hourly (
+    process_key TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    health TEXT NOT NULL,
+    checks INTEGER NOT NULL,
+    recoveries INTEGER NOT NULL,
+    max_elapsed REAL,
+    PRIMARY KEY (process_key, bucket, health)
+);
+
+CREATE TABLE IF NOT EXISTS history_rollup_daily (
+    process_key TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    health TEXT NOT NULL,
+    checks INTEGER NOT NULL,
+    recoveries INTEGER NOT NULL,
+    max_elapsed REAL,
+    PRIMARY KEY (process_key, bucket, health)
+);
+
+CREATE TABLE IF NOT EXISTS recovery_attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    process_key TEXT NOT NULL,
+    trigger_health TEXT,
+    pid INTEGER,
+    started_at TEXT NOT NULL,
+    ended_at TEXT NOT NULL,
+    duration_seconds REAL NOT NULL,
+    fully_recovered INTEGER NOT NULL,
+    stage_failed TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_recovery_attempts_process_time
+    ON recovery_attempts (process_key, started_at);
+
+CREATE TABLE IF NOT EXISTS recovery_actions (
+    attempt_id INTEGER NOT NULL REFERENCES recovery_attempts (id),
+    seq INTEGER NOT NULL,
+    action TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    ended_at TEXT NOT NULL,
+    duration_seconds REAL NOT NULL,
+    success INTEGER NOT NULL,
+    return_code INTEGER,
+    error TEXT,
+    stderr_tail TEXT,
+    PRIMARY KEY (attempt_id, seq)
+);
+"""
+
+# Columns added after a table first shipped: (table, column, declaration)
+ADDED_COLUMNS = [
+    ("check_history", "elapsed_seconds", "REAL"),
+    ("check_history", "repeats", "INTEGER NOT NULL DEFAULT 0"),
+    ("check_history", "last_checked_at", "TEXT"),
+    ("process_state", "last_history_id", "INTEGER"),
+]
+
+UPSERT_STATE = """INSERT INTO process_state
+   (process_key, consecutive_failures, last_check_at,
+    last_health, last_pid, last_heartbeat_ts, last_iteration)
+   VALUES (?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(process_key) DO UPDATE SET
+     consecutive_failures = excluded.consecutive_failures,
+     last_check_at = excluded.last_check_at,
+     last_health = excluded.last_health,
+     last_pid = excluded.last_pid,
+     last_heartbeat_ts = excluded.last_heartbeat_ts,
+     last_iteration = excluded.last_iteration"""
+
+INSERT_HISTORY = """INSERT INTO check_history
+   (process_key, checked_at, health, pid, heartbeat_ts,
+    iteration, action_taken, elapsed_seconds)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Failure count plus the history row each process last wrote (if it still exists)
+SELECT_STATE = """SELECT process_key, consecutive_failures, last_history_id
+   FROM process_state s"""
+
+SELECT_LAST = """SELECT s.process_key, s.consecutive_failures, s.last_history_id,
+   h.id, h.checked_at, h.health, h.pid, h.action_taken
+   FROM process_state s
+   LEFT JOIN check_history h ON h.id = s.last_history_id"""
+
+EXTEND_HISTORY = """UPDATE check_history
+   SET repeats = repeats + 1, last_checked_at = ? WHERE id = ?"""
+
+LINK_HISTORY = """UPDATE process_state
+   SET last_history_id = ? WHERE process_key = ?"""
+
+
+def apply_schema(conn: sqlite3.Connection) -> None:
+    """Create missing tables and add columns missing from older databases."""
+    conn.executescript(SCHEMA)
+    for table, column, decl in ADDED_COLUMNS:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+    conn.commit()
@@ -0,0 +1,147 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""Availability, MTBF, MTTR and restart counts per process."""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from src.database.partitions import history_source, history_tables
+from src.database.stats_sql import (
+    AVAILABILITY,
+    COUNT_NEW,
+    COUNT_REPEATS,
+    EPISODES,
+    RECOVERIES,
+    STATS_SCHEMA,
+    SYNC_CURSOR_REPEATS,
+    TRANSITIONS,
+    UPSERT_CURSOR,
+)
+
+
+@dataclass
+class ProcessStats:
+    process_key: str
+    checks: int = 0
+    healthy_checks: int = 0
+    failures: int = 0
+    mtbf_seconds: float | None = None
+    mttr_seconds: float | None = None
+    recovery_attempts: int = 0
+    restarts: int = 0
+
+    @property
+    def availability(self) -> float | None:
+        """Percentage of checks that were healthy, None without checks."""
+        if not self.checks:
+            return None
+        return 100.0 * self.healthy_checks / self.checks
+
+
+class StatsEngine:
+    """Incrementally cached reliability statistics over the store.
+
+    refresh() folds check_history rows above a stored watermark id into
+    per-hour check counts and failure episodes (unhealthy run start to the
+    next healthy check), so each call scans only rows written since the
+    last one. compute() answers any window from those caches, the rollup
+    tables for history retention already removed, and recovery_attempts.
+    History ids increase across day partitions, so the watermark also
+    selects which partitions to read.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        conn.executescript(STATS_SCHEMA)
+
+    @property
+    def watermark(self) -> int:
+        row = self._conn.execute(
+            "SELECT last_history_id FROM stats_watermark"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def refresh(self) -> int:
+        """Fold history rows written since the last refresh. Returns rows read."""
+        conn = self._conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            low = self.watermark
+            high = max((
+                conn.execute(f"SELECT MAX(id) FROM {table}").fetchone()[0] or 0
+                for table in history_tables(conn)
+            ))
+            oldest = conn.execute("SELECT MIN(last_id) FROM stats_cursor").fetchone()[0]
+            for table in history_tables(conn, after_id=(oldest or 1) - 1):
+                conn.execute(COUNT_REPEATS.format(history=table))
+                conn.execute(SYNC_CURSOR_REPEATS.format(history=table))
+            if high <= low:
+                return 0
+            source = history_source(conn, after_id=low)
+            read = conn.execute(
+                f"SELECT COUNT(*) FROM {source} WHERE id > ? AND id <= ?", (low, high)
+            ).fetchone()[0]
+            conn.execute(COUNT_NEW.format(history=source), (low, high))
+            self._track_episodes(source, low, high)
+            conn.execute(
+                "INSERT OR REPLACE INTO stats_watermark VALUES (0, ?)", (high,)
+            )
+        return read
+
+    def _track_episodes(self, source: str, low: int, high: int) -> None:
+        state = dict(self._conn.execute(
+            "SELECT process_key, healthy FROM stats_cursor"
+        ).fetchall())
+        for row in self._conn.execute(TRANSITIONS.format(history=source), (low, high)).fetchall():
+            key, healthy = row["process_key"], bool(row["healthy"])
+            previous = state.get(key)
+            if not healthy and previous in (None, 1):
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO stats_episodes VALUES (?, ?, NULL)",
+                    (key, row["checked_at"]),
+                )
+            elif healthy and previous == 0:
+                self._conn.execute(
+                    "UPDATE stats_episodes SET ended_at = ?"
+                    " WHERE process_key = ? AND ended_at IS NULL",
+                    (row["checked_at"], key),
+                )
+            state[key] = int(healthy)
+            self._conn.execute(
+                UPSERT_CURSOR, (key, int(healthy), row["id"], row["repeats"])
+            )
+
+    def compute(
+        self, since: datetime, until: datetime | None = None, refresh: bool = True
+    ) -> dict[str, ProcessStats]:
+        """Statistics per process for checks in [since, until).
+
+        Check counts are kept per hour (per day for old daily rollups), so
+        availability covers every bucket overlapping the window.
+        """
+        if refresh:
+            self.refresh()
+        until = until or datetime.now(timezone.utc)
+        start, end = since.isoformat(), until.isoformat()
+        params = {
+            "since": start, "until": end,
+            "since_hour": start[:13], "since_day": start[:10],
+        }
+        stats: dict[str, ProcessStats] = {}
+
+        def entry(key: str) -> ProcessStats:
+            return stats.setdefault(key, ProcessStats(key))
+
+        for r in self._conn.execute(AVAILABILITY, params):
+            s = entry(r["process_key"])
+            s.checks, s.healthy_checks = r["checks"], r["healthy"]
+        for r in self._conn.execute(EPISODES, params):
+            s = entry(r["process_key"])
+            s.failures, s.mtbf_seconds, s.mttr_seconds = (
+                r["failures"], r["mtbf"], r["mttr"]
+            )
+        for r in self._conn.execute(RECOVERIES, params):
+            s = entry(r["process_key"])
+            s.recovery_attempts, s.restarts = r["attempts"], r["restarts"]
+        return dict(sorted(stats.items()))
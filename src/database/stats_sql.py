@@ -0,0 +1,115 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""Cache tables and queries behind StatsEngine.
+
+{history} is check_history or, with day partitions, a history table or
+partitions.history_source().
+"""
+
+STATS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats_watermark (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    last_history_id INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS stats_cursor (
+    process_key TEXT PRIMARY KEY,
+    healthy INTEGER NOT NULL,
+    last_id INTEGER NOT NULL,
+    last_repeats INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS stats_hourly (
+    process_key TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    checks INTEGER NOT NULL,
+    healthy INTEGER NOT NULL,
+    PRIMARY KEY (process_key, bucket)
+);
+
+CREATE TABLE IF NOT EXISTS stats_episodes (
+    process_key TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    ended_at TEXT,
+    PRIMARY KEY (process_key, started_at)
+);
+"""
+
+_UPSERT_HOURLY = """
+   ON CONFLICT(process_key, bucket) DO UPDATE SET
+     checks = checks + excluded.checks, healthy = healthy + excluded.healthy"""
+
+# Checks folded into rows already counted, since they were counted
+COUNT_REPEATS = """INSERT INTO stats_hourly (process_key, bucket, checks, healthy)
+   SELECT h.process_key, substr(h.checked_at, 1, 13),
+          h.repeats - c.last_repeats,
+          (h.health = 'healthy') * (h.repeats - c.last_repeats)
+   FROM stats_cursor c JOIN {history} h ON h.id = c.last_id
+   WHERE h.repeats > c.last_repeats""" + _UPSERT_HOURLY
+
+COUNT_NEW = """INSERT INTO stats_hourly (process_key, bucket, checks, healthy)
+   SELECT process_key, substr(checked_at, 1, 13), SUM(1 + repeats),
+          SUM((health = 'healthy') * (1 + repeats))
+   FROM {history} WHERE id > ? AND id <= ?
+   GROUP BY 1, 2""" + _UPSERT_HOURLY
+
+# Rows whose healthy/unhealthy side differs from the previous row
+TRANSITIONS = """SELECT id, process_key, checked_at, healthy, repeats FROM (
+   SELECT id, process_key, checked_at, repeats, health = 'healthy' AS healthy,
+          LAG(health = 'healthy') OVER (
+              PARTITION BY process_key ORDER BY id) AS prev_healthy,
+          LEAD(id) OVER (PARTITION BY process_key ORDER BY id) AS next_id
+   FROM {history} WHERE id > ? AND id <= ?)
+   WHERE healthy IS NOT prev_healthy OR next_id IS NULL
+   ORDER BY id"""
+
+UPSERT_CURSOR = """INSERT INTO stats_cursor
+   (process_key, healthy, last_id, last_repeats) VALUES (?, ?, ?, ?)
+   ON CONFLICT(process_key) DO UPDATE SET healthy = excluded.healthy,
+     last_id = excluded.last_id, last_repeats = excluded.last_repeats"""
+
+SYNC_CURSOR_REPEATS = """UPDATE stats_cursor SET last_repeats = (
+   SELECT repeats FROM {history} WHERE id = stats_cursor.last_id)
+   WHERE EXISTS (SELECT 1 FROM {history} WHERE id = stats_cursor.last_id)"""
+
+# Checks per process in a window: cached hours, plus rollups for the hours
+# (or days) that were rolled up before the cache first saw the process
+AVAILABILITY = """SELECT process_key, SUM(checks) AS checks,
+   SUM(healthy) AS healthy FROM (
+   SELECT process_key, checks, healthy FROM stats_hourly
+   WHERE bucket >= :since_hour AND bucket < :until
+   UNION ALL
+   SELECT r.process_key, r.checks, (r.health = 'healthy') * r.checks
+   FROM history_rollup_hourly r
+   WHERE r.bucket >= :since_hour AND r.bucket < :until
+     AND r.bucket < COALESCE((SELECT MIN(bucket) FROM stats_hourly s
+                              WHERE s.process_key = r.process_key), '~')
+   UNION ALL
+   SELECT r.process_key, r.checks, (r.health = 'healthy') * r.checks
+   FROM history_rollup_daily r
+   WHERE r.bucket >= :since_day AND r.bucket < :until
+     AND r.bucket < COALESCE((SELECT MIN(substr(bucket, 1, 10))
+                              FROM history_rollup_hourly h
+                              WHERE h.process_key = r.process_key), '~')
+     AND r.bucket < COALESCE((SELECT MIN(substr(bucket, 1, 10))
+                              FROM stats_hourly s
+                              WHERE s.process_key = r.process_key), '~'))
+   GROUP BY process_key"""
+
+# Failure episodes starting in a window; MTBF from the gap to the previous one
+EPISODES = """SELECT process_key, COUNT(*) AS failures,
+   AVG((julianday(ended_at) - julianday(started_at)) * 86400) AS mttr,
+   AVG(gap) AS mtbf FROM (
+   SELECT process_key, started_at, ended_at,
+          (julianday(started_at) - julianday(LAG(started_at) OVER (
+              PARTITION BY process_key ORDER BY started_at))) * 86400 AS gap
+   FROM stats_episodes)
+   WHERE started_at >= :since AND started_at < :until
+   GROUP BY process_key"""
+
+RECOVERIES = """SELECT process_key, COUNT(*) AS attempts,
+   SUM((SELECT COUNT(*) FROM recovery_actions r
+        WHERE r.attempt_id = a.id AND r.action = 'start' AND r.success)) AS restarts
+   FROM recovery_attempts a
+   WHERE started_at >= :since AND started_at < :until
+   GROUP BY process_key"""
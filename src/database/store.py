@@ -3,40 +3,52 @@
 """SQLite store for tracking process check history and consecutive failures."""
 
 import sqlite3
+from collections.abc import Collection
 from datetime import datetime, timezone
 
+from src.config.constants import (
+    DEFAULT_HISTORY_KEYFRAME_SECONDS,
+    DEFAULT_HISTORY_MODE,
+    ProcessHealth,
+)
+from src.database.connection import open_connection
+from src.database.history import HistoryWriter, expand_history
+from src.database.queries import iter_history
+from src.database.schema import UPSERT_STATE, apply_schema
+from src.monitor.models import MonitorReport
 
-_SCHEMA = """
-CREATE TABLE IF NOT EXISTS process_state (
-    process_key TEXT PRIMARY KEY,
-    consecutive_failures INTEGER DEFAULT 0,
-    last_check_at TEXT,
-    last_health TEXT,
-    last_pid INTEGER,
-    last_heartbeat_ts TEXT,
-    last_iteration INTEGER
-);
-
-CREATE TABLE IF NOT EXISTS check_history (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    process_key TEXT NOT NULL,
-    checked_at TEXT NOT NULL,
-    health TEXT NOT NULL,
-    pid INTEGER,
-    heartbeat_ts TEXT,
-    iteration INTEGER,
-    action_taken TEXT
-);
-"""
+ACTION_WAITING = "waiting_for_consecutive"
+ACTION_RECOVERY = "recovery_triggered"
+ACTION_SUPPRESSED = "recovery_suppressed"  # due, but held by crash-loop backoff
+ACTION_READ_PENDING = "waiting_for_read"  # READ_TIMEOUT never triggers recovery
 
 
 class WatchdogStore:
     """SQLite-backed store for Watchdog check state and history."""
 
-    def __init__(self, db_path: str) -> None:
-        self._conn = sqlite3.connect(db_path)
-        self._conn.row_factory = sqlite3.Row
-        self._conn.executescript(_SCHEMA)
+    def __init__(
+        self,
+        db_path: str,
+        read_only: bool = False,
+        history_mode: str = DEFAULT_HISTORY_MODE,
+        keyframe_seconds: float = DEFAULT_HISTORY_KEYFRAME_SECONDS,
+        partitioned: bool = False,
+    ) -> None:
+        """Open the store.
+
+        read_only=True opens a mode=ro connection for readers (TUI,
+        queries): it skips schema creation and never blocks the checker.
+        history_mode="changes" writes a history row only when health, PID
+        or action changes, or keyframe_seconds after the last written row;
+        other checks extend that row's repeats/last_checked_at.
+        partitioned=True writes history into per-day tables (partitions.py).
+        """
+        self._conn = open_connection(db_path, read_only=read_only)
+        self._history = HistoryWriter(
+            self._conn, history_mode == "changes", keyframe_seconds, partitioned
+        )
+        if not read_only:
+            apply_schema(self._conn)
 
     def record_check(
         self,
@@ -46,37 +58,46 @@ class WatchdogStore:
         heartbeat_ts: str | None,
         iteration: int | None,
         action: str | None = None,
+        elapsed_seconds: float | None = None,
     ) -> int:
         """Record a check result. Returns consecutive failures after update."""
         now = datetime.now(timezone.utc).isoformat()
+        last = self._history.last_rows(process_key)
+        prev = last.get(process_key)
+        failures = 0 if health == "healthy" else (prev["consecutive_failures"] if prev else 0) + 1
 
-        if health == "healthy":
-            failures = 0
-        else:
-            failures = self.get_consecutive_failures(process_key) + 1
+        with self._conn:
+            self._conn.execute(
+                UPSERT_STATE,
+                (process_key, failures, now, health, pid, heartbeat_ts, iteration),
+            )
+            self._history.write(now, [
+                (process_key, now, health, pid, heartbeat_ts, iteration, action,
+                 elapsed_seconds),
+            ], last)
+        return failures
 
-        self._conn.execute(
-            """INSERT INTO process_state
-               (process_key, consecutive_failures, last_check_at,
-                last_health, last_pid, last_heartbeat_ts, last_iteration)
-               VALUES (?, ?, ?, ?, ?, ?, ?)
-               ON CONFLICT(process_key) DO UPDATE SET
-                 consecutive_failures = excluded.consecutive_failures,
-                 last_check_at = excluded.last_check_at,
-                 last_health = excluded.last_health,
-                 last_pid = excluded.last_pid,
-                 last_heartbeat_ts = excluded.last_heartbeat_ts,
-                 last_iteration = excluded.last_iteration""",
-            (process_key, failures, now, health, pid, heartbeat_ts, iteration),
-        )
-        self._conn.execute(
-            """INSERT INTO check_history
-               (process_key, checked_at, health, pid, heartbeat_ts,
-                iteration, action_taken)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (process_key, now, health, pid, heartbeat_ts, iteration, action),
+    def record_report(
+        self, report: MonitorReport, threshold: int, held: Collection[str] = ()
+    ) -> dict[str, int]:
+        """Record every result of a check cycle in one transaction.
+
+        Failure counts come from a single read of process_state, so the
+        cost is one SELECT and one commit regardless of fleet size.
+        Rows are tagged as described in report_rows; `held` are the
+        processes crash-loop backoff keeps from recovering this cycle.
+        Returns consecutive failures per process_key after the update.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        last = self._history.last_rows()
+        current = {k: r["consecutive_failures"] for k, r in last.items()}
+        failures, state_rows, history_rows = report_rows(
+            report, threshold, current, now, held
         )
-        self._conn.commit()
+
+        with self._conn:
+            self._conn.executemany(UPSERT_STATE, state_rows)
+            self._history.write(now, history_rows, last)
         return failures
 
     def get_consecutive_failures(self, process_key: str) -> int:
@@ -95,14 +116,59 @@ class WatchdogStore:
         )
         self._conn.commit()
 
-    def get_history(self, process_key: str) -> list[dict]:
-        """Return check history rows for a process (oldest first)."""
-        rows = self._conn.execute(
-            "SELECT * FROM check_history WHERE process_key = ? ORDER BY id",
-            (process_key,),
-        ).fetchall()
-        return [dict(r) for r in rows]
+    def get_history(self, process_key: str, expand: bool = False) -> list[dict]:
+        """Return check history rows for a process (oldest first).
+
+        expand=True turns each row with repeats into one row per check,
+        with check times spread evenly up to last_checked_at.
+        """
+        rows = [r._asdict() for r in iter_history(self._conn, process_key)]
+        return expand_history(rows) if expand else rows
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Underlying connection, for engines that extend the store."""
+        return self._conn
 
     def close(self) -> None:
         """Close the database connection."""
         self._conn.close()
+
+
+def report_rows(
+    report: MonitorReport,
+    threshold: int,
+    current: dict[str, int],
+    now: str,
+    held: Collection[str] = (),
+) -> tuple[dict[str, int], list[tuple], list[tuple]]:
+    """Failure counts plus UPSERT_STATE and INSERT_HISTORY rows for a report.
+
+    Unhealthy rows are tagged 'waiting_for_consecutive' below the
+    threshold and 'recovery_triggered' once it is reached, unless the
+    process is in `held` ('recovery_suppressed'). READ_TIMEOUT rows are
+    always 'waiting_for_read', since they never start a recovery.
+    """
+    failures: dict[str, int] = {}
+    state_rows, history_rows = [], []
+    for r in report.results:
+        key, health = r.process_key, r.health.value
+        heartbeat_ts = r.last_heartbeat.isoformat() if r.last_heartbeat else None
+        action = None
+        if health == "healthy":
+            failures[key] = 0
+        else:
+            failures[key] = current.get(key, 0) + 1
+            if r.health == ProcessHealth.READ_TIMEOUT:
+                action = ACTION_READ_PENDING
+            elif failures[key] < threshold:
+                action = ACTION_WAITING
+            else:
+                action = ACTION_SUPPRESSED if key in held else ACTION_RECOVERY
+        state_rows.append(
+            (key, failures[key], now, health, r.pid, heartbeat_ts, None)
+        )
+        history_rows.append(
+            (key, now, health, r.pid, heartbeat_ts, None, action, r.elapsed_seconds)
+        )
+    return failures, state_rows, history_rows
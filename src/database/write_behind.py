@@ -0,0 +1,132 @@
+# Area: State Management
+# PRD: docs/prd-state-management.md
+"""Background thread that writes queued history and state to SQLite."""
+
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+
+from src.database.connection import open_connection
+from src.database.history import HistoryWriter
+from src.database.schema import UPSERT_STATE
+from src.logging.logger import get_logger
+
+logger = get_logger("store")
+
+_FLUSH = object()
+_STOP = object()
+_ENSURE_STATE = "INSERT OR IGNORE INTO process_state (process_key) VALUES (?)"
+
+
+class StoreWriter(threading.Thread):
+    """Drain a bounded queue of check cycles into SQLite on its own connection.
+
+    Each wake-up writes up to `batch` queued cycles in one transaction.
+    State rows come from take_state() when a flush is due (every
+    flush_interval seconds, on flush() and on stop()); if the transaction
+    fails they are handed back through restore_state() for the next try.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        history_mode: str,
+        keyframe_seconds: float,
+        flush_interval: float,
+        queue_size: int,
+        take_state: Callable[[], dict[str, tuple]],
+        restore_state: Callable[[dict[str, tuple]], None],
+        partitioned: bool = False,
+        batch: int = 256,
+    ) -> None:
+        super().__init__(name="store-writer", daemon=True)
+        self._args = (db_path, history_mode, keyframe_seconds, partitioned)
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._flush_interval = flush_interval
+        self._take_state = take_state
+        self._restore_state = restore_state
+        self._batch = batch
+        self.dropped = 0
+
+    def submit(self, now: str, history_rows: list[tuple]) -> bool:
+        """Queue one cycle's history rows; False (and counted) if full."""
+        try:
+            self._queue.put_nowait((now, history_rows))
+            return True
+        except queue.Full:
+            self.dropped += len(history_rows)
+            logger.warning("History queue full, dropped %d rows", len(history_rows))
+            return False
+
+    def flush(self) -> None:
+        """Block until everything queued so far, and the state, is written."""
+        if not self.is_alive():
+            logger.error("Store writer is not running, flush skipped")
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Write what is left, then end the thread."""
+        if not self.is_alive():
+            logger.error("Store writer is not running, unwritten state lost")
+            return
+        self._queue.put(_STOP)
+        self.join()
+
+    def run(self) -> None:
+        db_path, history_mode, keyframe_seconds, partitioned = self._args
+        conn = open_connection(db_path)
+        changes_only = history_mode == "changes"
+        history = HistoryWriter(conn, changes_only, keyframe_seconds, partitioned)
+        next_flush = time.monotonic() + self._flush_interval
+        running = True
+        while running:
+            items = self._drain(next_flush - time.monotonic())
+            running = _STOP not in items
+            due = not running or _FLUSH in items or time.monotonic() >= next_flush
+            try:
+                self._write(conn, history, changes_only, items, due)
+            except Exception:
+                # any failure must not end the thread, or flush() would hang
+                logger.exception("Store write failed, %d cycles lost", len(items))
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if due:
+                next_flush = time.monotonic() + self._flush_interval
+        conn.close()
+
+    def _drain(self, wait: float) -> list:
+        """Wait up to `wait` seconds for an item, then take what is queued."""
+        try:
+            items = [self._queue.get(timeout=max(0.0, wait))]
+        except queue.Empty:
+            return []
+        while len(items) < self._batch:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _write(
+        self, conn: sqlite3.Connection, history: HistoryWriter,
+        changes_only: bool, items: list, flush_state: bool,
+    ) -> None:
+        state = self._take_state() if flush_state else {}
+        try:
+            with conn:
+                for item in items:
+                    if item is _FLUSH or item is _STOP:
+                        continue
+                    now, rows = item
+                    # change-only mode links history rows from process_state
+                    conn.executemany(_ENSURE_STATE, [(row[0],) for row in rows])
+                    history.write(now, rows, history.last_rows() if changes_only else {})
+                conn.executemany(UPSERT_STATE, state.values())
+        except Exception:
+            self._restore_state(state)
+            raise
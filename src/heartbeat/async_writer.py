@@ -0,0 +1,119 @@
+# Area: Heartbeat Monitoring
+# PRD: docs/prd-heartbeat-monitoring.md
+"""Heartbeat writer for asyncio services, with event-loop lag reporting.
+
+Like writer.py, this module has NO dependencies on other Watchdog modules
+(copy it together with writer.py).
+
+Usage:
+    from src.heartbeat.async_writer import AsyncHeartbeatWriter
+
+    writer = AsyncHeartbeatWriter("/path/to/heartbeats", "my_service")
+    writer.start()            # inside the running loop
+    writer.beat()             # from coroutines: O(1), never blocks
+    await writer.stop()
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+from src.heartbeat.writer import HeartbeatWriter
+
+
+class AsyncHeartbeatWriter(HeartbeatWriter):
+    """Writes heartbeats from a loop task and reports loop lag.
+
+    Every `interval` seconds the task measures how late its sleep woke up
+    (event-loop lag) and rewrites the last beat() with that lag, the file
+    write offloaded to a thread. The timestamp is the time of the last
+    beat(), not of the tick, so a coroutine that stops beating still times
+    out while the loop keeps ticking. Nothing is written before the first
+    beat(). If the loop stops ticking altogether, a sentinel thread
+    rewrites the last heartbeat with the growing stall as `loop_lag`, so a
+    hung loop shows up before the heartbeat times out.
+    """
+
+    def __init__(
+        self,
+        heartbeat_dir: str,
+        process_key: str,
+        heartbeat_filename: str | None = None,
+        interval: float = 1.0,
+    ) -> None:
+        super().__init__(heartbeat_dir, process_key, heartbeat_filename)
+        self._interval = interval
+        self._status = "running"
+        self._lag = 0.0
+        self._beat_at: datetime | None = None
+        self._last_tick: float | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._sentinel_stop = threading.Event()
+        self._sentinel: threading.Thread | None = None
+        self._write_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the heartbeat task on the running loop."""
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self._run())
+        self._sentinel = threading.Thread(
+            target=self._watch_loop, name="heartbeat-sentinel", daemon=True
+        )
+        self._sentinel.start()
+
+    def beat(self, status: str = "running") -> None:
+        """Record progress, status and time; the next tick writes it."""
+        self._iteration += 1
+        self._status = status
+        self._beat_at = datetime.now(timezone.utc)
+
+    async def stop(self) -> None:
+        """Cancel the task, stop the sentinel and remove the heartbeat file."""
+        self._sentinel_stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._sentinel is not None:
+            await asyncio.to_thread(self._sentinel.join)
+            self._sentinel = None
+        await asyncio.to_thread(super().stop)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        expected = loop.time()
+        while True:
+            await asyncio.sleep(max(0.0, expected - loop.time()))
+            now = loop.time()
+            self._lag = max(0.0, now - expected)
+            self._last_tick = now
+            if self._beat_at is not None:
+                await asyncio.to_thread(self._write, self._beat_at, self._lag)
+            expected = loop.time() + self._interval
+
+    def _watch_loop(self) -> None:
+        """Report a stalled loop: no tick for longer than one interval."""
+        while not self._sentinel_stop.wait(self._interval):
+            if self._last_tick is None or self._beat_at is None or self._loop is None:
+                continue
+            stall = self._loop.time() - self._last_tick - self._interval
+            if stall > self._interval:
+                try:
+                    self._write(self._beat_at, stall)
+                except OSError:
+                    pass
+
+    def _write(self, timestamp: datetime, lag: float) -> None:
+        data = self._payload(self._status, timestamp, self._iteration)
+        data["loop_lag"] = round(lag, 6)
+        with self._write_lock:
+            self._write_atomic(data)
+
+    @property
+    def loop_lag(self) -> float:
+        """Lag measured on the most recent tick, in seconds."""
+        return self._lag
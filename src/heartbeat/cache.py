@@ -0,0 +1,70 @@
+# Area: Heartbeat Monitoring
+# PRD: docs/prd-heartbeat-monitoring.md
+"""Stat-keyed LRU cache around read_heartbeat."""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from src.heartbeat.reader import HeartbeatData, read_heartbeat
+
+
+class HeartbeatCache:
+    """Serve unchanged heartbeat files without re-reading or re-parsing.
+
+    An entry is valid while the file's (st_ino, st_mtime_ns, st_size) is
+    unchanged, so a hit costs one stat() call. Writers replace the file via
+    rename, which always changes st_ino. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Path, tuple[tuple, HeartbeatData | None]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, file_path: Path) -> HeartbeatData | None:
+        """Drop-in for read_heartbeat."""
+        path = Path(file_path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        data = read_heartbeat(path)
+        with self._lock:
+            self._entries[path] = (stamp, data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -18,6 +18,8 @@ class HeartbeatData:
     status: str
     iteration: int
     file_path: Path
+    start_time: int | None = None  # clock ticks since boot (Linux only)
+    loop_lag: float | None = None  # event-loop lag in seconds (async writers)
 
 
 def read_heartbeat(file_path: Path) -> HeartbeatData | None:
@@ -35,6 +37,10 @@ def read_heartbeat(file_path: Path) -> HeartbeatData | None:
 
     try:
         timestamp = datetime.fromisoformat(raw["timestamp"])
+        start_time = raw.get("start_time")
+        start_time = int(start_time) if start_time is not None else None
+        loop_lag = raw.get("loop_lag")
+        loop_lag = float(loop_lag) if loop_lag is not None else None
     except (ValueError, TypeError):
         return None
 
@@ -45,6 +51,8 @@ def read_heartbeat(file_path: Path) -> HeartbeatData | None:
         status=raw["status"],
         iteration=int(raw["iteration"]),
         file_path=file_path,
+        start_time=start_time,
+        loop_lag=loop_lag,
     )
 
 
@@ -0,0 +1,133 @@
+# Area: Heartbeat Monitoring
+# PRD: docs/prd-heartbeat-monitoring.md
+"""Shared-memory heartbeat table for large fleets.
+
+Like writer.py, this module has NO dependencies on other Watchdog modules
+and can be copied into monitored projects.
+
+All processes on a host share one memory-mapped file of fixed-size slots.
+A beat is a few stores into the process's own slot, guarded by a seqlock
+(the slot's sequence number is odd while a write is in progress), so there
+is no per-beat file creation, rename or metadata update.
+
+Usage:
+    from src.heartbeat.shm import SharedHeartbeatWriter
+
+    writer = SharedHeartbeatWriter("/dev/shm/watchdog.hbt", "gmail_as_referee")
+    writer.beat()
+    writer.stop()
+"""
+
+import fcntl
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+
+MAGIC = b"WDHB"
+VERSION = 1
+HEADER = struct.Struct("<4sIII")  # magic, version, slot_count, slot_size
+HEADER_SIZE = 64
+# seq, pid, timestamp_ns, start_time, iteration, status, reserved, key
+SLOT = struct.Struct("<QqqqqII64s")
+SLOT_SIZE = 128
+SEQ = struct.Struct("<Q")
+DEFAULT_SLOTS = 1024
+STATUS_CODES = {"running": 0, "error": 1}
+UNKNOWN_STATUS = 2
+
+
+def slot_offset(index: int) -> int:
+    return HEADER_SIZE + index * SLOT_SIZE
+
+
+class SharedHeartbeatWriter:
+    """Heartbeat writer with the HeartbeatWriter API, backed by a slot table."""
+
+    def __init__(
+        self, table_path: str, process_key: str, slots: int = DEFAULT_SLOTS
+    ) -> None:
+        self._path = Path(table_path)
+        self._key = process_key.encode()[:64]
+        self._iteration = 0
+        self._start: tuple[int, int] | None = None
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            if os.fstat(fd).st_size == 0:
+                os.ftruncate(fd, slot_offset(slots))
+                os.pwrite(fd, HEADER.pack(MAGIC, VERSION, slots, SLOT_SIZE), 0)
+            self._mm = mmap.mmap(fd, 0)
+            magic, version, count, size = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION or size != SLOT_SIZE:
+                raise ValueError(f"Not a heartbeat table: {self._path}")
+            self._offset = slot_offset(self._claim_slot(count))
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _claim_slot(self, count: int) -> int:
+        """Reuse this key's slot or take the first free one (under flock)."""
+        free = None
+        for i in range(count):
+            key = SLOT.unpack_from(self._mm, slot_offset(i))[7].rstrip(b"\0")
+            if key == self._key:
+                return i
+            if not key and free is None:
+                free = i
+        if free is None:
+            raise RuntimeError(f"Heartbeat table full: {self._path}")
+        self._write_slot(free, pid=0, ts_ns=0, start_time=0, status=0)
+        return free
+
+    def beat(self, status: str = "running") -> None:
+        """Record a heartbeat in this process's slot."""
+        self._iteration += 1
+        pid = os.getpid()
+        if self._start is None or self._start[0] != pid:
+            self._start = (pid, _own_start_time())
+        self._write_slot(
+            None,
+            pid=pid,
+            ts_ns=time.time_ns(),
+            start_time=self._start[1],
+            status=STATUS_CODES.get(status, UNKNOWN_STATUS),
+        )
+
+    def stop(self) -> None:
+        """Release the slot on clean shutdown."""
+        offset = self._offset
+        seq = SEQ.unpack_from(self._mm, offset)[0]
+        SEQ.pack_into(self._mm, offset, seq + 1)
+        self._mm[offset + SEQ.size:offset + SLOT_SIZE] = bytes(SLOT_SIZE - SEQ.size)
+        SEQ.pack_into(self._mm, offset, seq + 2)
+        self._mm.close()
+
+    def _write_slot(self, index, pid, ts_ns, start_time, status) -> None:
+        offset = slot_offset(index) if index is not None else self._offset
+        seq = SEQ.unpack_from(self._mm, offset)[0]
+        SEQ.pack_into(self._mm, offset, seq + 1)  # odd: write in progress
+        SLOT.pack_into(
+            self._mm, offset, seq + 1, pid, ts_ns, start_time,
+            self._iteration, status, 0, self._key,
+        )
+        SEQ.pack_into(self._mm, offset, seq + 2)
+
+    @property
+    def heartbeat_path(self) -> Path:
+        return self._path
+
+    @property
+    def iteration_count(self) -> int:
+        return self._iteration
+
+
+def _own_start_time() -> int:
+    """Process start time in clock ticks since boot, or 0 if unknown."""
+    try:
+        stat = Path("/proc/self/stat").read_text()
+        return int(stat[stat.rindex(")") + 2:].split()[19])
+    except (OSError, ValueError, IndexError):
+        return 0
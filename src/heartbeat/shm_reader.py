@@ -0,0 +1,84 @@
+# Area: Heartbeat Monitoring
+# PRD: docs/prd-heartbeat-monitoring.md
+"""Read a whole shared-memory heartbeat table in one pass."""
+
+import mmap
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.heartbeat.reader import HeartbeatData
+from src.heartbeat.shm import (
+    HEADER,
+    MAGIC,
+    SEQ,
+    SLOT,
+    SLOT_SIZE,
+    STATUS_CODES,
+    VERSION,
+    slot_offset,
+)
+
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+MAX_RETRIES = 5
+
+
+def read_heartbeat_table(table_path: Path) -> dict[str, HeartbeatData]:
+    """Return HeartbeatData for every claimed slot, keyed by process_key.
+
+    The table is copied with a single read of the mapping; slots caught
+    mid-write (odd or changed sequence number) are re-read individually.
+    Returns {} if the table is missing or not a heartbeat table.
+    """
+    try:
+        with open(table_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError, OSError):
+        return {}
+
+    with mm:
+        snapshot = mm[:]
+        if len(snapshot) < HEADER.size:
+            return {}
+        magic, version, count, size = HEADER.unpack_from(snapshot, 0)
+        if magic != MAGIC or version != VERSION or size != SLOT_SIZE:
+            return {}
+
+        results = {}
+        for i in range(count):
+            offset = slot_offset(i)
+            if offset + SLOT_SIZE > len(snapshot):
+                break
+            fields = _read_slot(snapshot, mm, offset)
+            if fields is None:
+                continue
+            data = _to_heartbeat(fields, Path(table_path))
+            if data is not None:
+                results[data.process_key] = data
+        return results
+
+
+def _read_slot(snapshot: bytes, mm: mmap.mmap, offset: int) -> tuple | None:
+    """Seqlock read: accept the slot only if its sequence is even and stable."""
+    fields = SLOT.unpack_from(snapshot, offset)
+    for _ in range(MAX_RETRIES):
+        seq = fields[0]
+        if seq % 2 == 0 and SEQ.unpack_from(mm, offset)[0] == seq:
+            return fields
+        fields = SLOT.unpack(mm[offset:offset + SLOT.size])
+    return None
+
+
+def _to_heartbeat(fields: tuple, table_path: Path) -> HeartbeatData | None:
+    _seq, pid, ts_ns, start_time, iteration, status, _, key = fields
+    process_key = key.rstrip(b"\0").decode(errors="replace")
+    if not process_key or pid == 0 or ts_ns == 0:
+        return None
+    return HeartbeatData(
+        process_key=process_key,
+        pid=pid,
+        timestamp=datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc),
+        status=STATUS_NAMES.get(status, "unknown"),
+        iteration=iteration,
+        file_path=table_path,
+        start_time=start_time or None,
+    )
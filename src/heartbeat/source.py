@@ -0,0 +1,45 @@
+# Area: Heartbeat Monitoring
+# PRD: docs/prd-heartbeat-monitoring.md
+"""Resolve a process's heartbeat from its configured transport."""
+
+from pathlib import Path
+from typing import Callable
+
+from src.heartbeat.reader import HeartbeatData, read_heartbeat
+from src.heartbeat.shm_reader import read_heartbeat_table
+
+SHM_TRANSPORT = "shm"
+
+
+def uses_shm(proc: dict) -> bool:
+    return proc.get("heartbeat_transport", "file") == SHM_TRANSPORT
+
+
+def load_tables(procs: dict[str, dict]) -> dict[Path, dict[str, HeartbeatData]]:
+    """Read every shared-memory table used by `procs` exactly once."""
+    tables: dict[Path, dict[str, HeartbeatData]] = {}
+    for proc in procs.values():
+        path = Path(proc["heartbeat_path"])
+        if uses_shm(proc) and path not in tables:
+            tables[path] = read_heartbeat_table(path)
+    return tables
+
+
+def read_process_heartbeat(
+    process_key: str,
+    proc: dict,
+    reader: Callable[[Path], HeartbeatData | None] | None = None,
+    tables: dict[Path, dict[str, HeartbeatData]] | None = None,
+) -> HeartbeatData | None:
+    """Return the latest heartbeat for a process, or None.
+
+    File-transport processes go through `reader` (default read_heartbeat).
+    Shared-memory processes are looked up in `tables` (from load_tables)
+    or, if not preloaded, by reading their table.
+    """
+    path = Path(proc["heartbeat_path"])
+    if not uses_shm(proc):
+        return (reader or read_heartbeat)(path)
+    if tables is None or path not in tables:
+        tables = {path: read_heartbeat_table(path)}
+    return tables[path].get(process_key)
@@ -0,0 +1,143 @@
+# Area: Heartbeat Monitoring
+# PRD: docs/prd-heartbeat-monitoring.md
+"""Event-driven heartbeat table backed by Linux inotify (via ctypes).
+
+Heartbeat directories are watched for close-write and rename events and
+only the file that changed is re-parsed. Files whose directory cannot be
+watched (non-Linux, missing directory, network filesystem) are read on
+every call through the normal polling reader.
+"""
+
+import ctypes
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, Iterable
+
+from src.heartbeat.reader import HeartbeatData, read_heartbeat
+
+IN_MODIFY_MASK = 0x8 | 0x40 | 0x80 | 0x200  # CLOSE_WRITE, MOVED_FROM/TO, DELETE
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT = struct.Struct("iIII")
+
+# statfs f_type values for filesystems where inotify misses remote writes
+_NO_INOTIFY_FS = {
+    0x6969,      # NFS
+    0x517B,      # SMB
+    0xFF534D42,  # CIFS
+    0xFE534D42,  # SMB2
+    0x65735546,  # FUSE
+    0x00C36400,  # Ceph
+    0x01021997,  # 9P
+    0x5346414F,  # AFS
+}
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+
+_libc = _load_libc()
+
+
+def _fs_supports_inotify(directory: Path) -> bool:
+    """Return False for network/FUSE filesystems (or if statfs fails)."""
+    buf = ctypes.create_string_buffer(256)
+    if _libc.statfs(os.fsencode(directory), buf) != 0:
+        return False
+    f_type = ctypes.c_long.from_buffer(buf).value & 0xFFFFFFFF
+    return f_type not in _NO_INOTIFY_FS
+
+
+class HeartbeatWatcher:
+    """In-memory HeartbeatData table kept current by inotify events."""
+
+    def __init__(
+        self,
+        paths: Iterable[Path | str],
+        fallback: Callable[[Path], HeartbeatData | None] = read_heartbeat,
+    ) -> None:
+        self._fallback = fallback
+        self._table: dict[Path, HeartbeatData | None] = {}
+        self._dirs: dict[int, Path] = {}
+        self._fd = -1
+        if _libc is not None:
+            self._fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        for path in paths:
+            self._add(Path(path))
+
+    def _add(self, path: Path) -> None:
+        directory = path.parent
+        if self._fd < 0 or not directory.is_dir():
+            return
+        if not _fs_supports_inotify(directory):
+            return
+        wd = _libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), IN_MODIFY_MASK
+        )
+        if wd < 0:
+            return
+        self._dirs[wd] = directory
+        self._table[path] = read_heartbeat(path)
+
+    def refresh(self) -> int:
+        """Apply pending events. Returns the number of files re-parsed."""
+        changed: set[Path] = set()
+        while self._fd >= 0:
+            try:
+                buf = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            changed |= self._parse_events(buf)
+        for path in changed:
+            if path in self._table:
+                self._table[path] = read_heartbeat(path)
+        return len(changed & self._table.keys())
+
+    def _parse_events(self, buf: bytes) -> set[Path]:
+        changed: set[Path] = set()
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+            offset += _EVENT.size
+            name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                changed |= self._table.keys()
+            elif mask & IN_IGNORED:
+                self._drop_dir(self._dirs.pop(wd, None))
+            elif wd in self._dirs and name:
+                changed.add(self._dirs[wd] / os.fsdecode(name))
+        return changed
+
+    def _drop_dir(self, directory: Path | None) -> None:
+        """Watch removed (directory deleted/unmounted): poll its files."""
+        for path in [p for p in self._table if p.parent == directory]:
+            del self._table[path]
+
+    def read(self, path: Path) -> HeartbeatData | None:
+        """Drop-in for read_heartbeat: table hit or polling fallback."""
+        path = Path(path)
+        if path in self._table:
+            return self._table[path]
+        return self._fallback(path)
+
+    @property
+    def watched_paths(self) -> set[Path]:
+        return set(self._table)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._table.clear()
+        self._dirs.clear()
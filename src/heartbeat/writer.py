@@ -39,6 +39,8 @@ class HeartbeatWriter:
         filename = heartbeat_filename or f"{process_key}.json"
         self._path = self._dir / filename
         self._iteration = 0
+        self._start_time: tuple[int, int | None] | None = None
+        self._dir_ready = False
 
     def beat(self, status: str = "running") -> None:
         """Write a heartbeat. Call this on every polling iteration.
@@ -47,16 +49,10 @@ class HeartbeatWriter:
             status: Process status. Use "running" when healthy, "error" when
                     the process is running but not functioning correctly.
         """
-        self._dir.mkdir(parents=True, exist_ok=True)
         self._iteration += 1
-        data = {
-            "process_key": self._process_key,
-            "pid": os.getpid(),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "status": status,
-            "iteration": self._iteration,
-        }
-        self._write_atomic(data)
+        self._write_atomic(
+            self._payload(status, datetime.now(timezone.utc), self._iteration)
+        )
 
     def stop(self) -> None:
         """Remove heartbeat file on clean shutdown."""
@@ -65,11 +61,48 @@ class HeartbeatWriter:
         except FileNotFoundError:
             pass
 
+    def _payload(self, status: str, timestamp: datetime, iteration: int) -> dict:
+        data = {
+            "process_key": self._process_key,
+            "pid": os.getpid(),
+            "timestamp": timestamp.isoformat(),
+            "status": status,
+            "iteration": iteration,
+        }
+        start_time = self._process_start_time()
+        if start_time is not None:
+            data["start_time"] = start_time
+        return data
+
+    def _process_start_time(self) -> int | None:
+        """Start time of this PID in clock ticks (Linux), for reuse checks.
+
+        Cached per PID so a fork after construction reports its own value.
+        """
+        pid = os.getpid()
+        if self._start_time is None or self._start_time[0] != pid:
+            try:
+                stat = Path("/proc/self/stat").read_text()
+                value = int(stat[stat.rindex(")") + 2:].split()[19])
+            except (OSError, ValueError, IndexError):
+                value = None
+            self._start_time = (pid, value)
+        return self._start_time[1]
+
     def _write_atomic(self, data: dict) -> None:
-        """Write JSON file atomically using tempfile + os.replace."""
-        fd, tmp = tempfile.mkstemp(
-            dir=str(self._dir), suffix=".tmp"
-        )
+        """Write JSON file atomically using tempfile + os.replace.
+
+        The directory is created on first write (and again if it vanishes),
+        not on every beat.
+        """
+        if not self._dir_ready:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        try:
+            fd, tmp = tempfile.mkstemp(dir=str(self._dir), suffix=".tmp")
+        except FileNotFoundError:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=str(self._dir), suffix=".tmp")
         try:
             with os.fdopen(fd, "w") as f:
                 json.dump(data, f)
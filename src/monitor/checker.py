@@ -5,11 +5,15 @@
 import os
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable
 
-from src.config.config_loader import get_process_configs
+from src.config.config_loader import get_global_options, get_process_configs
 from src.config.constants import ProcessHealth
-from src.heartbeat.reader import read_heartbeat
+from src.heartbeat.reader import HeartbeatData
+from src.heartbeat.source import load_tables, read_process_heartbeat
 from src.monitor.models import CheckResult, MonitorReport
+from src.monitor.pool import run_bounded
+from src.monitor.procscan import ProcSnapshot
 
 
 def is_pid_alive(pid: int) -> bool:
@@ -21,16 +25,29 @@ def is_pid_alive(pid: int) -> bool:
         return False
 
 
+HeartbeatReader = Callable[[Path], HeartbeatData | None]
+
+
 def check_process(
     process_key: str,
     process_config: dict,
+    reader: HeartbeatReader | None = None,
+    snapshot: ProcSnapshot | None = None,
+    tables: dict | None = None,
 ) -> CheckResult:
-    """Check a single process's health via its heartbeat file."""
-    heartbeat_path = Path(process_config["heartbeat_path"])
+    """Check a single process's health via its heartbeat file.
+
+    `reader` replaces read_heartbeat, e.g. with HeartbeatWatcher.read.
+    With a /proc `snapshot`, liveness comes from the snapshot and a PID
+    whose start time differs from the heartbeat's counts as stale.
+    `tables` holds preloaded shared-memory heartbeat tables.
+    """
     timeout = process_config["timeout_seconds"]
     display = process_config["display_name"]
 
-    heartbeat = read_heartbeat(heartbeat_path)
+    heartbeat = read_process_heartbeat(
+        process_key, process_config, reader, tables
+    )
 
     if heartbeat is None:
         return CheckResult(
@@ -46,12 +63,19 @@ def check_process(
     now = datetime.now(timezone.utc)
     elapsed = (now - heartbeat.timestamp).total_seconds()
 
-    if not is_pid_alive(heartbeat.pid):
+    if snapshot is not None:
+        alive = snapshot.is_alive(heartbeat.pid, heartbeat.start_time)
+    else:
+        alive = is_pid_alive(heartbeat.pid)
+
+    if not alive:
         health = ProcessHealth.STALE_PID
     elif elapsed > timeout:
         health = ProcessHealth.TIMED_OUT
     elif heartbeat.status != "running":
         health = ProcessHealth.ERROR_STATUS
+    elif _loop_lagging(heartbeat, process_config):
+        health = ProcessHealth.DEGRADED
     else:
         health = ProcessHealth.HEALTHY
 
@@ -63,16 +87,57 @@ def check_process(
         last_heartbeat=heartbeat.timestamp,
         elapsed_seconds=elapsed,
         timeout_seconds=timeout,
+        start_time=heartbeat.start_time,
+    )
+
+
+def _loop_lagging(heartbeat: HeartbeatData, process_config: dict) -> bool:
+    """True if the reported event-loop lag exceeds max_loop_lag."""
+    max_lag = process_config.get("max_loop_lag")
+    return (
+        max_lag is not None
+        and heartbeat.loop_lag is not None
+        and heartbeat.loop_lag > max_lag
     )
 
 
-def check_all_processes(config: dict) -> MonitorReport:
-    """Check all enabled processes and return a MonitorReport."""
+def check_all_processes(
+    config: dict, reader: HeartbeatReader | None = None
+) -> MonitorReport:
+    """Check all enabled processes and return a MonitorReport.
+
+    Checks run on a bounded pool of `check_workers` threads. A check that
+    has not finished `read_deadline` seconds after it started is reported
+    as READ_TIMEOUT instead of holding up the rest of the fleet. Results
+    are always in config order. PID liveness for the whole cycle comes
+    from a single /proc scan where available, and each shared-memory
+    heartbeat table is read once.
+    """
     enabled = get_process_configs(config)
+    opts = get_global_options(config)
+    snapshot = ProcSnapshot.scan()
+    tables = load_tables(enabled)
 
     report = MonitorReport(timestamp=datetime.now(timezone.utc))
-    for key, proc_config in enabled.items():
-        result = check_process(key, proc_config)
-        report.results.append(result)
-
+    results = run_bounded(
+        enabled,
+        lambda key, proc: check_process(key, proc, reader, snapshot, tables),
+        workers=opts["check_workers"],
+        deadline=opts["read_deadline"],
+        on_timeout=_read_timeout_result,
+    )
+    report.results = [results[key] for key in enabled]
     return report
+
+
+def _read_timeout_result(process_key: str, process_config: dict) -> CheckResult:
+    """Result for a process whose heartbeat could not be read in time."""
+    return CheckResult(
+        process_key=process_key,
+        display_name=process_config["display_name"],
+        health=ProcessHealth.READ_TIMEOUT,
+        pid=None,
+        last_heartbeat=None,
+        elapsed_seconds=None,
+        timeout_seconds=process_config["timeout_seconds"],
+    )
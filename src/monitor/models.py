@@ -17,6 +17,7 @@ class CheckResult:
     last_heartbeat: datetime | None
     elapsed_seconds: float | None
     timeout_seconds: float
+    start_time: int | None = None
 
 
 @dataclass
@@ -0,0 +1,84 @@
+# Area: Heartbeat Monitoring
+# PRD: docs/prd-heartbeat-monitoring.md
+"""Bounded thread pool with per-task deadlines for fleet-wide work."""
+
+import queue
+import threading
+import time
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run_bounded(
+    items: dict[str, T],
+    fn: Callable[[str, T], R],
+    workers: int,
+    deadline: float | None = None,
+    on_timeout: Callable[[str, T], R] | None = None,
+) -> dict[str, R]:
+    """Run fn(key, item) for every entry with at most `workers` in flight.
+
+    If `deadline` is set, a task still running `deadline` seconds after it
+    started is given on_timeout(key, item) as its result and its worker is
+    replaced. Workers are daemon threads, so a task stuck in a hung read is
+    abandoned rather than joined. Returns results keyed like `items`;
+    the first exception raised by fn is re-raised once all tasks settle.
+    """
+    if deadline is not None and on_timeout is None:
+        raise ValueError("run_bounded: a deadline needs an on_timeout result")
+    if not items:
+        return {}
+
+    jobs: queue.SimpleQueue = queue.SimpleQueue()
+    for entry in items.items():
+        jobs.put(entry)
+
+    results: dict[str, R] = {}
+    errors: list[BaseException] = []
+    started: dict[str, float] = {}
+    done = threading.Condition()
+
+    def worker() -> None:
+        while True:
+            try:
+                key, item = jobs.get_nowait()
+            except queue.Empty:
+                return
+            with done:
+                started[key] = time.monotonic()
+            try:
+                result = fn(key, item)
+            except BaseException as e:
+                errors.append(e)
+                result = None
+            with done:
+                results.setdefault(key, result)
+                done.notify()
+
+    def spawn() -> None:
+        threading.Thread(target=worker, name="watchdog-pool", daemon=True).start()
+
+    for _ in range(max(1, min(workers, len(items)))):
+        spawn()
+
+    with done:
+        while len(results) < len(items):
+            if deadline is None:
+                done.wait()
+                continue
+            now = time.monotonic()
+            for key, t0 in started.items():
+                if key not in results and now - t0 >= deadline:
+                    results[key] = on_timeout(key, items[key])
+                    spawn()
+            waits = [
+                t0 + deadline - now
+                for key, t0 in started.items() if key not in results
+            ]
+            done.wait(timeout=max(min(waits, default=deadline), 0.01))
+
+    if errors:
+        raise errors[0]
+    return results
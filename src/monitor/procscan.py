@@ -0,0 +1,97 @@
+# Area: Heartbeat Monitoring
+# PRD: docs/prd-heartbeat-monitoring.md
+"""Per-cycle /proc snapshot for batched PID liveness and identity checks."""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+PROC_ROOT = Path("/proc")
+DEAD_STATES = {"Z", "X", "x"}
+
+
+@dataclass
+class ProcEntry:
+    pid: int
+    start_time: int  # clock ticks since boot, field 22 of /proc/<pid>/stat
+    state: str
+    cmdline: str
+
+
+def read_proc_entry(pid: int, proc_root: Path = PROC_ROOT) -> ProcEntry | None:
+    """Read one process's stat/cmdline. Returns None if it does not exist."""
+    base = proc_root / str(pid)
+    try:
+        stat = (base / "stat").read_text()
+        cmdline = (base / "cmdline").read_bytes()
+    except (FileNotFoundError, ProcessLookupError, NotADirectoryError):
+        return None
+    except OSError:
+        return None
+    # comm (field 2) may contain spaces/parens: split after the last ')'
+    fields = stat[stat.rindex(")") + 2:].split()
+    return ProcEntry(
+        pid=pid,
+        start_time=int(fields[19]),
+        state=fields[0],
+        cmdline=cmdline.replace(b"\0", b" ").decode(errors="replace").strip(),
+    )
+
+
+class ProcSnapshot:
+    """PIDs present in /proc at scan time, with lazily read details.
+
+    Liveness for any number of PIDs costs one directory listing; stat and
+    cmdline are read only for PIDs that are actually looked up.
+    """
+
+    def __init__(self, pids: set[int], proc_root: Path = PROC_ROOT) -> None:
+        self._pids = pids
+        self._root = proc_root
+        self._entries: dict[int, ProcEntry | None] = {}
+
+    @classmethod
+    def scan(cls, proc_root: Path = PROC_ROOT) -> "ProcSnapshot | None":
+        """List /proc once. Returns None where /proc is unavailable."""
+        try:
+            names = os.listdir(proc_root)
+        except OSError:
+            return None
+        return cls({int(n) for n in names if n.isdigit()}, proc_root)
+
+    def get(self, pid: int) -> ProcEntry | None:
+        if pid not in self._pids:
+            return None
+        if pid not in self._entries:
+            self._entries[pid] = read_proc_entry(pid, self._root)
+        return self._entries[pid]
+
+    def is_alive(self, pid: int, start_time: int | None = None) -> bool:
+        """True if pid is running and, when given, started at start_time.
+
+        A start_time mismatch means the PID was recycled by another process.
+        A PID missing from the listing may have started after the scan or
+        be hidden by hidepid, so it is probed with a signal before it is
+        reported dead.
+        """
+        if pid in self._pids:
+            entry = self.get(pid)
+        elif _signal_probe(pid):
+            entry = read_proc_entry(pid, self._root)
+            if entry is None:  # hidden from us: the probe is all we have
+                return True
+        else:
+            return False
+        if entry is None or entry.state in DEAD_STATES:
+            return False
+        return start_time is None or entry.start_time == start_time
+
+
+def _signal_probe(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
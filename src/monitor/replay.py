@@ -0,0 +1,150 @@
+# Area: Heartbeat Monitoring
+# PRD: docs/prd-heartbeat-monitoring.md
+"""Replay recorded check history under candidate timeouts and thresholds."""
+
+import math
+import sqlite3
+from array import array
+from dataclasses import dataclass, field
+from itertools import product
+
+from src.config.constants import ProcessHealth
+from src.database.partitions import history_source
+from src.database.store import ACTION_RECOVERY
+
+# Recorded states that a different timeout could turn into the other one
+_TIMEOUT_STATES = {ProcessHealth.HEALTHY.value, ProcessHealth.TIMED_OUT.value}
+
+
+@dataclass
+class ReplayTrace:
+    """One process's checks as parallel columns (epoch seconds)."""
+    checked: array = field(default_factory=lambda: array("d"))
+    heartbeat: array = field(default_factory=lambda: array("d"))
+    elapsed: array = field(default_factory=lambda: array("d"))
+    fixed_unhealthy: bytearray = field(default_factory=bytearray)
+    recovered: bytearray = field(default_factory=bytearray)
+
+    def append(
+        self, checked: float, heartbeat: float | None, elapsed: float | None,
+        health: str, action: str | None,
+    ) -> None:
+        heartbeat = math.nan if heartbeat is None else heartbeat
+        if elapsed is None:
+            elapsed = checked - heartbeat  # nan without a heartbeat
+        self.checked.append(checked)
+        self.heartbeat.append(heartbeat)
+        self.elapsed.append(elapsed)
+        self.fixed_unhealthy.append(health not in _TIMEOUT_STATES)
+        self.recovered.append(action == ACTION_RECOVERY)
+
+
+@dataclass
+class ReplayOutcome:
+    timeout_seconds: float
+    threshold: int
+    recoveries: int = 0
+    false_positives: int = 0
+    missed: int = 0
+    latencies: list[float] = field(default_factory=list, repr=False)
+
+    @property
+    def mean_latency(self) -> float | None:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else None
+
+    @property
+    def max_latency(self) -> float | None:
+        return max(self.latencies) if self.latencies else None
+
+
+_EPOCH = "(julianday({}) - 2440587.5) * 86400.0"
+
+_TRACE_ROWS = f"""SELECT process_key, {_EPOCH.format("checked_at")},
+   {_EPOCH.format("heartbeat_ts")}, elapsed_seconds, health, action_taken,
+   repeats, {_EPOCH.format("last_checked_at")}
+   FROM {{history}} WHERE checked_at >= ?"""
+
+
+def load_traces(
+    conn: sqlite3.Connection,
+    since: str | None = None,
+    process_key: str | None = None,
+) -> dict[str, ReplayTrace]:
+    """Stream check_history into per-process traces.
+
+    Timestamps are converted to epoch seconds inside SQLite. A row with
+    repeats (change-only mode) becomes 1 + repeats checks spread evenly up
+    to last_checked_at, as in get_history(expand=True).
+    """
+    sql, params = _TRACE_ROWS.format(history=history_source(conn, since=since)), [since or ""]
+    if process_key is not None:
+        sql += " AND process_key = ?"
+        params.append(process_key)
+    sql += " ORDER BY process_key, checked_at, id"
+    traces: dict[str, ReplayTrace] = {}
+    rows = conn.execute(sql, params)
+    for key, checked, hb, elapsed, health, action, repeats, last in rows:
+        trace = traces.get(key) or traces.setdefault(key, ReplayTrace())
+        count = 1 + repeats if repeats and last is not None else 1
+        step = (last - checked) / repeats if count > 1 else 0.0
+        for i in range(count):
+            trace.append(checked + step * i, hb, elapsed, health, action)
+    return traces
+
+
+def _unhealthy_runs(trace: ReplayTrace, timeout: float) -> list[tuple]:
+    """(start, length, ended_healthy, recorded_recovery) per unhealthy run.
+
+    Mirrors check_process: a check is unhealthy if it was recorded in a
+    timeout-independent failure state or its heartbeat age exceeds timeout.
+    """
+    runs, start = [], None
+    n = len(trace.checked)
+    for i in range(n + 1):
+        bad = i < n and (trace.fixed_unhealthy[i] or trace.elapsed[i] > timeout)
+        if bad and start is None:
+            start = i
+        elif not bad and start is not None:
+            recorded = any(trace.recovered[start:i])
+            runs.append((start, i - start, i < n, recorded))
+            start = None
+    return runs
+
+
+def _score(trace: ReplayTrace, runs: list[tuple], out: ReplayOutcome) -> None:
+    """Apply the _run_checks rule (fire at failures >= threshold, then reset)."""
+    threshold = out.threshold
+    for start, length, ended_healthy, recorded in runs:
+        fired = length // threshold
+        if not fired:
+            out.missed += recorded
+            continue
+        out.recoveries += fired
+        if ended_healthy and not recorded:
+            out.false_positives += fired
+        onset = trace.heartbeat[start]
+        if math.isnan(onset):
+            onset = trace.checked[start]
+        out.latencies.append(trace.checked[start + threshold - 1] - onset)
+
+
+def sweep(
+    traces: dict[str, ReplayTrace],
+    timeouts: list[float],
+    thresholds: list[int],
+) -> list[ReplayOutcome]:
+    """Evaluate every (timeout, threshold) pair over all traces.
+
+    Each timeout classifies every check once; every threshold is then
+    scored from the resulting run lengths alone, so the grid costs one
+    pass per timeout plus one pass over the runs per threshold.
+    """
+    outcomes = {
+        (t, k): ReplayOutcome(t, k) for t, k in product(timeouts, thresholds)
+    }
+    for trace in traces.values():
+        for timeout in timeouts:
+            runs = _unhealthy_runs(trace, timeout)
+            for threshold in thresholds:
+                _score(trace, runs, outcomes[(timeout, threshold)])
+    return list(outcomes.values())
@@ -0,0 +1,61 @@
+# Area: Recovery Pipeline
+# PRD: docs/prd-recovery-pipeline.md
+"""Crash-loop protection: restart backoff and a per-process circuit breaker."""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+@dataclass
+class RecoveryGate:
+    allowed: bool
+    attempts: int  # recovery attempts inside the crash-loop window
+    retry_at: datetime | None = None
+    circuit_open: bool = False
+
+
+def backoff_delay(process_key: str, attempts: list[datetime], opts: dict) -> float:
+    """Seconds to wait after the last attempt before the next one.
+
+    crash_backoff_base doubled for every attempt after the first, capped
+    at crash_backoff_max, then shortened by up to crash_backoff_jitter
+    (a fraction) so processes that crashed together do not all restart
+    together. The jitter is seeded by the process and its last attempt,
+    so every cron run computes the same delay for the same history.
+    """
+    if not attempts:
+        return 0.0
+    delay = min(
+        opts["crash_backoff_base"] * 2 ** (len(attempts) - 1),
+        opts["crash_backoff_max"],
+    )
+    rng = random.Random(f"{process_key}@{attempts[-1].isoformat()}")
+    return delay * (1 - opts["crash_backoff_jitter"] * rng.random())
+
+
+def recovery_gate(
+    process_key: str, attempts: list[datetime], now: datetime, opts: dict
+) -> RecoveryGate:
+    """Decide whether a process may be recovered now.
+
+    `attempts` are its recovery start times within crash_loop_window
+    seconds of `now`, oldest first. With crash_loop_max_attempts of them
+    the circuit is open and recovery stops until the oldest ages out of
+    the window. Otherwise the next attempt waits for backoff_delay after
+    the last one.
+    """
+    limit = opts["crash_loop_max_attempts"]
+    if limit and len(attempts) >= limit:
+        window = timedelta(seconds=opts["crash_loop_window"])
+        return RecoveryGate(
+            allowed=False, attempts=len(attempts),
+            retry_at=attempts[-limit] + window, circuit_open=True,
+        )
+    if attempts:
+        retry_at = attempts[-1] + timedelta(
+            seconds=backoff_delay(process_key, attempts, opts)
+        )
+        if now < retry_at:
+            return RecoveryGate(allowed=False, attempts=len(attempts), retry_at=retry_at)
+    return RecoveryGate(allowed=True, attempts=len(attempts))
@@ -0,0 +1,98 @@
+# Area: Recovery Pipeline
+# PRD: docs/prd-recovery-pipeline.md
+"""Dependency graph of recovery actions and a runner for it."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, TypeVar
+
+R = TypeVar("R")
+
+
+def action_graph(
+    actions: list[str], dependencies: dict[str, list[str]] | None = None
+) -> dict[str, list[str]]:
+    """Map each action to the actions it waits for, in `actions` order.
+
+    Without `dependencies` every action waits for the one before it (the
+    plain list order). With them, a listed action waits only for its
+    declared dependencies, and an unlisted one still waits for the action
+    before it. Either way `kill` waits for nothing and every other action
+    waits for it, and `start` waits for every other action, so nothing
+    runs alongside the old instance or after the new one is started.
+    Dependencies on actions not in `actions` (e.g. disabled ones) are
+    dropped.
+    """
+    graph = {}
+    for i, action in enumerate(actions):
+        if dependencies is not None and action in dependencies:
+            graph[action] = [d for d in dependencies[action] if d in actions]
+        else:
+            graph[action] = actions[i - 1:i]
+    if dependencies is None:
+        return graph
+    for action, deps in graph.items():
+        if action == "kill":
+            deps.clear()
+        elif "kill" in graph and "kill" not in deps:
+            deps.append("kill")
+    if "start" in graph:
+        graph["start"] = [a for a in actions if a != "start"]
+    return graph
+
+
+def find_cycle(graph: dict[str, list[str]]) -> list[str] | None:
+    """Return one dependency cycle as a list of actions, or None."""
+    visiting: list[str] = []
+    done: set[str] = set()
+
+    def visit(action: str) -> list[str] | None:
+        if action in visiting:
+            return visiting[visiting.index(action):] + [action]
+        if action in done or action not in graph:
+            return None
+        visiting.append(action)
+        for dep in graph[action]:
+            if cycle := visit(dep):
+                return cycle
+        visiting.pop()
+        done.add(action)
+        return None
+
+    for action in graph:
+        if cycle := visit(action):
+            return cycle
+    return None
+
+
+def run_graph(
+    graph: dict[str, list[str]],
+    execute: Callable[[str], R],
+    is_fatal: Callable[[str, R], bool],
+) -> tuple[dict[str, R], str | None]:
+    """Run every action once its dependencies finished, ready ones in parallel.
+
+    Once an action's outcome is fatal, nothing new is started; actions
+    already running are allowed to finish. Returns the outcomes of the
+    actions that ran and the fatal action (or None).
+    """
+    if cycle := find_cycle(graph):
+        raise ValueError(f"Recovery actions form a cycle: {' -> '.join(cycle)}")
+
+    outcomes: dict[str, R] = {}
+    running: dict[Future, str] = {}
+    fatal = None
+    with ThreadPoolExecutor(max_workers=max(1, len(graph))) as pool:
+        while True:
+            if fatal is None:
+                for action, deps in graph.items():
+                    started = action in outcomes or action in running.values()
+                    if not started and all(d in outcomes for d in deps):
+                        running[pool.submit(execute, action)] = action
+            if not running:
+                return outcomes, fatal
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                action = running.pop(future)
+                outcomes[action] = future.result()
+                if fatal is None and is_fatal(action, outcomes[action]):
+                    fatal = action
@@ -3,15 +3,20 @@
 """Orchestrate config-driven recovery pipeline."""
 
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
 from src.config.config_loader import get_effective_recovery_actions
 from src.logging.logger import get_logger
+from src.pipeline.dag import action_graph, run_graph
 from src.recovery.killer import KillResult, kill_process
 from src.recovery.cleaner import CleanResult, run_cleanup
-from src.recovery.restarter import RestartResult, restart_process
+from src.recovery.restarter import RestartResult, heartbeat_probe, restart_process
 
 logger = get_logger("pipeline")
 
+# Actions whose failure stops the pipeline
+FATAL_ACTIONS = ("kill", "start")
+
 
 @dataclass
 class PipelineResult:
@@ -19,6 +24,10 @@ class PipelineResult:
     action_results: list[tuple[str, object]] = field(default_factory=list)
     fully_recovered: bool = False
     stage_failed: str | None = None
+    started_at: datetime | None = None
+    ended_at: datetime | None = None
+    # (started_at, ended_at) per entry of action_results
+    action_spans: list[tuple[datetime, datetime]] = field(default_factory=list)
 
     @property
     def kill_result(self) -> KillResult | None:
@@ -40,53 +49,79 @@ def run_recovery(
     pid: int | None,
     proc_config: dict,
     global_opts: dict | None = None,
+    start_time: int | None = None,
 ) -> PipelineResult:
     """Execute recovery actions defined in proc_config.
 
-    Actions are read from proc_config["recovery_actions"].
+    Actions are read from proc_config["recovery_actions"] and run in list
+    order unless proc_config["action_dependencies"] declares which actions
+    each one waits for; actions whose dependencies are done run in
+    parallel (see src/pipeline/dag.py).
     'kill' and 'start' failures stop the pipeline.
     Other action failures warn but continue.
+    start_time (from the heartbeat) lets 'kill' skip a recycled PID.
     """
-    result = PipelineResult(process_key=process_key)
+    result = PipelineResult(process_key=process_key, started_at=_now())
     actions = get_effective_recovery_actions(proc_config)
-    commands = proc_config.get("commands", {})
+    graph = action_graph(actions, proc_config.get("action_dependencies"))
     opts = global_opts or {}
 
-    for action in actions:
-        action_result = _execute_action(action, process_key, pid, commands, opts)
-        result.action_results.append((action, action_result))
-
-        if not action_result.success:
-            if action in ("kill", "start"):
-                logger.error(
-                    "%s failed for %s: %s",
-                    action, process_key, action_result.error,
-                )
-                result.stage_failed = action
-                return result
+    def execute(action: str) -> tuple[object, datetime, datetime]:
+        began = _now()
+        action_result = _execute_action(
+            action, process_key, pid, proc_config, opts, start_time
+        )
+        if not action_result.success and action not in FATAL_ACTIONS:
             logger.warning(
                 "Action '%s' failed for %s (continuing)",
                 action, process_key,
             )
+        return action_result, began, _now()
+
+    outcomes, failed = run_graph(
+        graph, execute,
+        lambda action, outcome: action in FATAL_ACTIONS and not outcome[0].success,
+    )
+    for action in actions:
+        if action in outcomes:
+            action_result, began, ended = outcomes[action]
+            result.action_results.append((action, action_result))
+            result.action_spans.append((began, ended))
+    result.ended_at = max((end for _, end in result.action_spans), default=None)
+
+    if failed:
+        logger.error(
+            "%s failed for %s: %s",
+            failed, process_key, outcomes[failed][0].error,
+        )
+        result.stage_failed = failed
+        return result
 
     result.fully_recovered = True
+    result.ended_at = result.ended_at or _now()
     logger.info("Process %s recovered", process_key)
     return result
 
 
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 def _execute_action(
     action: str,
     process_key: str,
     pid: int | None,
-    commands: dict,
+    proc_config: dict,
     opts: dict,
+    start_time: int | None = None,
 ) -> KillResult | CleanResult | RestartResult:
     """Execute a single recovery action."""
+    commands = proc_config.get("commands", {})
     if action == "kill":
         if pid is not None:
             logger.info("Killing %s (PID %d)", process_key, pid)
             timeout = opts.get("kill_timeout", 10.0)
-            return kill_process(pid, timeout=timeout)
+            return kill_process(pid, timeout=timeout, start_time=start_time)
         logger.info("No PID for %s, skipping kill", process_key)
         return KillResult(success=True, pid=0)
 
@@ -94,7 +129,14 @@ def _execute_action(
         cmd = commands["start"]
         logger.info("Starting %s: %s", process_key, cmd)
         verify_delay = opts.get("verify_delay", 2.0)
-        return restart_process(cmd, verify_delay=verify_delay)
+        ready_timeout = opts.get("ready_timeout", 30.0)
+        ready = (
+            heartbeat_probe(process_key, proc_config, pid, _now())
+            if ready_timeout > 0 else None
+        )
+        return restart_process(
+            cmd, verify_delay=verify_delay, ready=ready, ready_timeout=ready_timeout
+        )
 
     # Generic script action (clear_db, clear_email_logs, etc.)
     script = commands[action]
@@ -0,0 +1,49 @@
+# Area: Recovery Pipeline
+# PRD: docs/prd-recovery-pipeline.md
+"""Run recovery pipelines for several processes concurrently."""
+
+from datetime import datetime, timezone
+from typing import Callable
+
+from src.logging.logger import get_logger
+from src.monitor.models import CheckResult
+from src.monitor.pool import run_bounded
+from src.pipeline.recovery_pipeline import PipelineResult, run_recovery
+
+logger = get_logger("pipeline")
+
+
+def run_recoveries(
+    due: list[CheckResult],
+    enabled: dict[str, dict],
+    global_opts: dict,
+    run: Callable[..., PipelineResult] = run_recovery,
+) -> list[PipelineResult]:
+    """Recover every process in `due`, at most `recovery_concurrency` at once.
+
+    Each pipeline runs its ready actions in parallel (see run_graph), so
+    up to recovery_concurrency x (independent actions per process) can
+    be in flight at once. Results come back in the order of `due` so
+    callers record them deterministically. A pipeline that raises is
+    logged and returned as a failed result instead of losing the others.
+    """
+    def recover(key: str, result: CheckResult) -> PipelineResult:
+        began = datetime.now(timezone.utc)
+        try:
+            return run(
+                process_key=key,
+                pid=result.pid,
+                proc_config=enabled[key],
+                global_opts=global_opts,
+                start_time=result.start_time,
+            )
+        except Exception:
+            logger.exception("Recovery of %s raised", key)
+            return PipelineResult(process_key=key, started_at=began, ended_at=datetime.now(timezone.utc))
+
+    results = run_bounded(
+        {result.process_key: result for result in due},
+        recover,
+        workers=global_opts["recovery_concurrency"],
+    )
+    return [results[result.process_key] for result in due]
@@ -4,9 +4,14 @@
 
 import os
 import signal
-import time
 from dataclasses import dataclass
 
+from src.monitor.procscan import DEAD_STATES, read_proc_entry
+from src.recovery.waiter import open_pidfd, send_signal, wait_for_exit
+
+# Longest wait for the kernel to reap a SIGKILLed process
+SIGKILL_GRACE = 1.0
+
 
 @dataclass
 class KillResult:
@@ -16,44 +21,58 @@ class KillResult:
 
 
 def is_process_running(pid: int) -> bool:
-    """Check if a PID is still alive."""
+    """Check if a PID is still alive. Zombies count as exited."""
     try:
         os.kill(pid, 0)
-        return True
     except ProcessLookupError:
         return False
     except PermissionError:
         return True
+    entry = read_proc_entry(pid)
+    return entry is None or entry.state not in DEAD_STATES
 
 
-def kill_process(pid: int, timeout: float = 10.0) -> KillResult:
+def kill_process(
+    pid: int, timeout: float = 10.0, start_time: int | None = None
+) -> KillResult:
     """Kill a process: SIGTERM first, then SIGKILL after timeout.
 
     Returns KillResult. If the process is already dead, returns success.
+    If start_time is given (from the heartbeat) and the PID now belongs to
+    a process with a different start time, the PID was recycled: nothing
+    is signalled and the original process is treated as already dead.
+
+    Exit is awaited on a pidfd where the kernel supports it, so the call
+    returns as soon as the process is gone; otherwise /proc is polled
+    with backoff. Signals go through the pidfd too, so a PID recycled
+    after the start-time check is never signalled.
     """
     try:
-        os.kill(pid, signal.SIGTERM)
+        pidfd = open_pidfd(pid)
     except ProcessLookupError:
         return KillResult(success=True, pid=pid)
-    except PermissionError as e:
-        return KillResult(success=False, pid=pid, error=str(e))
+    try:
+        if start_time is not None:
+            entry = read_proc_entry(pid)
+            if entry is not None and entry.start_time != start_time:
+                return KillResult(success=True, pid=pid)
+        return _terminate(pid, pidfd, timeout)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
 
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        if not is_process_running(pid):
-            return KillResult(success=True, pid=pid)
-        time.sleep(0.5)
 
-    try:
-        os.kill(pid, signal.SIGKILL)
-    except ProcessLookupError:
-        return KillResult(success=True, pid=pid)
-    except PermissionError as e:
-        return KillResult(success=False, pid=pid, error=str(e))
-
-    time.sleep(1.0)
-    if is_process_running(pid):
-        return KillResult(
-            success=False, pid=pid, error="Process survived SIGKILL"
-        )
-    return KillResult(success=True, pid=pid)
+def _terminate(pid: int, pidfd: int | None, timeout: float) -> KillResult:
+    def running() -> bool:
+        return is_process_running(pid)
+
+    for sig, wait in ((signal.SIGTERM, timeout), (signal.SIGKILL, SIGKILL_GRACE)):
+        try:
+            send_signal(pid, pidfd, sig)
+        except ProcessLookupError:
+            return KillResult(success=True, pid=pid)
+        except PermissionError as e:
+            return KillResult(success=False, pid=pid, error=str(e))
+        if wait_for_exit(pidfd, running, wait):
+            return KillResult(success=True, pid=pid)
+    return KillResult(success=False, pid=pid, error="Process survived SIGKILL")
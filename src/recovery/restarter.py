@@ -5,6 +5,15 @@
 import subprocess
 import time
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from src.config.constants import DEFAULT_READY_TIMEOUT
+from src.heartbeat.reader import HeartbeatData
+from src.heartbeat.source import read_process_heartbeat
+from src.recovery.waiter import wait_polling
+
+ReadyProbe = Callable[[], HeartbeatData | None]
 
 
 @dataclass
@@ -16,13 +25,19 @@ class RestartResult:
 
 
 def restart_process(
-    command: str, verify_delay: float = 2.0
+    command: str,
+    verify_delay: float = 2.0,
+    ready: ReadyProbe | None = None,
+    ready_timeout: float = DEFAULT_READY_TIMEOUT,
 ) -> RestartResult:
     """Start a process via shell command, detached from Watchdog.
 
     Uses start_new_session=True so the child survives after
-    Watchdog (cron) exits. Waits verify_delay seconds, then
-    checks if the process is still alive.
+    Watchdog (cron) exits. Without `ready`, waits verify_delay seconds,
+    then checks if the shell is still alive. With `ready` (see
+    heartbeat_probe), polls it with backoff and succeeds as soon as it
+    returns a heartbeat, reporting the heartbeat's PID; it fails if the
+    command exits non-zero or nothing shows up within ready_timeout.
     """
     try:
         proc = subprocess.Popen(
@@ -38,6 +53,9 @@ def restart_process(
             success=False, command=command, error=str(e)
         )
 
+    if ready is not None:
+        return _await_ready(proc, command, ready, ready_timeout)
+
     time.sleep(verify_delay)
 
     if proc.poll() is not None:
@@ -49,3 +67,50 @@ def restart_process(
         )
 
     return RestartResult(success=True, pid=proc.pid, command=command)
+
+
+def _await_ready(
+    proc: subprocess.Popen, command: str, ready: ReadyProbe, timeout: float
+) -> RestartResult:
+    """Wait for ready() to return a heartbeat. A shell exiting 0 is fine
+    (the command may daemonize); a non-zero exit fails immediately."""
+    found: list[HeartbeatData] = []
+
+    def waiting() -> bool:
+        heartbeat = ready()
+        if heartbeat is not None:
+            found.append(heartbeat)
+            return False
+        return proc.poll() in (None, 0)
+
+    wait_polling(waiting, timeout)
+    if found:
+        return RestartResult(success=True, pid=found[0].pid, command=command)
+    code = proc.poll()
+    if code not in (None, 0):
+        error = f"Process exited with code {code} before a heartbeat"
+    else:
+        error = f"No fresh heartbeat within {timeout:g}s"
+    return RestartResult(success=False, pid=proc.pid, command=command, error=error)
+
+
+def heartbeat_probe(
+    process_key: str, proc_config: dict, old_pid: int | None, since: datetime
+) -> ReadyProbe:
+    """Probe returning the first heartbeat written by a new process.
+
+    Fresh means written at or after `since`, status "running", and from a
+    PID other than `old_pid` (the instance being replaced).
+    """
+    def probe() -> HeartbeatData | None:
+        heartbeat = read_process_heartbeat(process_key, proc_config)
+        if (
+            heartbeat is not None
+            and heartbeat.pid != old_pid
+            and heartbeat.status == "running"
+            and heartbeat.timestamp >= since
+        ):
+            return heartbeat
+        return None
+
+    return probe
@@ -0,0 +1,70 @@
+# Area: Recovery Pipeline
+# PRD: docs/prd-recovery-pipeline.md
+"""Wait for a process to exit: pidfd where available, backoff polling otherwise."""
+
+import os
+import select
+import signal
+import time
+from typing import Callable
+
+MIN_POLL_INTERVAL = 0.005
+MAX_POLL_INTERVAL = 0.25
+
+
+def open_pidfd(pid: int) -> int | None:
+    """Open a pidfd for pid (Linux 5.3+), or None where unsupported.
+
+    Raises ProcessLookupError if pid does not exist. The pidfd keeps
+    referring to this process even if the PID is later recycled.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except ProcessLookupError:
+        raise
+    except OSError:  # ENOSYS on old kernels, blocked by seccomp, ...
+        return None
+
+
+def send_signal(pid: int, pidfd: int | None, sig: int) -> None:
+    """Signal through the pidfd when there is one, else by PID."""
+    if pidfd is not None:
+        signal.pidfd_send_signal(pidfd, sig)
+    else:
+        os.kill(pid, sig)
+
+
+def wait_pidfd(pidfd: int, timeout: float) -> bool:
+    """Block until the process exits (pidfd readable). True if it did."""
+    poller = select.poll()
+    poller.register(pidfd, select.POLLIN)
+    return bool(poller.poll(max(0, int(timeout * 1000))))
+
+
+def wait_polling(is_running: Callable[[], bool], timeout: float) -> bool:
+    """Poll is_running() with doubling intervals until False or timeout.
+
+    Starts at MIN_POLL_INTERVAL so a quick exit is noticed within a few
+    milliseconds, and caps at MAX_POLL_INTERVAL for slow shutdowns.
+    """
+    deadline = time.monotonic() + timeout
+    interval = MIN_POLL_INTERVAL
+    while True:
+        if not is_running():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+
+def wait_for_exit(
+    pidfd: int | None, is_running: Callable[[], bool], timeout: float
+) -> bool:
+    """Wait up to timeout for the process to exit. True if it did."""
+    if pidfd is not None:
+        return wait_pidfd(pidfd, timeout)
+    return wait_polling(is_running, timeout)
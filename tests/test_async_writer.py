@@ -0,0 +1,102 @@
+"""Tests for the asyncio heartbeat writer."""
+
+import asyncio
+import json
+import time
+
+from src.heartbeat.async_writer import AsyncHeartbeatWriter
+from src.heartbeat.reader import read_heartbeat
+
+
+def _read(tmp_path):
+    return json.loads((tmp_path / "svc.json").read_text())
+
+
+def test_tick_writes_heartbeat_with_lag(tmp_path):
+    async def scenario():
+        writer = AsyncHeartbeatWriter(str(tmp_path), "svc", interval=0.05)
+        writer.start()
+        writer.beat()
+        await asyncio.sleep(0.15)
+        data = _read(tmp_path)
+        await writer.stop()
+        return data
+
+    data = asyncio.run(scenario())
+    assert data["iteration"] == 1
+    assert data["status"] == "running"
+    assert 0 <= data["loop_lag"] < 0.1
+
+
+def test_blocking_call_reported_as_lag(tmp_path):
+    async def scenario():
+        writer = AsyncHeartbeatWriter(str(tmp_path), "svc", interval=0.05)
+        writer.start()
+        writer.beat()
+        await asyncio.sleep(0.06)
+        time.sleep(0.3)  # block the loop
+        await asyncio.sleep(0.01)  # overdue tick runs first
+        lag = writer.loop_lag
+        await writer.stop()
+        return lag
+
+    assert asyncio.run(scenario()) >= 0.2
+
+
+def test_hung_loop_reported_by_sentinel(tmp_path):
+    async def scenario():
+        writer = AsyncHeartbeatWriter(str(tmp_path), "svc", interval=0.05)
+        writer.start()
+        writer.beat()
+        await asyncio.sleep(0.06)
+        time.sleep(0.4)  # loop stalled: only the sentinel can write
+        data = _read(tmp_path)
+        await writer.stop()
+        return data
+
+    assert asyncio.run(scenario())["loop_lag"] >= 0.1
+
+
+def test_stop_removes_file(tmp_path):
+    async def scenario():
+        writer = AsyncHeartbeatWriter(str(tmp_path), "svc", interval=0.05)
+        writer.start()
+        writer.beat()
+        await asyncio.sleep(0.06)
+        await writer.stop()
+
+    asyncio.run(scenario())
+    assert not (tmp_path / "svc.json").exists()
+
+
+def test_reader_parses_loop_lag(tmp_path):
+    async def scenario():
+        writer = AsyncHeartbeatWriter(str(tmp_path), "svc", interval=0.05)
+        writer.start()
+        writer.beat()
+        await asyncio.sleep(0.06)
+        data = read_heartbeat(tmp_path / "svc.json")
+        await writer.stop()
+        return data
+
+    assert asyncio.run(scenario()).loop_lag is not None
+
+
+def test_ticks_without_beats_keep_last_beat_time(tmp_path):
+    """A hung coroutine stops beating; ticks must not keep the file fresh."""
+    async def scenario():
+        writer = AsyncHeartbeatWriter(str(tmp_path), "svc", interval=0.02)
+        writer.start()
+        await asyncio.sleep(0.05)
+        assert not (tmp_path / "svc.json").exists()  # no beat yet, no file
+        writer.beat()
+        await asyncio.sleep(0.05)
+        first = _read(tmp_path)
+        await asyncio.sleep(0.1)  # ticks continue, beat() does not
+        second = _read(tmp_path)
+        await writer.stop()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert second["timestamp"] == first["timestamp"]
+    assert second["iteration"] == 1
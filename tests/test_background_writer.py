@@ -0,0 +1,91 @@
+"""Tests for the background (coalescing) heartbeat writer."""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.heartbeat.background_writer import BackgroundHeartbeatWriter
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def writer(tmp_path):
+    w = BackgroundHeartbeatWriter(
+        heartbeat_dir=str(tmp_path),
+        process_key="test_process",
+        max_writes_per_second=0.5,
+    )
+    yield w
+    w.stop()
+
+
+def _read(tmp_path):
+    path = tmp_path / "test_process.json"
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def test_first_beat_written_promptly(writer, tmp_path):
+    writer.beat()
+    assert _wait_for(lambda: _read(tmp_path) is not None)
+    assert _read(tmp_path)["iteration"] == 1
+
+
+def test_many_beats_coalesce(writer, tmp_path):
+    with patch.object(writer, "_write_atomic", wraps=writer._write_atomic) as spy:
+        for _ in range(1000):
+            writer.beat()
+        assert _wait_for(lambda: spy.call_count >= 1)
+        time.sleep(0.1)
+    assert spy.call_count == 1
+    assert writer.iteration_count == 1000
+
+
+def test_status_change_flushes_immediately(writer, tmp_path):
+    writer.beat()
+    assert _wait_for(lambda: _read(tmp_path) is not None)
+    writer.beat(status="error")
+    assert _wait_for(lambda: _read(tmp_path)["status"] == "error", timeout=0.5)
+
+
+def test_flush_writes_latest_state(writer, tmp_path):
+    writer.beat()
+    writer.beat()
+    writer.flush()
+    assert _read(tmp_path)["iteration"] == 2
+    assert not writer.writes_pending
+
+
+def test_timestamp_is_beat_time(writer, tmp_path):
+    writer.beat()
+    beat_ts = writer._pending[1]
+    time.sleep(0.05)
+    writer.flush()
+    assert _read(tmp_path)["timestamp"] == beat_ts.isoformat()
+
+
+def test_stop_removes_file_and_thread(writer, tmp_path):
+    writer.beat()
+    writer.flush()
+    writer.stop()
+    assert _read(tmp_path) is None
+    assert writer._thread is None
+
+
+def test_stop_without_beat(tmp_path):
+    BackgroundHeartbeatWriter(str(tmp_path), "idle").stop()
+
+
+@pytest.mark.parametrize("rate", [0, -1.0])
+def test_rejects_non_positive_rate(tmp_path, rate):
+    with pytest.raises(ValueError):
+        BackgroundHeartbeatWriter(str(tmp_path), "p", max_writes_per_second=rate)
@@ -0,0 +1,73 @@
+"""Tests for crash-loop backoff and the circuit breaker."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.config.constants import GLOBAL_OPTION_DEFAULTS
+from src.database.recovery_log import recent_attempts, record_recovery
+from src.database.store import WatchdogStore
+from src.pipeline.backoff import backoff_delay, recovery_gate
+from src.pipeline.recovery_pipeline import PipelineResult
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+OPTS = dict(GLOBAL_OPTION_DEFAULTS)  # base 60s, max 3600s, jitter 0.2, 5 per hour
+
+
+def _attempts(*minutes):
+    return [T0 + timedelta(minutes=m) for m in minutes]
+
+
+class TestBackoffDelay:
+    def test_doubles_with_jitter(self):
+        for n in range(1, 5):
+            delay = backoff_delay("srv", _attempts(*range(n)), OPTS)
+            assert 60 * 2 ** (n - 1) * 0.8 <= delay <= 60 * 2 ** (n - 1)
+
+    def test_capped(self):
+        delay = backoff_delay("srv", _attempts(*range(20)), OPTS)
+        assert 3600 * 0.8 <= delay <= 3600
+
+    def test_jitter_stable_per_history(self):
+        attempts = _attempts(0, 1)
+        assert backoff_delay("srv", attempts, OPTS) == backoff_delay("srv", attempts, OPTS)
+        assert backoff_delay("srv", attempts, OPTS) != backoff_delay("api", attempts, OPTS)
+
+    def test_no_attempts(self):
+        assert backoff_delay("srv", [], OPTS) == 0.0
+
+
+class TestRecoveryGate:
+    def test_first_recovery_allowed(self):
+        assert recovery_gate("srv", [], T0, OPTS).allowed is True
+
+    def test_waits_for_backoff(self):
+        attempts = _attempts(0)
+        gate = recovery_gate("srv", attempts, T0 + timedelta(seconds=30), OPTS)
+        assert gate.allowed is False and gate.circuit_open is False
+        assert T0 + timedelta(seconds=48) <= gate.retry_at <= T0 + timedelta(seconds=60)
+        assert recovery_gate("srv", attempts, T0 + timedelta(seconds=61), OPTS).allowed
+
+    def test_circuit_opens_at_limit(self):
+        attempts = _attempts(0, 2, 5, 10, 20)
+        gate = recovery_gate("srv", attempts, T0 + timedelta(hours=5), OPTS)
+        assert gate.circuit_open is True
+        assert gate.retry_at == T0 + timedelta(hours=1)  # when the oldest ages out
+
+    def test_backoff_disabled(self):
+        opts = {**OPTS, "crash_backoff_base": 0}
+        assert recovery_gate("srv", _attempts(0), T0, opts).allowed is True
+
+    def test_circuit_disabled(self):
+        opts = {**OPTS, "crash_loop_max_attempts": 0, "crash_backoff_base": 0}
+        assert recovery_gate("srv", _attempts(0, 1, 2, 3, 4, 5), T0 + timedelta(minutes=5), opts).allowed is True
+
+
+def test_recent_attempts_persisted(tmp_path):
+    store = WatchdogStore(str(tmp_path / "w.db"))
+    for key, minute in (("srv", 0), ("api", 1), ("srv", 2), ("srv", 90)):
+        start = T0 + timedelta(minutes=minute)
+        record_recovery(store.connection, PipelineResult(key, started_at=start, ended_at=start))
+    since = (T0 + timedelta(minutes=1)).isoformat()
+    assert recent_attempts(store.connection, since) == {
+        "api": _attempts(1), "srv": _attempts(2, 90),
+    }
+    store.close()
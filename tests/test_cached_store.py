@@ -0,0 +1,128 @@
+"""Tests for the in-memory, write-behind watchdog store."""
+
+import queue
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.config.constants import ProcessHealth
+from src.database.cached_store import CachedWatchdogStore
+from src.database.store import WatchdogStore
+from src.monitor.models import CheckResult, MonitorReport
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "test.db")
+
+
+@pytest.fixture
+def store(db_path):
+    s = CachedWatchdogStore(db_path, flush_interval=60)
+    yield s
+    s.close()
+
+
+def _report(*healths):
+    return MonitorReport(
+        timestamp=datetime.now(timezone.utc),
+        results=[
+            CheckResult(
+                process_key=key, display_name=key,
+                health=ProcessHealth(health), pid=100,
+                last_heartbeat=None, elapsed_seconds=None, timeout_seconds=60,
+            )
+            for key, health in healths
+        ],
+    )
+
+
+def _db_failures(db_path, key):
+    reader = WatchdogStore(db_path)
+    try:
+        return reader.get_consecutive_failures(key)
+    finally:
+        reader.close()
+
+
+class TestCachedStore:
+    def test_counts_failures_in_memory(self, store):
+        store.record_report(_report(("a", "timed_out")), 3)
+        failures = store.record_report(_report(("a", "timed_out")), 3)
+        assert failures == {"a": 2}
+        assert store.get_consecutive_failures("a") == 2
+
+    def test_state_written_only_on_flush(self, store, db_path):
+        store.record_check("a", "timed_out", 1, None, None)
+        assert _db_failures(db_path, "a") == 0
+        store.flush()
+        assert _db_failures(db_path, "a") == 1
+
+    def test_history_written_behind(self, store):
+        store.record_report(_report(("a", "timed_out"), ("b", "healthy")), 1)
+        history = store.get_history("a")
+        assert len(history) == 1
+        assert history[0]["action_taken"] == "recovery_triggered"
+
+    def test_reset_failures(self, store, db_path):
+        store.record_check("a", "timed_out", 1, None, None)
+        store.reset_failures("a")
+        assert store.get_consecutive_failures("a") == 0
+        store.flush()
+        assert _db_failures(db_path, "a") == 0
+
+    def test_close_flushes(self, db_path):
+        s = CachedWatchdogStore(db_path, flush_interval=60)
+        s.record_check("a", "timed_out", 1, None, None)
+        s.close()
+        assert _db_failures(db_path, "a") == 1
+
+    def test_loads_existing_state(self, db_path):
+        s = WatchdogStore(db_path)
+        s.record_check("a", "timed_out", 1, None, None)
+        s.close()
+        cached = CachedWatchdogStore(db_path)
+        assert cached.record_check("a", "timed_out", 1, None, None) == 2
+        cached.close()
+
+    def test_full_queue_drops_history_not_state(self, db_path):
+        s = CachedWatchdogStore(db_path, flush_interval=60)
+        with patch.object(s._writer._queue, "put_nowait", side_effect=queue.Full):
+            s.record_check("a", "timed_out", 1, None, None)
+        assert s.dropped == 1
+        s.flush()
+        assert s.get_history("a") == []
+        s.close()
+        assert _db_failures(db_path, "a") == 1
+
+    def test_unexpected_write_error_keeps_writer_running(self, db_path):
+        s = CachedWatchdogStore(db_path, flush_interval=60)
+        with patch(
+            "src.database.write_behind.HistoryWriter.write",
+            side_effect=RuntimeError("boom"),
+        ):
+            s.record_check("a", "timed_out", 1, None, None)
+            s.flush()
+        assert s._writer.is_alive()
+        s.record_check("a", "timed_out", 1, None, None)
+        s.close()
+        assert _db_failures(db_path, "a") == 2
+
+    def test_flush_and_close_do_not_block_on_dead_writer(self, db_path):
+        s = CachedWatchdogStore(db_path, flush_interval=60)
+        s._writer.stop()
+        s.record_check("a", "timed_out", 1, None, None)
+        s.flush()
+        s.close()
+
+    def test_change_only_mode(self, db_path):
+        s = CachedWatchdogStore(db_path, history_mode="changes")
+        for _ in range(3):
+            s.record_check("a", "healthy", 1, None, None)
+        s.record_check("a", "timed_out", 1, None, None)
+        history = s.get_history("a")
+        s.close()
+        assert [(r["health"], r["repeats"]) for r in history] == [
+            ("healthy", 2), ("timed_out", 0),
+        ]
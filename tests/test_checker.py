@@ -124,3 +124,83 @@ def test_check_all_skips_disabled(tmp_path):
     }
     report = check_all_processes(config)
     assert report.processes_checked == 0
+
+
+def test_check_all_preserves_config_order(tmp_path):
+    keys = [f"proc_{i}" for i in range(10)]
+    config = {
+        "check_workers": 4,
+        "processes": {
+            key: {
+                "display_name": key,
+                "timeout_seconds": 60,
+                "heartbeat_path": str(tmp_path / f"{key}.json"),
+                "enabled": True,
+            }
+            for key in keys
+        },
+    }
+    report = check_all_processes(config)
+    assert [r.process_key for r in report.results] == keys
+
+
+def test_hung_read_reported_as_read_timeout(tmp_path):
+    import threading
+    from src.heartbeat.reader import read_heartbeat
+
+    release = threading.Event()
+    hung_path = str(tmp_path / "hung.json")
+    ok_path = str(tmp_path / "ok.json")
+    _write_heartbeat(ok_path, datetime.now(timezone.utc))
+
+    def slow_read(path):
+        if str(path) == hung_path:
+            release.wait(5)
+        return read_heartbeat(path)
+
+    def proc(path):
+        return {"display_name": "P", "timeout_seconds": 60,
+                "heartbeat_path": path, "enabled": True}
+
+    config = {
+        "read_deadline": 0.1,
+        "check_workers": 1,
+        "processes": {"hung": proc(hung_path), "ok": proc(ok_path)},
+    }
+    with patch("src.heartbeat.source.read_heartbeat", side_effect=slow_read):
+        report = check_all_processes(config)
+    release.set()
+
+    assert [r.process_key for r in report.results] == ["hung", "ok"]
+    assert report.results[0].health == ProcessHealth.READ_TIMEOUT
+    assert report.results[1].health == ProcessHealth.HEALTHY
+
+
+def test_check_process_uses_custom_reader(process_config):
+    with patch("src.heartbeat.source.read_heartbeat") as mock_read:
+        result = check_process("test_server", process_config, reader=lambda p: None)
+    mock_read.assert_not_called()
+    assert result.health == ProcessHealth.NO_HEARTBEAT
+
+
+def test_recycled_pid_is_stale(process_config):
+    from unittest.mock import MagicMock
+    now = datetime.now(timezone.utc)
+    _write_heartbeat(process_config["heartbeat_path"], now)
+    snapshot = MagicMock()
+    snapshot.is_alive.return_value = False
+
+    result = check_process("test_server", process_config, snapshot=snapshot)
+    assert result.health == ProcessHealth.STALE_PID
+    snapshot.is_alive.assert_called_once_with(os.getpid(), None)
+
+
+def test_loop_lag_over_limit_is_degraded(process_config):
+    path = Path(process_config["heartbeat_path"])
+    _write_heartbeat(path, datetime.now(timezone.utc))
+    data = json.loads(path.read_text())
+    path.write_text(json.dumps({**data, "loop_lag": 2.5}))
+
+    assert check_process("test_server", process_config).health == ProcessHealth.HEALTHY
+    process_config["max_loop_lag"] = 1.0
+    assert check_process("test_server", process_config).health == ProcessHealth.DEGRADED
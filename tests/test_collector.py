@@ -0,0 +1,226 @@
+"""Tests for the agent/collector pipeline."""
+
+import io
+import json
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.collector.agent import CollectorAgent
+from src.collector.protocol import (
+    MAX_BATCH_BYTES,
+    MAX_FRAME_BYTES,
+    ProtocolError,
+    decode_batch,
+    encode_batch,
+    parse_address,
+    read_frame,
+)
+from src.collector.server import CollectorStore, create_server
+from src.collector.spool import Spool
+from src.config.constants import ProcessHealth
+from src.config.config_loader import validate_config
+from src.database.queries import iter_history
+from src.database.store import WatchdogStore
+from src.monitor.models import CheckResult, MonitorReport
+from src.pipeline.recovery_pipeline import PipelineResult
+from src.recovery.restarter import RestartResult
+
+ROOT = Path(__file__).resolve().parent.parent
+T0 = datetime(2026, 2, 5, 12, 0, tzinfo=timezone.utc)
+
+
+def _report(*healths):
+    return MonitorReport(timestamp=T0, results=[
+        CheckResult(
+            process_key=key, display_name=key, health=ProcessHealth(health),
+            pid=100, last_heartbeat=None, elapsed_seconds=1.5, timeout_seconds=60,
+        )
+        for key, health in healths
+    ])
+
+
+@pytest.fixture
+def collector(tmp_path):
+    """A collector serving on a Unix socket in a background thread."""
+    address = f"unix://{tmp_path / 'collector.sock'}"
+    db_path = str(tmp_path / "central.db")
+    server = create_server(address, db_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield address, db_path
+    server.shutdown()
+    server.server_close()
+
+
+def _agent(tmp_path, address, host="h1", **kwargs):
+    return CollectorAgent(address, Spool(str(tmp_path / f"{host}.spool"), **kwargs), host=host)
+
+
+def _central(db_path):
+    store = WatchdogStore(db_path)
+    try:
+        history = list(iter_history(store.connection, "h1/srv"))
+        attempts = store.connection.execute(
+            "SELECT process_key FROM recovery_attempts"
+        ).fetchall()
+        return history, [a[0] for a in attempts]
+    finally:
+        store.close()
+
+
+class TestProtocol:
+    def test_round_trip(self):
+        batch = {"host": "h", "checks": [["a", "t", "healthy"]] * 100}
+        payload = encode_batch(batch)
+        assert decode_batch(payload) == batch
+        assert len(payload) < len(json.dumps(batch))
+
+    def test_bad_payload(self):
+        with pytest.raises(ProtocolError):
+            decode_batch(b"not zlib")
+
+    def test_decompression_bomb_rejected(self):
+        payload = zlib.compress(b" " * (MAX_BATCH_BYTES + 1), 9)
+        assert len(payload) < MAX_FRAME_BYTES
+        with pytest.raises(ProtocolError, match="decompressed"):
+            decode_batch(payload)
+
+    def test_truncated_payload(self):
+        with pytest.raises(ProtocolError):
+            decode_batch(encode_batch({"host": "h"})[:-4])
+
+    def test_truncated_frame(self):
+        with pytest.raises(ProtocolError):
+            read_frame(io.BytesIO(b"\x00\x00"))
+        assert read_frame(io.BytesIO(b"")) is None
+
+    @pytest.mark.parametrize("address", ["tcp://nohost", "udp://h:1", "h:1"])
+    def test_bad_address(self, address):
+        with pytest.raises(ValueError):
+            parse_address(address)
+
+    def test_config_validation(self):
+        errors = validate_config({"processes": {}, "collector_address": "h:1"})
+        assert errors == ["collector_address must start with tcp:// or unix://"]
+
+
+class TestSpool:
+    def test_bounded_fifo(self, tmp_path):
+        spool = Spool(str(tmp_path / "s.db"), max_batches=2)
+        for payload in (b"1", b"2", b"3"):
+            spool.push(payload)
+        assert [p for _, p in spool.peek(10)] == [b"2", b"3"]
+        assert spool.dropped == 1
+        spool.ack(spool.peek(1)[0][0])
+        assert len(spool) == 1
+        spool.close()
+
+    def test_spool_id_persists(self, tmp_path):
+        first = Spool(str(tmp_path / "s.db"))
+        first.close()
+        assert Spool(str(tmp_path / "s.db")).spool_id == first.spool_id
+
+
+class TestAgentAndCollector:
+    def test_delivers_checks_and_recoveries(self, tmp_path, collector):
+        address, db_path = collector
+        agent = _agent(tmp_path, address)
+        agent.add_report(_report(("srv", "timed_out"), ("b", "healthy")), 1, {"srv": 1, "b": 0})
+        agent.add_recovery(PipelineResult(
+            process_key="srv", fully_recovered=True, started_at=T0, ended_at=T0,
+            action_results=[("start", RestartResult(success=True, pid=2))],
+        ), "timed_out", 100)
+        assert agent.flush() == 1
+        agent.close()
+
+        history, attempts = _central(db_path)
+        assert [(r.health, r.action_taken) for r in history] == [
+            ("timed_out", "recovery_triggered"),
+        ]
+        assert history[0].elapsed_seconds == 1.5
+        assert attempts == ["h1/srv"]
+
+    def test_spools_while_unreachable(self, tmp_path, collector):
+        address, db_path = collector
+        agent = _agent(tmp_path, f"unix://{tmp_path / 'missing.sock'}")
+        agent.add_report(_report(("srv", "healthy")), 2, {"srv": 0})
+        assert agent.flush() == 0
+        agent.add_report(_report(("srv", "timed_out")), 2, {"srv": 1})
+        assert agent.flush() == 0
+        assert len(agent._spool) == 2
+
+        agent._address = address[len("unix://"):]
+        assert agent.flush() == 2
+        assert [r.health for r in _central(db_path)[0]] == ["healthy", "timed_out"]
+
+    def test_rejected_batch_does_not_block_later_ones(self, tmp_path, collector):
+        address, db_path = collector
+        agent = _agent(tmp_path, address)
+        agent._spool.push(encode_batch({"host": "h1"}))  # missing keys: NAK
+        agent.add_report(_report(("srv", "timed_out")), 2, {"srv": 1})
+        assert agent.flush() == 1
+        assert len(agent._spool) == 0
+        rejected = tuple(agent._spool._conn.execute("SELECT COUNT(*) FROM rejected").fetchone())
+        assert rejected == (1,)
+        assert len(_central(db_path)[0]) == 1
+
+    def test_flush_sends_at_most_max_batches(self, tmp_path, collector):
+        address, db_path = collector
+        agent = CollectorAgent(address, Spool(str(tmp_path / "s.db")), host="h1", max_batches=2)
+        for _ in range(5):
+            agent._spool.push(encode_batch({"host": "h1", "spool": "x", "checks": [],
+                                            "states": [], "recoveries": []}))
+        assert agent.flush() == 2
+        assert len(agent._spool) == 3
+
+    def test_duplicate_batch_ingested_once(self, tmp_path):
+        store = CollectorStore(str(tmp_path / "c.db"))
+        batch = {
+            "host": "h1", "spool": "s", "states": [],
+            "checks": [["srv", T0.isoformat(), "healthy", 1, None, None, None, None]],
+            "recoveries": [],
+        }
+        assert store.ingest(1, batch) is True
+        assert store.ingest(1, batch) is False
+        store.close()
+        assert len(_central(str(tmp_path / "c.db"))[0]) == 1
+
+    def test_tcp(self, tmp_path):
+        server = create_server("tcp://127.0.0.1:0", str(tmp_path / "c.db"))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+        agent = _agent(tmp_path, f"tcp://{host}:{port}")
+        agent.add_report(_report(("srv", "healthy")), 2, {"srv": 0})
+        assert agent.flush() == 1
+        server.shutdown()
+        server.server_close()
+
+
+class TestCollectorProcess:
+    def test_cli_collector_process(self, tmp_path):
+        sock = tmp_path / "c.sock"
+        config = tmp_path / "config.json"
+        config.write_text(json.dumps({"log_level": "WARNING", "processes": {}}))
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "src.cli.main", "-c", str(config), "collector",
+             "--listen", f"unix://{sock}", "--db", str(tmp_path / "c.db")],
+            cwd=ROOT,
+        )
+        try:
+            deadline = time.monotonic() + 10
+            while not sock.exists() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            agent = _agent(tmp_path, f"unix://{sock}")
+            agent.add_report(_report(("srv", "timed_out")), 2, {"srv": 1})
+            assert agent.flush() == 1
+        finally:
+            proc.terminate()
+            assert proc.wait(timeout=10) == 0
+        assert len(_central(str(tmp_path / "c.db"))[0]) == 1
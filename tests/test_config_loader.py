@@ -207,3 +207,33 @@ def test_validate_old_format_valid(old_format_config):
     config = {"processes": {"old": old_format_config}}
     errors = validate_config(config)
     assert errors == []
+
+
+def test_validate_unknown_heartbeat_transport(sample_config):
+    sample_config["processes"]["test_server"]["heartbeat_transport"] = "udp"
+    errors = validate_config(sample_config)
+    assert any("heartbeat_transport" in e for e in errors)
+
+
+def test_validate_unknown_history_mode(sample_config):
+    sample_config["history_mode"] = "sparse"
+    errors = validate_config(sample_config)
+    assert any("history_mode" in e for e in errors)
+
+
+def test_validate_action_dependencies(valid_config):
+    proc = valid_config["processes"]["test_server"]
+    proc["action_dependencies"] = {"start": ["clear_db"], "clear_db": ["kill"]}
+    assert validate_config(valid_config) == []
+
+    proc["action_dependencies"] = {"start": ["clear_emails"]}
+    assert validate_config(valid_config) == [
+        "Process 'test_server' action_dependencies names unknown action 'clear_emails'"
+    ]
+
+    proc["action_dependencies"] = {"kill": ["clear_db"], "clear_db": ["start"]}
+    assert validate_config(valid_config) == [
+        "Process 'test_server' action_dependencies: 'kill' always runs first",
+        "Process 'test_server' action_dependencies: 'clear_db' cannot wait for "
+        "'start', which always runs last",
+    ]
@@ -0,0 +1,56 @@
+"""Tests for SQLite connection setup."""
+
+import sqlite3
+
+import pytest
+
+from src.database.connection import open_connection
+from src.database.store import WatchdogStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "watchdog.db")
+    WatchdogStore(path).close()
+    return path
+
+
+def test_writer_uses_wal(db_path):
+    conn = open_connection(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    conn.close()
+
+
+def test_busy_timeout_set(db_path):
+    conn = open_connection(db_path, busy_timeout=2.5)
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 2500
+    conn.close()
+
+
+def test_read_only_rejects_writes(db_path):
+    conn = open_connection(db_path, read_only=True)
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM check_history")
+    conn.close()
+
+
+def test_reader_not_blocked_by_open_write_transaction(db_path):
+    writer = WatchdogStore(db_path)
+    writer.record_check("proc_a", "healthy", 1, None, None)
+    writer._conn.execute("BEGIN IMMEDIATE")
+    writer._conn.execute(
+        "INSERT INTO check_history (process_key, checked_at, health) "
+        "VALUES ('proc_a', 'x', 'timed_out')"
+    )
+
+    reader = WatchdogStore(db_path, read_only=True)
+    assert len(reader.get_history("proc_a")) == 1  # sees last commit only
+    reader.close()
+    writer._conn.rollback()
+    writer.close()
+
+
+def test_read_only_store_missing_db(tmp_path):
+    with pytest.raises(sqlite3.OperationalError):
+        WatchdogStore(str(tmp_path / "missing.db"), read_only=True)
@@ -0,0 +1,74 @@
+"""Tests for daemon mode."""
+
+import json
+import signal
+from unittest.mock import patch
+
+import pytest
+
+from src.cli.daemon import handle_daemon
+from src.cli.main import main
+from src.database.cached_store import CachedWatchdogStore
+
+
+@pytest.fixture
+def config(tmp_path):
+    return {
+        "log_level": "WARNING",
+        "db_path": str(tmp_path / "watchdog.db"),
+        "lock_path": str(tmp_path / "watchdog.lock"),
+        "processes": {},
+    }
+
+
+class TestHandleDaemon:
+    @patch("src.cli.daemon._run_checks", return_value=0)
+    def test_runs_requested_cycles(self, mock_run, config):
+        assert handle_daemon(config, interval=0, max_cycles=3) == 0
+        assert mock_run.call_count == 3
+
+    @patch("src.cli.daemon._run_checks", return_value=0)
+    def test_reuses_store_across_cycles(self, mock_run, config):
+        handle_daemon(config, interval=0, max_cycles=2)
+        stores = {id(c.args[1]) for c in mock_run.call_args_list}
+        assert len(stores) == 1
+
+    @patch("src.cli.daemon._run_checks", return_value=0)
+    def test_uses_cached_store(self, mock_run, config):
+        handle_daemon(config, interval=0, max_cycles=1)
+        assert isinstance(mock_run.call_args.args[1], CachedWatchdogStore)
+
+    @patch("src.cli.daemon._run_checks", side_effect=[RuntimeError("x"), 0])
+    def test_cycle_error_does_not_stop_daemon(self, mock_run, config):
+        assert handle_daemon(config, interval=0, max_cycles=2) == 0
+        assert mock_run.call_count == 2
+
+    @patch("src.cli.daemon.acquire_lock", return_value=None)
+    @patch("src.cli.daemon._run_checks")
+    def test_locked_exits_without_checking(self, mock_run, mock_lock, config):
+        assert handle_daemon(config, interval=0, max_cycles=1) == 0
+        mock_run.assert_not_called()
+
+    def test_sigterm_stops_loop(self, config):
+        def _run(*args):
+            signal.raise_signal(signal.SIGTERM)
+            return 0
+
+        with patch("src.cli.daemon._run_checks", side_effect=_run) as mock_run:
+            assert handle_daemon(config, interval=30) == 0
+        assert mock_run.call_count == 1
+
+    def test_restores_signal_handlers(self, config):
+        before = signal.getsignal(signal.SIGTERM)
+        with patch("src.cli.daemon._run_checks", return_value=0):
+            handle_daemon(config, interval=0, max_cycles=1)
+        assert signal.getsignal(signal.SIGTERM) is before
+
+
+class TestDaemonCommand:
+    @patch("src.cli.daemon.handle_daemon", return_value=0)
+    def test_dispatches_with_interval(self, mock_daemon, tmp_path, config):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(config))
+        assert main(["-c", str(path), "daemon", "--interval", "5"]) == 0
+        assert mock_daemon.call_args.args[1] == 5.0
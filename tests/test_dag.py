@@ -0,0 +1,87 @@
+"""Tests for the recovery action graph."""
+
+import threading
+import time
+
+import pytest
+
+from src.pipeline.dag import action_graph, find_cycle, run_graph
+
+ACTIONS = ["kill", "clear_db", "clear_emails", "start"]
+PARALLEL = {
+    "clear_db": ["kill"],
+    "clear_emails": ["kill"],
+    "start": ["clear_db", "clear_emails"],
+}
+
+
+class TestActionGraph:
+    def test_list_order_without_dependencies(self):
+        assert action_graph(ACTIONS) == {
+            "kill": [], "clear_db": ["kill"],
+            "clear_emails": ["clear_db"], "start": ["clear_emails"],
+        }
+
+    def test_declared_and_unlisted(self):
+        graph = action_graph(ACTIONS, {"clear_emails": []})
+        assert graph["clear_emails"] == ["kill"]
+        assert graph["clear_db"] == ["kill"]  # unlisted: list order
+
+    def test_kill_first_and_start_last(self):
+        actions = ["clear_db", "kill", "clear_emails", "start"]
+        graph = action_graph(actions, {"clear_emails": []})
+        assert graph["kill"] == []
+        assert graph["clear_db"] == ["kill"]
+        assert graph["clear_emails"] == ["kill"]
+        assert graph["start"] == ["clear_db", "kill", "clear_emails"]
+
+    def test_drops_missing_actions(self):
+        graph = action_graph(["kill", "start"], {"start": ["kill", "clear_db"]})
+        assert graph["start"] == ["kill"]
+
+    def test_find_cycle(self):
+        assert find_cycle(action_graph(ACTIONS, PARALLEL)) is None
+        assert find_cycle({"a": ["b"], "b": ["a"]}) == ["a", "b", "a"]
+
+
+class TestRunGraph:
+    def test_independent_actions_overlap(self):
+        lock = threading.Lock()
+        active, peak, order = [0], [0], []
+
+        def execute(action):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                order.append(action)
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return True
+
+        outcomes, fatal = run_graph(
+            action_graph(ACTIONS, PARALLEL), execute, lambda a, ok: not ok
+        )
+        assert fatal is None
+        assert set(outcomes) == set(ACTIONS)
+        assert peak[0] == 2
+        assert order[0] == "kill" and order[-1] == "start"
+
+    def test_fatal_stops_new_actions(self):
+        ran = []
+
+        def execute(action):
+            ran.append(action)
+            return action != "clear_db"
+
+        outcomes, fatal = run_graph(
+            action_graph(ACTIONS, PARALLEL), execute,
+            lambda a, ok: a == "clear_db" and not ok,
+        )
+        assert fatal == "clear_db"
+        assert "start" not in ran
+        assert "clear_emails" in outcomes  # already running, allowed to finish
+
+    def test_cycle_rejected(self):
+        with pytest.raises(ValueError, match="cycle"):
+            run_graph({"a": ["b"], "b": ["a"]}, lambda a: True, lambda a, r: False)
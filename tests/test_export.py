@@ -0,0 +1,126 @@
+"""Tests for streaming history/recovery export."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from src.cli.export import handle_export, read_mark, write_rows
+from src.cli.main import main
+from src.database.export import iter_export
+from src.database.recovery_log import record_recovery
+from src.database.store import WatchdogStore
+from src.pipeline.recovery_pipeline import PipelineResult
+from src.recovery.restarter import RestartResult
+
+T0 = datetime(2026, 2, 5, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "w.db")
+    store = WatchdogStore(path)
+    for health in ("healthy", "timed_out", "healthy"):
+        store.record_check("srv", health, 1, None, None)
+    store.record_check("other", "healthy", 2, None, None)
+    record_recovery(store.connection, PipelineResult(
+        process_key="srv", fully_recovered=True, started_at=T0, ended_at=T0,
+        action_results=[("start", RestartResult(success=True, pid=3))],
+    ), "timed_out")
+    store.close()
+    return path
+
+
+@pytest.fixture
+def config(db_path):
+    return {"db_path": db_path}
+
+
+class TestIterExport:
+    def test_history_in_id_order_in_chunks(self, db_path):
+        store = WatchdogStore(db_path)
+        rows = list(iter_export(store.connection, "history", chunk_size=2))
+        store.close()
+        assert [r["id"] for r in rows] == [1, 2, 3, 4]
+
+    def test_after_and_process_filter(self, db_path):
+        store = WatchdogStore(db_path)
+        rows = list(iter_export(store.connection, "history", after=1, process_key="srv"))
+        store.close()
+        assert [r["id"] for r in rows] == [2, 3]
+
+    def test_recoveries_and_actions(self, db_path):
+        store = WatchdogStore(db_path)
+        attempts = list(iter_export(store.connection, "recoveries"))
+        actions = list(iter_export(store.connection, "actions"))
+        store.close()
+        assert attempts[0]["trigger_health"] == "timed_out"
+        assert actions[0]["action"] == "start"
+
+    def test_unknown_table(self, db_path):
+        store = WatchdogStore(db_path)
+        with pytest.raises(ValueError):
+            list(iter_export(store.connection, "process_state"))
+        store.close()
+
+
+class TestHandleExport:
+    def test_ndjson_to_stdout(self, config, capsys):
+        assert handle_export(config) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["process_key"] for line in lines] == [
+            "srv", "srv", "srv", "other",
+        ]
+
+    def test_gzip_csv_file(self, config, tmp_path):
+        out = tmp_path / "history.csv.gz"
+        handle_export(config, fmt="csv", output=str(out), compress=True)
+        with gzip.open(out, "rt", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 4 and rows[1]["health"] == "timed_out"
+
+    def test_incremental_with_mark(self, config, db_path, tmp_path):
+        mark = str(tmp_path / "mark.json")
+        handle_export(config, output=str(tmp_path / "1.ndjson"), mark_path=mark)
+        assert read_mark(mark, "history") == 4
+
+        store = WatchdogStore(db_path)
+        store.record_check("srv", "healthy", 1, None, None)
+        store.close()
+        second = tmp_path / "2.ndjson"
+        handle_export(config, output=str(second), mark_path=mark)
+        assert [json.loads(x)["id"] for x in second.read_text().splitlines()] == [5]
+        assert read_mark(mark, "history") == 5
+
+    def test_mark_unchanged_without_new_rows(self, config, tmp_path):
+        mark = tmp_path / "mark.json"
+        mark.write_text(json.dumps({"history": 4, "recoveries": 1}))
+        handle_export(config, output=str(tmp_path / "x"), mark_path=str(mark))
+        assert json.loads(mark.read_text()) == {"history": 4, "recoveries": 1}
+
+    def test_process_mark_kept_apart(self, config, tmp_path):
+        mark = str(tmp_path / "mark.json")
+        handle_export(config, output=str(tmp_path / "1"), mark_path=mark, process_key="srv")
+        assert read_mark(mark, "history") == 0
+        full = tmp_path / "2.ndjson"
+        handle_export(config, output=str(full), mark_path=mark)
+        assert len(full.read_text().splitlines()) == 4
+        assert read_mark(mark, "history", "srv") > 0
+
+    def test_write_rows_csv_header_once(self):
+        out = io.StringIO()
+        count, last = write_rows([{"a": 1}, {"a": 2}], out, "csv")
+        assert (count, last) == (2, {"a": 2})
+        assert out.getvalue().splitlines() == ["a", "1", "2"]
+
+    def test_cli(self, db_path, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({
+            "log_level": "WARNING", "db_path": db_path, "processes": {},
+        }))
+        out = tmp_path / "r.ndjson"
+        assert main(["-c", str(path), "export", "recoveries", "-o", str(out)]) == 0
+        assert json.loads(out.read_text())["process_key"] == "srv"
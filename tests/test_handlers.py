@@ -77,11 +77,11 @@ class TestHandleOff:
     @patch("src.cli.handlers.kill_process")
     @patch("src.cli.handlers.read_heartbeat")
     def test_kills_process(self, mock_hb, mock_kill, config):
-        mock_hb.return_value = MagicMock(pid=1234)
+        mock_hb.return_value = MagicMock(pid=1234, start_time=555)
         mock_kill.return_value = KillResult(success=True, pid=1234)
         code = handle_off(config, "server")
         assert code == 0
-        mock_kill.assert_called_once_with(1234, timeout=10.0)
+        mock_kill.assert_called_once_with(1234, timeout=10.0, start_time=555)
 
     @patch("src.cli.handlers.read_heartbeat")
     def test_no_heartbeat(self, mock_hb, config):
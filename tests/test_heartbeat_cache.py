@@ -0,0 +1,81 @@
+"""Tests for the stat-keyed heartbeat cache."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.heartbeat import cache as cache_mod
+from src.heartbeat.cache import HeartbeatCache
+
+
+@pytest.fixture
+def hb_file(heartbeat_dir, sample_heartbeat_data):
+    path = heartbeat_dir / "test_server.json"
+    path.write_text(json.dumps(sample_heartbeat_data))
+    return path
+
+
+def _rewrite(path, data, **changes):
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({**data, **changes}))
+    tmp.replace(path)
+
+
+def test_unchanged_file_is_a_hit(hb_file):
+    cache = HeartbeatCache()
+    first = cache.read(hb_file)
+    with patch.object(cache_mod, "read_heartbeat") as mock_read:
+        second = cache.read(hb_file)
+    mock_read.assert_not_called()
+    assert second is first
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_replaced_file_is_reparsed(hb_file, sample_heartbeat_data):
+    cache = HeartbeatCache()
+    cache.read(hb_file)
+    _rewrite(hb_file, sample_heartbeat_data, iteration=2)
+    assert cache.read(hb_file).iteration == 2
+    assert cache.misses == 2
+
+
+def test_missing_file_returns_none(heartbeat_dir):
+    cache = HeartbeatCache()
+    assert cache.read(heartbeat_dir / "missing.json") is None
+
+
+def test_deleted_file_evicted(hb_file):
+    cache = HeartbeatCache()
+    cache.read(hb_file)
+    hb_file.unlink()
+    assert cache.read(hb_file) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction(heartbeat_dir, sample_heartbeat_data):
+    cache = HeartbeatCache(max_entries=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = heartbeat_dir / f"{name}.json"
+        path.write_text(json.dumps(sample_heartbeat_data))
+        paths.append(path)
+
+    cache.read(paths[0])
+    cache.read(paths[1])
+    cache.read(paths[0])  # a is now most recent
+    cache.read(paths[2])  # evicts b
+    assert cache.stats()["size"] == 2
+
+    cache.read(paths[0])
+    assert cache.hits == 2
+    cache.read(paths[1])
+    assert cache.misses == 4
+
+
+def test_hit_rate(hb_file):
+    cache = HeartbeatCache()
+    for _ in range(4):
+        cache.read(hb_file)
+    assert cache.stats()["hit_rate"] == 0.75
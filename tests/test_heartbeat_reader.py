@@ -100,3 +100,12 @@ def test_read_all_heartbeats_empty_dir(tmp_path):
 def test_heartbeat_data_file_path(heartbeat_file):
     result = read_heartbeat(heartbeat_file)
     assert result.file_path == heartbeat_file
+
+
+def test_start_time_optional(tmp_path, sample_heartbeat_data):
+    path = tmp_path / "hb.json"
+    path.write_text(json.dumps(sample_heartbeat_data))
+    assert read_heartbeat(path).start_time is None
+
+    path.write_text(json.dumps({**sample_heartbeat_data, "start_time": 42}))
+    assert read_heartbeat(path).start_time == 42
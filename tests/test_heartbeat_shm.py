@@ -0,0 +1,91 @@
+"""Tests for the shared-memory heartbeat table."""
+
+import os
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from src.config.constants import ProcessHealth
+from src.heartbeat.shm import SEQ, SharedHeartbeatWriter, slot_offset
+from src.heartbeat.shm_reader import read_heartbeat_table
+from src.heartbeat.source import read_process_heartbeat
+from src.monitor.checker import check_all_processes
+
+
+@pytest.fixture
+def table(tmp_path):
+    return tmp_path / "fleet.hbt"
+
+
+def test_beat_visible_to_reader(table):
+    writer = SharedHeartbeatWriter(str(table), "svc_a", slots=8)
+    writer.beat()
+    writer.beat(status="error")
+
+    data = read_heartbeat_table(table)["svc_a"]
+    assert data.pid == os.getpid()
+    assert data.iteration == 2
+    assert data.status == "error"
+    assert datetime.now(timezone.utc) - data.timestamp < timedelta(seconds=5)
+
+
+def test_writers_get_separate_slots(table):
+    a = SharedHeartbeatWriter(str(table), "svc_a", slots=8)
+    b = SharedHeartbeatWriter(str(table), "svc_b", slots=8)
+    a.beat()
+    b.beat()
+    b.beat()
+    fleet = read_heartbeat_table(table)
+    assert fleet["svc_a"].iteration == 1
+    assert fleet["svc_b"].iteration == 2
+
+
+def test_same_key_reuses_slot(table):
+    SharedHeartbeatWriter(str(table), "svc_a", slots=2).beat()
+    again = SharedHeartbeatWriter(str(table), "svc_a", slots=2)
+    SharedHeartbeatWriter(str(table), "svc_b", slots=2)
+    again.beat()
+    assert set(read_heartbeat_table(table)) == {"svc_a"}
+
+
+def test_table_full(table):
+    SharedHeartbeatWriter(str(table), "svc_a", slots=1)
+    with pytest.raises(RuntimeError):
+        SharedHeartbeatWriter(str(table), "svc_b", slots=1)
+
+
+def test_stop_frees_slot(table):
+    writer = SharedHeartbeatWriter(str(table), "svc_a", slots=2)
+    writer.beat()
+    writer.stop()
+    assert read_heartbeat_table(table) == {}
+    SharedHeartbeatWriter(str(table), "svc_b", slots=1)
+
+
+def test_slot_mid_write_is_skipped(table):
+    writer = SharedHeartbeatWriter(str(table), "svc_a", slots=2)
+    writer.beat()
+    offset = slot_offset(0)
+    seq = SEQ.unpack_from(writer._mm, offset)[0]
+    SEQ.pack_into(writer._mm, offset, seq + 1)
+    assert read_heartbeat_table(table) == {}
+
+
+def test_missing_or_foreign_file(tmp_path):
+    assert read_heartbeat_table(tmp_path / "missing.hbt") == {}
+    bogus = tmp_path / "bogus.hbt"
+    bogus.write_bytes(b"{}" * 64)
+    assert read_heartbeat_table(bogus) == {}
+
+
+def test_checker_reads_shm_transport(table):
+    SharedHeartbeatWriter(str(table), "svc_a", slots=4).beat()
+    proc = {
+        "display_name": "A", "timeout_seconds": 60, "enabled": True,
+        "heartbeat_path": str(table), "heartbeat_transport": "shm",
+    }
+    config = {"processes": {"svc_a": proc, "svc_b": dict(proc)}}
+    report = check_all_processes(config)
+    assert report.results[0].health == ProcessHealth.HEALTHY
+    assert report.results[1].health == ProcessHealth.NO_HEARTBEAT
+    assert read_process_heartbeat("svc_a", proc).pid == os.getpid()
@@ -0,0 +1,76 @@
+"""Tests for the inotify-backed heartbeat watcher."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.heartbeat import watcher as watcher_mod
+from src.heartbeat.watcher import HeartbeatWatcher
+from src.heartbeat.writer import HeartbeatWriter
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+@pytest.fixture
+def writer(heartbeat_dir):
+    return HeartbeatWriter(heartbeat_dir=str(heartbeat_dir), process_key="svc")
+
+
+@pytest.fixture
+def watcher(writer):
+    writer.beat()
+    w = HeartbeatWatcher([writer.heartbeat_path])
+    yield w
+    w.close()
+
+
+def test_initial_read_populates_table(watcher, writer):
+    assert writer.heartbeat_path in watcher.watched_paths
+    assert watcher.read(writer.heartbeat_path).iteration == 1
+
+
+def test_write_event_updates_table(watcher, writer):
+    writer.beat()
+    writer.beat()
+    assert watcher.refresh() == 1
+    assert watcher.read(writer.heartbeat_path).iteration == 3
+
+
+def test_no_reparse_without_events(watcher, writer):
+    with patch.object(watcher_mod, "read_heartbeat") as mock_read:
+        assert watcher.refresh() == 0
+        watcher.read(writer.heartbeat_path)
+    mock_read.assert_not_called()
+
+
+def test_delete_event_clears_entry(watcher, writer):
+    writer.stop()
+    watcher.refresh()
+    assert watcher.read(writer.heartbeat_path) is None
+
+
+def test_unrelated_file_ignored(watcher, heartbeat_dir):
+    (heartbeat_dir / "other.json").write_text("{}")
+    assert watcher.refresh() == 0
+
+
+def test_missing_directory_falls_back_to_polling(tmp_path):
+    path = tmp_path / "missing" / "svc.json"
+    calls = []
+    w = HeartbeatWatcher([path], fallback=lambda p: calls.append(p))
+    assert w.watched_paths == set()
+    w.read(path)
+    assert calls == [path]
+    w.close()
+
+
+def test_unsupported_filesystem_falls_back_to_polling(writer):
+    writer.beat()
+    with patch.object(watcher_mod, "_fs_supports_inotify", return_value=False):
+        w = HeartbeatWatcher([writer.heartbeat_path])
+    assert w.watched_paths == set()
+    assert w.read(writer.heartbeat_path).iteration == 1
+    w.close()
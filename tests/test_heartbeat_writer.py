@@ -2,7 +2,9 @@
 
 import json
 import os
+import shutil
 import pytest
+from unittest.mock import patch
 
 from src.heartbeat.writer import HeartbeatWriter
 
@@ -115,3 +117,27 @@ def test_beat_status_defaults_to_running(writer, tmp_path):
     path = tmp_path / "test_process.json"
     data = json.loads(path.read_text())
     assert data["status"] == "running"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="needs /proc")
+def test_beat_records_process_start_time(writer, tmp_path):
+    writer.beat()
+    data = json.loads((tmp_path / "test_process.json").read_text())
+    assert isinstance(data["start_time"], int)
+
+
+def test_mkdir_not_repeated_per_beat(writer, tmp_path):
+    writer.beat()
+    with patch("pathlib.Path.mkdir") as mock_mkdir:
+        writer.beat()
+        writer.beat()
+    mock_mkdir.assert_not_called()
+
+
+def test_recreates_dir_if_removed(tmp_path):
+    hb_dir = tmp_path / "hb"
+    writer = HeartbeatWriter(heartbeat_dir=str(hb_dir), process_key="test")
+    writer.beat()
+    shutil.rmtree(hb_dir)
+    writer.beat()
+    assert (hb_dir / "test.json").exists()
@@ -1,7 +1,11 @@
 """Tests for process killer module."""
 
+import subprocess
+import sys
+import time
+
 import pytest
-from unittest.mock import patch, call
+from unittest.mock import MagicMock, patch, call
 
 from src.recovery.killer import KillResult, kill_process, is_process_running
 
@@ -22,34 +26,51 @@ class TestIsProcessRunning:
         assert is_process_running(1234) is True
 
 
+@pytest.fixture
+def no_pidfd():
+    """Force the kill -> poll fallback used where pidfd_open is unavailable."""
+    with patch("src.recovery.killer.open_pidfd", return_value=None):
+        yield
+
+
+@pytest.mark.usefixtures("no_pidfd")
 class TestKillProcess:
-    @patch("src.recovery.killer.time.sleep")
+    @patch("src.recovery.waiter.time.sleep")
     @patch("src.recovery.killer.is_process_running")
     @patch("src.recovery.killer.os.kill")
     def test_kill_sends_sigterm(self, mock_kill, mock_running, mock_sleep):
         mock_running.side_effect = [True, False]
         result = kill_process(1234)
         assert result.success is True
-        assert mock_kill.call_args_list[0][0][1] == 15  # SIGTERM
+        assert mock_kill.call_args_list == [call(1234, 15)]  # SIGTERM only
 
-    @patch("src.recovery.killer.time.sleep")
-    @patch("src.recovery.killer.time.monotonic")
-    @patch("src.recovery.killer.is_process_running", return_value=True)
+    @patch("src.recovery.waiter.time.sleep")
+    @patch("src.recovery.waiter.time.monotonic")
+    @patch("src.recovery.killer.is_process_running")
     @patch("src.recovery.killer.os.kill")
     def test_kill_escalates_to_sigkill(
         self, mock_kill, mock_running, mock_mono, mock_sleep
     ):
-        # Simulate time passing: start=0, first check=0.5, past deadline=11
-        mock_mono.side_effect = [0.0, 0.5, 11.0]
-        # After SIGKILL, process is dead
+        # SIGTERM wait: deadline from 0.0, still running at 11.0 -> timed out
+        mock_mono.side_effect = [0.0, 11.0, 20.0]
+        # Running through the SIGTERM wait, dead after SIGKILL
         mock_running.side_effect = [True, False]
         result = kill_process(1234, timeout=1.0)
         assert result.success is True
         kill_signals = [c[0][1] for c in mock_kill.call_args_list]
-        assert 15 in kill_signals  # SIGTERM
-        assert 9 in kill_signals   # SIGKILL
+        assert kill_signals == [15, 9]
 
-    @patch("src.recovery.killer.time.sleep")
+    @patch("src.recovery.waiter.time.sleep")
+    @patch("src.recovery.waiter.time.monotonic")
+    @patch("src.recovery.killer.is_process_running", return_value=True)
+    @patch("src.recovery.killer.os.kill")
+    def test_survives_sigkill(self, mock_kill, mock_running, mock_mono, mock_sleep):
+        mock_mono.side_effect = [0.0, 11.0, 20.0, 22.0]
+        result = kill_process(1234, timeout=1.0)
+        assert result.success is False
+        assert result.error == "Process survived SIGKILL"
+
+    @patch("src.recovery.waiter.time.sleep")
     @patch("src.recovery.killer.is_process_running", return_value=False)
     @patch("src.recovery.killer.os.kill")
     def test_kill_success_immediate(
@@ -58,6 +79,7 @@ class TestKillProcess:
         result = kill_process(1234)
         assert result.success is True
         assert result.pid == 1234
+        mock_sleep.assert_not_called()
 
     @patch("src.recovery.killer.os.kill", side_effect=ProcessLookupError)
     def test_kill_process_already_dead(self, mock_kill):
@@ -69,3 +91,56 @@ class TestKillProcess:
         result = kill_process(1234)
         assert result.success is False
         assert "denied" in result.error
+
+
+class TestKillRealProcess:
+    """End to end on real children, via pidfd where the kernel has it."""
+
+    def _spawn(self, ignore_term=False):
+        code = "import signal, time\n"
+        if ignore_term:
+            code += "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+        code += "print('ready', flush=True)\ntime.sleep(30)\n"
+        proc = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE)
+        proc.stdout.readline()
+        return proc
+
+    def test_sigterm_returns_on_exit(self):
+        proc = self._spawn()
+        started = time.monotonic()
+        result = kill_process(proc.pid, timeout=10.0)
+        assert result.success is True
+        assert time.monotonic() - started < 0.5
+        assert proc.wait(timeout=5) == -15
+
+    def test_escalates_to_sigkill(self):
+        proc = self._spawn(ignore_term=True)
+        started = time.monotonic()
+        result = kill_process(proc.pid, timeout=0.2)
+        assert result.success is True
+        assert time.monotonic() - started < 0.8
+        assert proc.wait(timeout=5) == -9
+
+    @pytest.mark.usefixtures("no_pidfd")
+    def test_polling_fallback(self):
+        proc = self._spawn()
+        result = kill_process(proc.pid, timeout=10.0)
+        assert result.success is True
+        proc.wait(timeout=5)
+
+
+@pytest.mark.usefixtures("no_pidfd")
+class TestPidReuse:
+    @patch("src.recovery.killer.read_proc_entry")
+    @patch("src.recovery.killer.os.kill")
+    def test_recycled_pid_not_signalled(self, mock_kill, mock_entry):
+        mock_entry.return_value = MagicMock(start_time=2000)
+        result = kill_process(1234, start_time=1000)
+        assert result.success is True
+        mock_kill.assert_not_called()
+
+    @patch("src.recovery.killer.read_proc_entry")
+    @patch("src.recovery.killer.os.kill")
+    def test_zombie_counts_as_exited(self, mock_kill, mock_entry):
+        mock_entry.return_value = MagicMock(state="Z")
+        assert is_process_running(1234) is False
@@ -1,6 +1,7 @@
 """Tests for the CLI entry point."""
 
 import json
+import sqlite3
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
@@ -39,6 +40,20 @@ def config_file(tmp_path):
     return str(path)
 
 
+def _set_options(config_file, **options):
+    config = json.loads(Path(config_file).read_text())
+    config.update(options)
+    Path(config_file).write_text(json.dumps(config))
+
+
+def _history_actions(config_file):
+    db_path = json.loads(Path(config_file).read_text())["db_path"]
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT action_taken FROM check_history ORDER BY id").fetchall()
+    conn.close()
+    return [action for (action,) in rows]
+
+
 def _make_report(health=ProcessHealth.HEALTHY):
     return MonitorReport(
         timestamp=datetime.now(timezone.utc),
@@ -146,6 +161,22 @@ class TestMain:
         main(["-c", config_file])
         mock_recover.assert_called_once()
 
+    @patch("src.cli.check.acquire_lock")
+    @patch("src.cli.check.run_recovery")
+    @patch("src.cli.check.check_all_processes")
+    def test_read_timeout_never_triggers_recovery(
+        self, mock_check, mock_recover, mock_lock, config_file
+    ):
+        mock_lock.return_value = MagicMock()
+        report = _make_report(ProcessHealth.READ_TIMEOUT)
+        report.results[0].pid = None
+        mock_check.return_value = report
+
+        for _ in range(3):
+            main(["-c", config_file])
+        mock_recover.assert_not_called()
+        assert _history_actions(config_file) == ["waiting_for_read"] * 3
+
     @patch("src.cli.check.acquire_lock")
     @patch("src.cli.check.run_recovery")
     @patch("src.cli.check.check_all_processes")
@@ -173,6 +204,7 @@ class TestMain:
         self, mock_check, mock_recover, mock_lock, config_file
     ):
         """After successful recovery, counter resets — need 2 more failures."""
+        _set_options(config_file, crash_backoff_base=0)
         mock_lock.return_value = MagicMock()
         mock_check.return_value = _make_report(ProcessHealth.TIMED_OUT)
         mock_recover.return_value = PipelineResult(
@@ -189,6 +221,55 @@ class TestMain:
         main(["-c", config_file])
         assert mock_recover.call_count == 2
 
+    @patch("src.cli.check.acquire_lock")
+    @patch("src.cli.check.run_recovery")
+    @patch("src.cli.check.check_all_processes")
+    def test_recovery_attempt_recorded(
+        self, mock_check, mock_recover, mock_lock, config_file
+    ):
+        mock_lock.return_value = MagicMock()
+        mock_check.return_value = _make_report(ProcessHealth.TIMED_OUT)
+        mock_recover.return_value = PipelineResult(
+            process_key="server", fully_recovered=True
+        )
+        main(["-c", config_file])
+        main(["-c", config_file])
+
+        db_path = json.loads(Path(config_file).read_text())["db_path"]
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            "SELECT process_key, trigger_health, pid FROM recovery_attempts"
+        ).fetchall()
+        conn.close()
+        assert rows == [("server", "timed_out", 1234)]
+
+    @patch("src.cli.check.acquire_lock")
+    @patch("src.cli.check.run_recovery")
+    @patch("src.cli.check.check_all_processes")
+    def test_crash_loop_backs_off_then_opens_circuit(
+        self, mock_check, mock_recover, mock_lock, config_file
+    ):
+        """Repeat recoveries wait out the backoff; N in the window stop them."""
+        _set_options(config_file, consecutive_failures_threshold=1, crash_loop_max_attempts=2)
+        mock_lock.return_value = MagicMock()
+        mock_check.return_value = _make_report(ProcessHealth.TIMED_OUT)
+        mock_recover.return_value = PipelineResult(
+            process_key="server", fully_recovered=True
+        )
+        assert main(["-c", config_file]) == 0
+        assert main(["-c", config_file]) == 0  # within the 60s backoff
+        assert mock_recover.call_count == 1
+
+        _set_options(config_file, crash_backoff_base=0)
+        assert main(["-c", config_file]) == 0
+        assert mock_recover.call_count == 2
+        assert main(["-c", config_file]) == 1  # 2 attempts in the window
+        assert mock_recover.call_count == 2
+        assert _history_actions(config_file) == [
+            "recovery_triggered", "recovery_suppressed",
+            "recovery_triggered", "recovery_suppressed",
+        ]
+
     def test_missing_config_returns_2(self):
         exit_code = main(["-c", "/nonexistent/config.json"])
         assert exit_code == 2
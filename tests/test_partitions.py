@@ -0,0 +1,171 @@
+"""Tests for day-partitioned check history."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config.constants import ProcessHealth
+from src.database.cached_store import CachedWatchdogStore
+from src.database.history import HistoryWriter
+from src.database.partitions import (
+    ID_SPAN,
+    history_tables,
+    list_partitions,
+    partition_name,
+    table_for_id,
+)
+from src.database.queries import iter_history, latest_history
+from src.database.retention import RetentionEngine, get_rollups
+from src.database.stats import StatsEngine
+from src.database.store import WatchdogStore
+from src.monitor.models import CheckResult, MonitorReport
+from src.monitor.replay import load_traces
+
+T0 = datetime(2026, 2, 5, 12, 0, tzinfo=timezone.utc)
+DAY = timedelta(days=1)
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = WatchdogStore(str(tmp_path / "test.db"), partitioned=True)
+    yield s
+    s.close()
+
+
+def _write(store, at, healths=("healthy",), key="a"):
+    """Write one check per health, a minute apart, starting at `at`."""
+    conn = store.connection
+    writer = HistoryWriter(conn, False, 3600, partitioned=True)
+    for i, health in enumerate(healths):
+        now = (at + timedelta(minutes=i)).isoformat()
+        with conn:
+            writer.write(now, [(key, now, health, 1, None, None, None, None)], {})
+
+
+class TestPartitionedWrites:
+    def test_rows_go_to_day_tables(self, store):
+        _write(store, T0)
+        _write(store, T0 + DAY)
+        assert list_partitions(store.connection) == ["2026-02-05", "2026-02-06"]
+        base = store.connection.execute("SELECT COUNT(*) FROM check_history")
+        assert base.fetchone()[0] == 0
+
+    def test_ids_increase_across_partitions(self, store):
+        _write(store, T0, ["healthy"] * 2)
+        _write(store, T0 + DAY)
+        ids = [r["id"] for r in store.get_history("a")]
+        assert ids == sorted(ids) and ids[0] > ID_SPAN
+        assert table_for_id(ids[-1]) == partition_name("2026-02-06")
+        assert table_for_id(5) == "check_history"
+
+    def test_record_check_and_change_only_mode(self, tmp_path):
+        s = WatchdogStore(
+            str(tmp_path / "c.db"), history_mode="changes", partitioned=True
+        )
+        for _ in range(3):
+            s.record_check("a", "healthy", 1, None, None)
+        s.record_check("a", "timed_out", 1, None, None)
+        history = s.get_history("a")
+        s.close()
+        assert [(r["health"], r["repeats"]) for r in history] == [
+            ("healthy", 2), ("timed_out", 0),
+        ]
+
+    @pytest.mark.parametrize("mode", ["full", "changes"])
+    def test_record_report_reads_state_once(self, tmp_path, mode):
+        s = WatchdogStore(str(tmp_path / "c.db"), history_mode=mode, partitioned=True)
+        report = MonitorReport(timestamp=T0, results=[
+            CheckResult(
+                process_key=f"p{i}", display_name=f"p{i}",
+                health=ProcessHealth.TIMED_OUT, pid=1, last_heartbeat=None,
+                elapsed_seconds=None, timeout_seconds=60,
+            )
+            for i in range(20)
+        ])
+        s.record_report(report, 3)
+        selects = []
+        s.connection.set_trace_callback(
+            lambda sql: selects.append(sql) if sql.lstrip().startswith("SELECT") else None
+        )
+        assert s.record_report(report, 3)["p0"] == 2
+        s.connection.set_trace_callback(None)
+        s.close()
+        assert len(selects) == 1
+
+    def test_cached_store(self, tmp_path):
+        s = CachedWatchdogStore(str(tmp_path / "c.db"), partitioned=True)
+        s.record_check("a", "timed_out", 1, None, None)
+        assert len(s.get_history("a")) == 1
+        assert len(list_partitions(s.connection)) == 1
+        s.close()
+
+
+class TestPartitionedQueries:
+    def test_range_skips_other_partitions(self, store):
+        for day in range(3):
+            _write(store, T0 + day * DAY)
+        statements = []
+        store.connection.set_trace_callback(statements.append)
+        since = (T0 + DAY).isoformat()
+        rows = list(iter_history(store.connection, "a", since=since, until=since[:10] + "T23"))
+        assert len(rows) == 1
+        assert not any(partition_name("2026-02-05") in s for s in statements)
+        assert not any(partition_name("2026-02-07") in s for s in statements)
+
+    def test_newest_first_limit_spans_partitions(self, store):
+        _write(store, T0, ["healthy", "timed_out"])
+        _write(store, T0 + DAY)
+        rows = list(iter_history(store.connection, "a", newest_first=True, limit=2))
+        assert [r.checked_at[:10] for r in rows] == ["2026-02-06", "2026-02-05"]
+        assert rows[1].health == "timed_out"
+
+    def test_latest_history(self, store):
+        store.record_check("a", "healthy", 1, None, None)
+        _write(store, T0, ["healthy", "timed_out"])
+        latest = latest_history(store.connection, 2)
+        assert [r.checked_at[:10] for r in latest["a"]][1] == "2026-02-05"
+        assert len(latest["a"]) == 2
+
+    def test_latest_history_stops_once_filled(self, store):
+        store.record_check("a", "healthy", 1, None, None)
+        for day in range(3):
+            _write(store, T0 + day * DAY, ["healthy", "timed_out"])
+        statements = []
+        store.connection.set_trace_callback(statements.append)
+        latest = latest_history(store.connection, 2)
+        store.connection.set_trace_callback(None)
+        assert len(latest["a"]) == 2
+        days = ("2026-02-05", "2026-02-06", "2026-02-07")
+        read = [day for day in days if any(partition_name(day) in sql for sql in statements)]
+        assert read == ["2026-02-07"]  # today's row plus the newest older day
+
+    def test_history_tables_by_id(self, store):
+        _write(store, T0)
+        _write(store, T0 + DAY)
+        first = store.get_history("a")[0]["id"]
+        assert history_tables(store.connection, after_id=first) == [
+            partition_name("2026-02-05"), partition_name("2026-02-06"),
+        ]
+
+    def test_stats_and_replay_read_partitions(self, store):
+        _write(store, T0, ["healthy", "timed_out", "healthy"])
+        _write(store, T0 + DAY, ["healthy"])
+        stats = StatsEngine(store.connection).compute(T0 - DAY, T0 + 2 * DAY)
+        assert stats["a"].checks == 4 and stats["a"].failures == 1
+        assert len(load_traces(store.connection)["a"].checked) == 4
+
+
+class TestPartitionRetention:
+    def test_drops_expired_partitions(self, store):
+        _write(store, T0, ["healthy", "timed_out"])
+        _write(store, T0 + DAY)
+        moved = RetentionEngine(store.connection, 24).run(1.0, now=T0 + 2 * DAY)
+        assert moved == 2
+        assert list_partitions(store.connection) == ["2026-02-06"]
+        daily = get_rollups(store.connection, "a", "daily")
+        assert sum(r["checks"] for r in daily) == 2
+
+    def test_keeps_partially_expired_day(self, store):
+        _write(store, T0)
+        RetentionEngine(store.connection, 1).run(1.0, now=T0 + timedelta(hours=2))
+        assert list_partitions(store.connection) == ["2026-02-05"]
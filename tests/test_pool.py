@@ -0,0 +1,67 @@
+"""Tests for the bounded check pool."""
+
+import threading
+import time
+
+import pytest
+
+from src.monitor.pool import run_bounded
+
+
+def test_results_keyed_like_items():
+    items = {"a": 1, "b": 2, "c": 3}
+    results = run_bounded(items, lambda k, v: v * 10, workers=2)
+    assert results == {"a": 10, "b": 20, "c": 30}
+
+
+def test_empty_items():
+    assert run_bounded({}, lambda k, v: v, workers=4) == {}
+
+
+def test_concurrency_is_bounded():
+    lock = threading.Lock()
+    active, peak = [0], [0]
+
+    def work(key, item):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return key
+
+    run_bounded({str(i): i for i in range(12)}, work, workers=3)
+    assert peak[0] <= 3
+
+
+def test_hung_task_times_out_without_blocking_others():
+    release = threading.Event()
+
+    def work(key, item):
+        if key == "hung":
+            release.wait(5)
+        return "ok"
+
+    items = {"hung": 0, "a": 1, "b": 2}
+    t0 = time.monotonic()
+    results = run_bounded(
+        items, work, workers=1, deadline=0.1,
+        on_timeout=lambda k, v: "timeout",
+    )
+    release.set()
+    assert results == {"hung": "timeout", "a": "ok", "b": "ok"}
+    assert time.monotonic() - t0 < 2
+
+
+def test_exception_is_reraised():
+    def work(key, item):
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        run_bounded({"a": 1}, work, workers=1)
+
+
+def test_deadline_requires_on_timeout():
+    with pytest.raises(ValueError):
+        run_bounded({"a": 1}, lambda k, v: v, workers=1, deadline=1.0)
@@ -0,0 +1,79 @@
+"""Tests for the /proc snapshot index."""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.monitor.procscan import ProcSnapshot, read_proc_entry
+
+
+def _fake_proc(root, pid, start_time, state="S", comm="svc", cmdline=b"svc\0-x"):
+    base = root / str(pid)
+    base.mkdir(parents=True)
+    rest = [state] + ["0"] * 18 + [str(start_time)] + ["0"] * 5
+    (base / "stat").write_text(f"{pid} ({comm}) {' '.join(rest)}\n")
+    (base / "cmdline").write_bytes(cmdline)
+
+
+@pytest.fixture
+def proc_root(tmp_path):
+    root = tmp_path / "proc"
+    _fake_proc(root, 1, 1, comm="init")
+    _fake_proc(root, 100, 5000, comm="weird) name (x")
+    _fake_proc(root, 200, 6000, state="Z")
+    (root / "self").mkdir()
+    return root
+
+
+class TestReadProcEntry:
+    def test_parses_stat_and_cmdline(self, proc_root):
+        entry = read_proc_entry(100, proc_root)
+        assert entry.start_time == 5000
+        assert entry.state == "S"
+        assert entry.cmdline == "svc -x"
+
+    def test_missing_pid(self, proc_root):
+        assert read_proc_entry(999, proc_root) is None
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux /proc")
+    def test_reads_own_process(self):
+        assert read_proc_entry(os.getpid()).state in ("R", "S")
+
+
+class TestProcSnapshot:
+    @patch("src.monitor.procscan._signal_probe", return_value=False)
+    def test_scan_lists_numeric_entries(self, mock_probe, proc_root):
+        snap = ProcSnapshot.scan(proc_root)
+        assert snap.is_alive(100)
+        assert not snap.is_alive(999)
+
+    @patch("src.monitor.procscan._signal_probe", return_value=True)
+    def test_started_after_scan_is_probed(self, mock_probe, proc_root):
+        snap = ProcSnapshot.scan(proc_root)
+        _fake_proc(proc_root, 300, 7000)
+        assert snap.is_alive(300, start_time=7000)
+        assert not snap.is_alive(300, start_time=1)
+        mock_probe.assert_called_with(300)
+
+    @patch("src.monitor.procscan._signal_probe", return_value=True)
+    def test_hidden_pid_trusts_probe(self, mock_probe, proc_root):
+        assert ProcSnapshot.scan(proc_root).is_alive(999)
+
+    def test_scan_unavailable_returns_none(self, tmp_path):
+        assert ProcSnapshot.scan(tmp_path / "nope") is None
+
+    def test_zombie_is_dead(self, proc_root):
+        assert not ProcSnapshot.scan(proc_root).is_alive(200)
+
+    def test_start_time_mismatch_is_recycled(self, proc_root):
+        snap = ProcSnapshot.scan(proc_root)
+        assert snap.is_alive(100, start_time=5000)
+        assert not snap.is_alive(100, start_time=4000)
+
+    def test_entries_read_lazily(self, proc_root):
+        snap = ProcSnapshot.scan(proc_root)
+        (proc_root / "100" / "stat").unlink()
+        assert snap.get(100) is None
+        assert snap.is_alive(1)
@@ -0,0 +1,105 @@
+"""Tests for streaming check_history queries."""
+
+import types
+
+import pytest
+
+from src.database.queries import HistoryRow, iter_history, latest_history
+from src.database.schema import INSERT_HISTORY
+from src.database.store import WatchdogStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = WatchdogStore(str(tmp_path / "test.db"))
+    yield s
+    s.close()
+
+
+def _fill(store, key, healths):
+    for minute, health in enumerate(healths):
+        store.connection.execute(
+            INSERT_HISTORY,
+            (key, f"2026-02-05T12:{minute:02d}:00+00:00", health,
+             1, None, None, None, None),
+        )
+        store.connection.execute(
+            "INSERT OR IGNORE INTO process_state (process_key) VALUES (?)", (key,)
+        )
+    store.connection.commit()
+
+
+class TestIterHistory:
+    def test_returns_generator_of_rows(self, store):
+        _fill(store, "a", ["healthy", "timed_out"])
+        rows = iter_history(store.connection, "a")
+        assert isinstance(rows, types.GeneratorType)
+        rows = list(rows)
+        assert all(isinstance(r, HistoryRow) for r in rows)
+        assert [r.health for r in rows] == ["healthy", "timed_out"]
+
+    def test_time_range(self, store):
+        _fill(store, "a", ["healthy"] * 5)
+        rows = list(iter_history(
+            store.connection, "a",
+            since="2026-02-05T12:01", until="2026-02-05T12:03",
+        ))
+        assert [r.checked_at[14:16] for r in rows] == ["01", "02"]
+
+    def test_health_filter(self, store):
+        _fill(store, "a", ["healthy", "timed_out", "stale_pid", "healthy"])
+        rows = iter_history(store.connection, "a", health=["timed_out", "stale_pid"])
+        assert [r.health for r in rows] == ["timed_out", "stale_pid"]
+
+    def test_cursor_pagination(self, store):
+        _fill(store, "a", ["healthy"] * 5)
+        page1 = list(iter_history(store.connection, "a", limit=2))
+        page2 = list(iter_history(
+            store.connection, "a", limit=2, after=page1[-1].cursor
+        ))
+        page3 = list(iter_history(
+            store.connection, "a", limit=2, after=page2[-1].cursor
+        ))
+        ids = [r.id for r in page1 + page2 + page3]
+        assert ids == sorted(ids) and len(set(ids)) == 5
+
+    def test_newest_first_cursor(self, store):
+        _fill(store, "a", ["healthy"] * 3)
+        first = list(iter_history(store.connection, "a", limit=1, newest_first=True))
+        rest = list(iter_history(
+            store.connection, "a", newest_first=True, after=first[0].cursor
+        ))
+        assert [r.checked_at[14:16] for r in first + rest] == ["02", "01", "00"]
+
+    def test_other_processes_excluded(self, store):
+        _fill(store, "a", ["healthy"])
+        _fill(store, "b", ["timed_out"])
+        assert [r.process_key for r in iter_history(store.connection, "a")] == ["a"]
+
+    def test_uses_index(self, store):
+        plan = store.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM check_history"
+            " WHERE process_key = ? AND checked_at >= ? ORDER BY checked_at",
+            ("a", "2026"),
+        ).fetchall()
+        assert any("idx_check_history_process_time" in r[3] for r in plan)
+
+
+class TestLatestHistory:
+    def test_latest_n_per_process(self, store):
+        _fill(store, "a", ["healthy"] * 4)
+        _fill(store, "b", ["timed_out"])
+        latest = latest_history(store.connection, 2)
+        assert [r.checked_at[14:16] for r in latest["a"]] == ["03", "02"]
+        assert len(latest["b"]) == 1
+
+    def test_empty_database(self, store):
+        assert latest_history(store.connection, 5) == {}
+
+
+class TestGetHistory:
+    def test_returns_dicts(self, store):
+        store.record_check("a", "healthy", 1, None, None)
+        [row] = store.get_history("a")
+        assert row["health"] == "healthy"
+        assert row["repeats"] == 0
@@ -0,0 +1,112 @@
+"""Tests for recovery attempt persistence."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.database.recovery_log import (
+    STDERR_TAIL_CHARS,
+    action_costs,
+    record_recovery,
+)
+from src.database.store import WatchdogStore
+from src.pipeline.recovery_pipeline import PipelineResult
+from src.recovery.cleaner import CleanResult
+from src.recovery.killer import KillResult
+from src.recovery.restarter import RestartResult
+
+T0 = datetime(2026, 2, 5, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = WatchdogStore(str(tmp_path / "test.db"))
+    yield s
+    s.close()
+
+
+def _result(clean_seconds=30, stderr="", recovered=True):
+    spans, t = [], T0
+    for seconds in (1, clean_seconds, 2):
+        spans.append((t, t + timedelta(seconds=seconds)))
+        t += timedelta(seconds=seconds)
+    return PipelineResult(
+        process_key="srv",
+        action_results=[
+            ("kill", KillResult(success=True, pid=10)),
+            ("clear_db", CleanResult(
+                success=recovered, script_path="/c.sh",
+                stderr=stderr, return_code=0 if recovered else 3,
+            )),
+            ("start", RestartResult(success=True, pid=11)),
+        ],
+        fully_recovered=recovered,
+        started_at=T0,
+        ended_at=t,
+        action_spans=spans,
+    )
+
+
+class TestRecordRecovery:
+    def test_writes_attempt_and_actions(self, store):
+        attempt_id = record_recovery(store.connection, _result(), "timed_out", 10)
+        attempt = store.connection.execute(
+            "SELECT * FROM recovery_attempts WHERE id = ?", (attempt_id,)
+        ).fetchone()
+        assert attempt["trigger_health"] == "timed_out"
+        assert attempt["pid"] == 10
+        assert attempt["duration_seconds"] == 33
+        assert attempt["fully_recovered"] == 1
+
+        actions = store.connection.execute(
+            "SELECT * FROM recovery_actions WHERE attempt_id = ? ORDER BY seq",
+            (attempt_id,),
+        ).fetchall()
+        assert [a["action"] for a in actions] == ["kill", "clear_db", "start"]
+        assert [a["duration_seconds"] for a in actions] == [1, 30, 2]
+        assert actions[1]["return_code"] == 0
+        assert actions[0]["return_code"] is None
+
+    def test_stderr_tail_truncated(self, store):
+        stderr = "x" * STDERR_TAIL_CHARS + "final error"
+        attempt_id = record_recovery(
+            store.connection, _result(stderr=stderr, recovered=False)
+        )
+        tail = store.connection.execute(
+            "SELECT stderr_tail FROM recovery_actions"
+            " WHERE attempt_id = ? AND action = 'clear_db'", (attempt_id,)
+        ).fetchone()[0]
+        assert len(tail) == STDERR_TAIL_CHARS
+        assert tail.endswith("final error")
+
+    def test_single_transaction(self, store):
+        statements = []
+        store.connection.set_trace_callback(statements.append)
+        record_recovery(store.connection, _result())
+        commits = [s for s in statements if s.upper().startswith("COMMIT")]
+        assert len(commits) == 1
+
+    def test_result_without_timings(self, store):
+        result = PipelineResult(process_key="srv", fully_recovered=True)
+        attempt_id = record_recovery(store.connection, result)
+        row = store.connection.execute(
+            "SELECT duration_seconds FROM recovery_attempts WHERE id = ?",
+            (attempt_id,),
+        ).fetchone()
+        assert row[0] == 0
+
+
+class TestActionCosts:
+    def test_most_expensive_first(self, store):
+        record_recovery(store.connection, _result(clean_seconds=30))
+        record_recovery(store.connection, _result(clean_seconds=50, recovered=False))
+        costs = action_costs(store.connection)
+        assert costs[0]["action"] == "clear_db"
+        assert costs[0]["runs"] == 2
+        assert costs[0]["total_seconds"] == 80
+        assert costs[0]["max_seconds"] == 50
+        assert costs[0]["failures"] == 1
+
+    def test_since_filter(self, store):
+        record_recovery(store.connection, _result())
+        assert action_costs(store.connection, since="2027") == []
@@ -1,5 +1,7 @@
 """Tests for the recovery pipeline orchestrator."""
 
+import threading
+
 import pytest
 from unittest.mock import patch
 
@@ -49,6 +51,22 @@ class TestRunRecovery:
         assert result.fully_recovered is True
         assert result.stage_failed is None
 
+    @patch("src.pipeline.recovery_pipeline.restart_process")
+    @patch("src.pipeline.recovery_pipeline.run_cleanup")
+    @patch("src.pipeline.recovery_pipeline.kill_process")
+    def test_records_action_spans(
+        self, mock_kill, mock_clean, mock_restart
+    ):
+        mock_kill.return_value = KILL_OK
+        mock_clean.return_value = CLEAN_OK
+        mock_restart.return_value = RESTART_OK
+
+        result = run_recovery("test", 1234, PROC_CONFIG)
+        assert len(result.action_spans) == len(result.action_results) == 3
+        assert result.started_at <= result.action_spans[0][0]
+        for began, ended in result.action_spans:
+            assert began <= ended <= result.ended_at
+
     @patch("src.pipeline.recovery_pipeline.restart_process")
     @patch("src.pipeline.recovery_pipeline.run_cleanup")
     @patch("src.pipeline.recovery_pipeline.kill_process")
@@ -155,3 +173,69 @@ class TestRunRecovery:
         result = run_recovery("test", 1234, cfg)
         assert result.fully_recovered is True
         mock_kill.assert_not_called()
+
+    @patch("src.pipeline.recovery_pipeline.heartbeat_probe")
+    @patch("src.pipeline.recovery_pipeline.restart_process")
+    def test_start_waits_for_heartbeat(self, mock_restart, mock_probe):
+        mock_restart.return_value = RESTART_OK
+        cfg = _config(recovery_actions=["start"])
+        run_recovery("test", 1234, cfg, global_opts={"ready_timeout": 12.0})
+        key, proc, old_pid, _ = mock_probe.call_args.args
+        assert (key, proc, old_pid) == ("test", cfg, 1234)
+        assert mock_restart.call_args.kwargs["ready"] is mock_probe.return_value
+        assert mock_restart.call_args.kwargs["ready_timeout"] == 12.0
+
+    @patch("src.pipeline.recovery_pipeline.restart_process")
+    def test_ready_timeout_zero_uses_verify_delay(self, mock_restart):
+        mock_restart.return_value = RESTART_OK
+        run_recovery(
+            "test", 1234, _config(recovery_actions=["start"]),
+            global_opts={"ready_timeout": 0, "verify_delay": 0.5},
+        )
+        assert mock_restart.call_args.kwargs["ready"] is None
+        assert mock_restart.call_args.kwargs["verify_delay"] == 0.5
+
+
+class TestActionDependencies:
+    CFG = {
+        "commands": {"start": "python s.py", "clear_db": "/a.sh", "clear_emails": "/b.sh"},
+        "recovery_actions": ["kill", "clear_db", "clear_emails", "start"],
+        "action_dependencies": {
+            "clear_db": ["kill"], "clear_emails": ["kill"],
+            "start": ["clear_db", "clear_emails"],
+        },
+    }
+
+    @patch("src.pipeline.recovery_pipeline.restart_process", return_value=RESTART_OK)
+    @patch("src.pipeline.recovery_pipeline.kill_process", return_value=KILL_OK)
+    @patch("src.pipeline.recovery_pipeline.run_cleanup")
+    def test_cleanups_run_in_parallel(self, mock_clean, mock_kill, mock_restart):
+        barrier = threading.Barrier(2, timeout=2)
+
+        def clean(script, **kwargs):
+            barrier.wait()  # both cleanups must be in flight together
+            return CLEAN_OK
+
+        mock_clean.side_effect = clean
+        result = run_recovery("test", 1234, self.CFG)
+        assert result.fully_recovered is True
+        assert [name for name, _ in result.action_results] == self.CFG["recovery_actions"]
+        start_began = result.action_spans[3][0]
+        assert all(ended <= start_began for _, ended in result.action_spans[1:3])
+
+    @patch("src.pipeline.recovery_pipeline.restart_process")
+    @patch("src.pipeline.recovery_pipeline.kill_process", return_value=KILL_FAIL)
+    @patch("src.pipeline.recovery_pipeline.run_cleanup", return_value=CLEAN_OK)
+    def test_kill_failure_still_fatal(self, mock_clean, mock_kill, mock_restart):
+        result = run_recovery("test", 1234, self.CFG)
+        assert result.stage_failed == "kill"
+        mock_clean.assert_not_called()
+        mock_restart.assert_not_called()
+
+    @patch("src.pipeline.recovery_pipeline.restart_process", return_value=RESTART_OK)
+    @patch("src.pipeline.recovery_pipeline.kill_process", return_value=KILL_OK)
+    @patch("src.pipeline.recovery_pipeline.run_cleanup", return_value=CLEAN_FAIL)
+    def test_cleanup_failure_continues(self, mock_clean, mock_kill, mock_restart):
+        result = run_recovery("test", 1234, self.CFG)
+        assert result.fully_recovered is True
+        mock_restart.assert_called_once()
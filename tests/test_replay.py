@@ -0,0 +1,126 @@
+"""Tests for the threshold replay simulator."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.cli.main import main
+from src.database.schema import INSERT_HISTORY
+from src.database.store import ACTION_RECOVERY, WatchdogStore
+from src.monitor.replay import load_traces, sweep
+
+T0 = datetime(2026, 2, 5, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = WatchdogStore(str(tmp_path / "test.db"))
+    yield s
+    s.close()
+
+
+def _checks(store, rows, key="a"):
+    """rows: (elapsed_seconds, health, action) one minute apart."""
+    for i, (elapsed, health, action) in enumerate(rows):
+        at = T0 + timedelta(minutes=i)
+        hb = (at - timedelta(seconds=elapsed)).isoformat() if elapsed is not None else None
+        store.connection.execute(
+            INSERT_HISTORY,
+            (key, at.isoformat(), health, 1, hb, None, action, elapsed),
+        )
+    store.connection.commit()
+
+
+def _outcome(outcomes, timeout, threshold):
+    return next(
+        o for o in outcomes
+        if o.timeout_seconds == timeout and o.threshold == threshold
+    )
+
+
+# A heartbeat that stalls for 3 checks and comes back on its own
+BLIP = [(10, "healthy", None), (100, "timed_out", None),
+        (160, "timed_out", None), (220, "timed_out", None),
+        (10, "healthy", None)]
+
+# A hang that recorded recovery fixed
+HANG = [(10, "healthy", None), (100, "timed_out", None),
+        (160, "timed_out", ACTION_RECOVERY), (5, "healthy", None)]
+
+
+class TestSweep:
+    def test_tight_threshold_fires_false_positive(self, store):
+        _checks(store, BLIP)
+        outcomes = sweep(load_traces(store.connection), [60], [1, 2, 4])
+        o = _outcome(outcomes, 60, 2)
+        assert o.recoveries == 1
+        assert o.false_positives == 1
+        assert _outcome(outcomes, 60, 1).recoveries == 3
+        assert _outcome(outcomes, 60, 4).recoveries == 0
+
+    def test_larger_timeout_skips_blip(self, store):
+        _checks(store, BLIP)
+        outcomes = sweep(load_traces(store.connection), [60, 300], [1])
+        assert _outcome(outcomes, 300, 1).recoveries == 0
+        assert _outcome(outcomes, 60, 1).recoveries == 3
+
+    def test_missed_real_failure(self, store):
+        _checks(store, HANG)
+        outcomes = sweep(load_traces(store.connection), [60], [2, 3])
+        assert _outcome(outcomes, 60, 2).false_positives == 0
+        assert _outcome(outcomes, 60, 2).missed == 0
+        assert _outcome(outcomes, 60, 3).missed == 1
+
+    def test_detection_latency_from_last_heartbeat(self, store):
+        _checks(store, HANG)
+        o = _outcome(sweep(load_traces(store.connection), [60], [2]), 60, 2)
+        # last heartbeat at T0+1m-100s, fired at the T0+2m check
+        assert o.mean_latency == pytest.approx(160)
+
+    def test_timeout_independent_states_stay_unhealthy(self, store):
+        _checks(store, [(None, "no_heartbeat", None)] * 2)
+        o = _outcome(sweep(load_traces(store.connection), [10_000], [2]), 10_000, 2)
+        assert o.recoveries == 1
+
+    def test_elapsed_derived_from_heartbeat_ts(self, store):
+        store.connection.execute(
+            INSERT_HISTORY,
+            ("a", T0.isoformat(), "timed_out", 1,
+             (T0 - timedelta(seconds=500)).isoformat(), None, None, None),
+        )
+        o = _outcome(sweep(load_traces(store.connection), [400], [1]), 400, 1)
+        assert o.recoveries == 1
+
+    def test_processes_and_repeats(self, tmp_path):
+        s = WatchdogStore(str(tmp_path / "c.db"), history_mode="changes")
+        for _ in range(3):
+            s.record_check("b", "no_heartbeat", None, None, None)
+        traces = load_traces(s.connection, process_key="b")
+        s.close()
+        assert len(traces["b"].checked) == 3
+
+
+class TestReplayCommand:
+    def test_prints_grid(self, tmp_path, capsys, store):
+        _checks(store, BLIP)
+        config = {"log_level": "WARNING", "db_path": str(tmp_path / "test.db"),
+                  "processes": {}}
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(config))
+
+        code = main([
+            "-c", str(path), "replay", "--days", "36500",
+            "--timeouts", "60", "300", "--thresholds", "1", "2",
+        ])
+        out = capsys.readouterr().out.splitlines()
+        assert code == 0
+        assert "Replayed 5 checks of 1 processes" in out[0]
+        assert len(out) == 2 + 4
+
+    def test_missing_database(self, tmp_path, capsys):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({
+            "db_path": str(tmp_path / "none.db"), "processes": {},
+        }))
+        assert main(["-c", str(path), "replay"]) == 2
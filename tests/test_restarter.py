@@ -1,9 +1,17 @@
 """Tests for process restarter module."""
 
+import os
+import signal
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
 import pytest
 from unittest.mock import patch, MagicMock
 
-from src.recovery.restarter import RestartResult, restart_process
+from src.heartbeat.writer import HeartbeatWriter
+from src.recovery.restarter import RestartResult, heartbeat_probe, restart_process
 
 
 class TestRestartProcess:
@@ -60,3 +68,61 @@ class TestRestartProcess:
 
         restart_process("cd /tmp && python server.py")
         assert mock_popen.call_args.kwargs["shell"] is True
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _service(tmp_path, delay=0.0, exit_code=None):
+    """Shell command for a child that writes a heartbeat after `delay`."""
+    code = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); "
+        "from src.heartbeat.writer import HeartbeatWriter; "
+        f"time.sleep({delay}); HeartbeatWriter(sys.argv[2], 'srv').beat(); time.sleep(5)"
+    )
+    if exit_code is not None:
+        return f"exit {exit_code}"
+    return f"{sys.executable} -c \"{code}\" {ROOT} {tmp_path}"
+
+
+class TestHeartbeatReadiness:
+    def _probe(self, tmp_path, old_pid=None):
+        proc = {"heartbeat_path": str(tmp_path / "srv.json")}
+        return heartbeat_probe("srv", proc, old_pid, datetime.now(timezone.utc))
+
+    def _run(self, tmp_path, command, timeout=5.0, old_pid=None):
+        started = time.monotonic()
+        result = restart_process(
+            command, ready=self._probe(tmp_path, old_pid), ready_timeout=timeout
+        )
+        return result, time.monotonic() - started
+
+    def test_returns_on_first_fresh_heartbeat(self, tmp_path):
+        result, elapsed = self._run(tmp_path, _service(tmp_path, delay=0.3))
+        assert result.success is True
+        assert 0.3 <= elapsed < 2.0
+        os.kill(result.pid, signal.SIGTERM)
+
+    def test_no_heartbeat_within_timeout(self, tmp_path):
+        result, elapsed = self._run(tmp_path, "sleep 5", timeout=0.3)
+        assert result.success is False
+        assert result.error == "No fresh heartbeat within 0.3s"
+        assert elapsed < 1.0
+        os.killpg(result.pid, signal.SIGTERM)
+
+    def test_failed_command_fails_fast(self, tmp_path):
+        result, elapsed = self._run(tmp_path, _service(tmp_path, exit_code=3))
+        assert result.success is False
+        assert "code 3" in result.error
+        assert elapsed < 1.0
+
+    def test_probe_requires_fresh_running_heartbeat_from_new_pid(self, tmp_path):
+        proc = {"heartbeat_path": str(tmp_path / "srv.json")}
+        writer = HeartbeatWriter(str(tmp_path), "srv")
+        past = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        writer.beat()
+        assert self._probe(tmp_path)() is None  # written before the restart
+        assert heartbeat_probe("srv", proc, None, past)() is not None
+        assert heartbeat_probe("srv", proc, os.getpid(), past)() is None  # old PID
+        writer.beat(status="error")
+        assert heartbeat_probe("srv", proc, None, past)() is None
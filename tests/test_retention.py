@@ -0,0 +1,146 @@
+"""Tests for check_history retention and rollups."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.cli.store_ops import apply_retention
+from src.config.config_loader import get_global_options
+from src.database.retention import RetentionEngine, get_rollups
+from src.database.schema import INSERT_HISTORY, apply_schema
+from src.database.store import ACTION_RECOVERY, WatchdogStore
+
+NOW = datetime(2026, 2, 10, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = WatchdogStore(str(tmp_path / "test.db"))
+    yield s
+    s.close()
+
+
+def _insert(store, at, health="healthy", action=None, elapsed=None, key="a"):
+    store.connection.execute(
+        INSERT_HISTORY,
+        (key, at.isoformat(), health, 1, None, None, action, elapsed),
+    )
+    store.connection.commit()
+
+
+def _raw_count(store):
+    return store.connection.execute(
+        "SELECT COUNT(*) FROM check_history"
+    ).fetchone()[0]
+
+
+class TestRetentionEngine:
+    def test_keeps_recent_rows(self, store):
+        _insert(store, NOW - timedelta(hours=1))
+        moved = RetentionEngine(store.connection, 24).run(1.0, now=NOW)
+        assert moved == 0
+        assert _raw_count(store) == 1
+
+    def test_rolls_up_and_deletes_old_rows(self, store):
+        old = NOW - timedelta(days=3)
+        _insert(store, old, elapsed=10.0)
+        _insert(store, old + timedelta(minutes=1), elapsed=30.0)
+        _insert(store, old, "timed_out", ACTION_RECOVERY, 400.0)
+        _insert(store, NOW)
+
+        moved = RetentionEngine(store.connection, 24).run(1.0, now=NOW)
+
+        assert moved == 3
+        assert _raw_count(store) == 1
+        hourly = {r["health"]: r for r in get_rollups(store.connection, "a")}
+        assert hourly["healthy"]["checks"] == 2
+        assert hourly["healthy"]["max_elapsed"] == 30.0
+        assert hourly["healthy"]["recoveries"] == 0
+        assert hourly["timed_out"]["recoveries"] == 1
+        daily = get_rollups(store.connection, "a", "daily")
+        assert daily[0]["bucket"] == old.isoformat()[:10]
+
+    def test_merges_into_existing_bucket(self, store):
+        old = NOW - timedelta(days=3)
+        engine = RetentionEngine(store.connection, 24)
+        _insert(store, old, elapsed=5.0)
+        engine.run(1.0, now=NOW)
+        _insert(store, old, elapsed=None)
+        engine.run(1.0, now=NOW)
+
+        [row] = get_rollups(store.connection, "a")
+        assert row["checks"] == 2
+        assert row["max_elapsed"] == 5.0
+
+    def test_stops_when_budget_spent(self, store):
+        for i in range(5):
+            _insert(store, NOW - timedelta(days=2, minutes=i))
+        engine = RetentionEngine(store.connection, 24, batch_size=2)
+
+        assert engine.run(0.0, now=NOW) == 2
+        assert _raw_count(store) == 3
+        assert engine.run(1.0, now=NOW) == 3
+
+    def test_batches_stop_at_first_unexpired_row(self, store):
+        _insert(store, NOW - timedelta(days=2))
+        _insert(store, NOW - timedelta(hours=1), key="b")
+        _insert(store, NOW - timedelta(days=2, minutes=1))  # late, out of order
+        engine = RetentionEngine(store.connection, 24)
+
+        assert engine.run(1.0, now=NOW) == 1
+        ids = [r[0] for r in store.connection.execute(
+            "SELECT id FROM check_history ORDER BY id"
+        )]
+        assert ids == [2, 3]
+
+    def test_prunes_old_hourly_rollups(self, store):
+        _insert(store, NOW - timedelta(days=40))
+        _insert(store, NOW - timedelta(days=2))
+        RetentionEngine(store.connection, 24, hourly_retention_days=30).run(
+            1.0, now=NOW
+        )
+
+        assert len(get_rollups(store.connection, "a")) == 1
+        assert len(get_rollups(store.connection, "a", "daily")) == 2
+
+    def test_unknown_grain_rejected(self, store):
+        with pytest.raises(ValueError):
+            get_rollups(store.connection, "a", "weekly")
+
+
+class TestApplyRetention:
+    def test_rolls_up_with_default_options(self, store):
+        _insert(store, datetime.now(timezone.utc) - timedelta(days=30))
+        apply_retention(store, get_global_options({}))
+        assert _raw_count(store) == 0
+        assert len(get_rollups(store.connection, "a", "daily")) == 1
+
+    def test_zero_retention_disables(self, store):
+        _insert(store, datetime.now(timezone.utc) - timedelta(days=30))
+        apply_retention(store, get_global_options({"history_retention_hours": 0}))
+        assert _raw_count(store) == 1
+
+
+class TestApplySchema:
+    def test_adds_elapsed_column_to_old_database(self, tmp_path):
+        db = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db)
+        conn.execute(
+            "CREATE TABLE check_history (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " process_key TEXT, checked_at TEXT, health TEXT, pid INTEGER,"
+            " heartbeat_ts TEXT, iteration INTEGER, action_taken TEXT)"
+        )
+        apply_schema(conn)
+        columns = {r[1] for r in conn.execute("PRAGMA table_info(check_history)")}
+        conn.close()
+        assert "elapsed_seconds" in columns
+
+
+class TestChangeOnlyRollup:
+    def test_counts_repeats(self, store):
+        _insert(store, NOW - timedelta(days=3), "timed_out", ACTION_RECOVERY)
+        store.connection.execute("UPDATE check_history SET repeats = 4")
+        RetentionEngine(store.connection, 24).run(1.0, now=NOW)
+        [row] = get_rollups(store.connection, "a")
+        assert (row["checks"], row["recoveries"]) == (5, 5)
@@ -0,0 +1,87 @@
+"""Tests for the concurrent recovery scheduler."""
+
+import threading
+import time
+
+from src.config.constants import ProcessHealth
+from src.monitor.models import CheckResult
+from src.pipeline.recovery_pipeline import PipelineResult
+from src.pipeline.scheduler import run_recoveries
+
+
+def _due(*keys):
+    return [
+        CheckResult(
+            process_key=key, display_name=key, health=ProcessHealth.TIMED_OUT,
+            pid=100 + i, last_heartbeat=None, elapsed_seconds=None, timeout_seconds=60,
+        )
+        for i, key in enumerate(keys)
+    ]
+
+
+def _enabled(*keys):
+    return {key: {"commands": {"start": "true"}} for key in keys}
+
+
+def test_results_in_due_order():
+    keys = ("c", "a", "b")
+    delays = {"c": 0.05, "a": 0.0, "b": 0.02}
+
+    def run(process_key, **kwargs):
+        time.sleep(delays[process_key])
+        return PipelineResult(process_key=process_key, fully_recovered=True)
+
+    results = run_recoveries(_due(*keys), _enabled(*keys), {"recovery_concurrency": 3}, run=run)
+    assert [r.process_key for r in results] == list(keys)
+
+
+def test_passes_check_result_fields():
+    calls = []
+
+    def run(**kwargs):
+        calls.append(kwargs)
+        return PipelineResult(process_key=kwargs["process_key"])
+
+    opts = {"recovery_concurrency": 1}
+    run_recoveries(_due("srv"), _enabled("srv"), opts, run=run)
+    assert calls == [{
+        "process_key": "srv", "pid": 100, "proc_config": {"commands": {"start": "true"}},
+        "global_opts": opts, "start_time": None,
+    }]
+
+
+def test_processes_overlap_up_to_limit():
+    keys = [f"p{i}" for i in range(6)]
+    lock = threading.Lock()
+    active, peak = [0], [0]
+
+    def run(process_key, **kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return PipelineResult(process_key=process_key, fully_recovered=True)
+
+    started = time.monotonic()
+    run_recoveries(_due(*keys), _enabled(*keys), {"recovery_concurrency": 3}, run=run)
+    assert peak[0] == 3
+    assert time.monotonic() - started < 0.25
+
+
+def test_raising_pipeline_is_a_failed_result():
+    def run(process_key, **kwargs):
+        if process_key == "bad":
+            raise RuntimeError("boom")
+        return PipelineResult(process_key=process_key, fully_recovered=True)
+
+    results = run_recoveries(
+        _due("bad", "good"), _enabled("bad", "good"), {"recovery_concurrency": 2}, run=run
+    )
+    assert [r.fully_recovered for r in results] == [False, True]
+    assert results[0].started_at is not None
+
+
+def test_nothing_due():
+    assert run_recoveries([], {}, {"recovery_concurrency": 4}) == []
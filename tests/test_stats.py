@@ -0,0 +1,153 @@
+"""Tests for the reliability statistics engine and stats command."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.cli.main import main
+from src.cli.stats import format_duration
+from src.database.recovery_log import record_recovery
+from src.database.retention import RetentionEngine
+from src.database.schema import INSERT_HISTORY
+from src.database.stats import ProcessStats, StatsEngine
+from src.database.store import WatchdogStore
+from src.pipeline.recovery_pipeline import PipelineResult
+from src.recovery.restarter import RestartResult
+
+T0 = datetime(2026, 2, 5, 12, 0, tzinfo=timezone.utc)
+WINDOW = (T0 - timedelta(days=1), T0 + timedelta(days=1))
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = WatchdogStore(str(tmp_path / "test.db"))
+    yield s
+    s.close()
+
+
+def _checks(store, healths, key="a", start=T0, step=60):
+    """Insert one check per health, `step` seconds apart."""
+    for i, health in enumerate(healths):
+        at = (start + timedelta(seconds=i * step)).isoformat()
+        store.connection.execute(
+            INSERT_HISTORY, (key, at, health, 1, None, None, None, None)
+        )
+    store.connection.commit()
+
+
+H, F = "healthy", "timed_out"
+
+
+class TestStatsEngine:
+    def test_availability(self, store):
+        _checks(store, [H, H, H, F])
+        stats = StatsEngine(store.connection).compute(*WINDOW)
+        assert stats["a"].checks == 4
+        assert stats["a"].availability == 75.0
+
+    def test_mttr_and_mtbf(self, store):
+        # failures at minutes 1 and 5, recovered after 2 and 1 minutes
+        _checks(store, [H, F, F, H, H, F, H])
+        s = StatsEngine(store.connection).compute(*WINDOW)["a"]
+        assert s.failures == 2
+        assert s.mttr_seconds == pytest.approx(90, abs=0.01)
+        assert s.mtbf_seconds == pytest.approx(240, abs=0.01)
+
+    def test_open_episode_counts_as_failure(self, store):
+        _checks(store, [H, F, F])
+        s = StatsEngine(store.connection).compute(*WINDOW)["a"]
+        assert s.failures == 1
+        assert s.mttr_seconds is None
+
+    def test_incremental_refresh_matches_full_scan(self, store, tmp_path):
+        engine = StatsEngine(store.connection)
+        _checks(store, [H, F])
+        assert engine.refresh() == 2
+        _checks(store, [F, H, F, H], start=T0 + timedelta(minutes=2))
+        assert engine.refresh() == 4
+        assert engine.refresh() == 0
+
+        full = WatchdogStore(str(tmp_path / "full.db"))
+        _checks(full, [H, F, F, H, F, H])
+        expected = StatsEngine(full.connection).compute(*WINDOW)["a"]
+        full.close()
+        assert engine.compute(*WINDOW)["a"] == expected
+
+    def test_refresh_only_reads_new_rows(self, store):
+        engine = StatsEngine(store.connection)
+        _checks(store, [H] * 10)
+        engine.refresh()
+        statements = []
+        store.connection.set_trace_callback(statements.append)
+        _checks(store, [H], start=T0 + timedelta(hours=1))
+        engine.refresh()
+        scans = [s for s in statements if "FROM check_history WHERE id >" in s]
+        assert scans and all("10" in s for s in scans)
+
+    def test_counts_change_only_repeats(self, tmp_path):
+        s = WatchdogStore(str(tmp_path / "c.db"), history_mode="changes")
+        engine = StatsEngine(s.connection)
+        s.record_check("a", "healthy", 1, None, None)
+        engine.refresh()
+        s.record_check("a", "healthy", 1, None, None)
+        s.record_check("a", "healthy", 1, None, None)
+        now = datetime.now(timezone.utc)
+        stats = engine.compute(now - timedelta(hours=2), now + timedelta(hours=1))
+        s.close()
+        assert stats["a"].checks == 3
+
+    def test_uses_rollups_for_retained_history(self, store):
+        _checks(store, [H, H, H, F], start=T0 - timedelta(days=10))
+        RetentionEngine(store.connection, 24).run(1.0, now=T0)
+        stats = StatsEngine(store.connection).compute(
+            T0 - timedelta(days=11), T0
+        )
+        assert stats["a"].checks == 4
+        assert stats["a"].availability == 75.0
+
+    def test_recovery_counts(self, store):
+        result = PipelineResult(
+            process_key="a", fully_recovered=True, started_at=T0, ended_at=T0,
+            action_results=[("start", RestartResult(success=True, pid=2))],
+        )
+        record_recovery(store.connection, result, "timed_out")
+        record_recovery(store.connection, PipelineResult(
+            process_key="a", started_at=T0, ended_at=T0, stage_failed="kill",
+        ))
+        s = StatsEngine(store.connection).compute(*WINDOW)["a"]
+        assert (s.recovery_attempts, s.restarts) == (2, 1)
+
+    def test_window_excludes_other_periods(self, store):
+        _checks(store, [F], start=T0 - timedelta(days=5))
+        stats = StatsEngine(store.connection).compute(*WINDOW)
+        assert stats == {}
+
+    def test_availability_without_checks(self):
+        assert ProcessStats("a").availability is None
+
+
+class TestStatsCommand:
+    def test_prints_table(self, tmp_path, capsys):
+        db_path = str(tmp_path / "w.db")
+        store = WatchdogStore(db_path)
+        store.record_check("srv", "healthy", 1, None, None)
+        store.record_check("srv", "timed_out", 1, None, None)
+        store.close()
+        config = {
+            "log_level": "WARNING", "db_path": db_path, "processes": {},
+        }
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(config))
+
+        assert main(["-c", str(path), "stats", "--days", "1"]) == 0
+        out = capsys.readouterr().out
+        assert "AVAIL%" in out
+        assert "srv" in out and "50.00" in out
+
+    @pytest.mark.parametrize("seconds, text", [
+        (None, "-"), (45, "45s"), (720, "12m"), (11100, "3h05m"),
+        (187200, "2d04h"),
+    ])
+    def test_format_duration(self, seconds, text):
+        assert format_duration(seconds) == text
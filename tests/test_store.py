@@ -1,8 +1,11 @@
 """Tests for the SQLite watchdog store."""
 
 import pytest
+from datetime import datetime, timezone
 
+from src.config.constants import ProcessHealth
 from src.database.store import WatchdogStore
+from src.monitor.models import CheckResult, MonitorReport
 
 
 @pytest.fixture
@@ -86,3 +89,106 @@ class TestCreatesTables:
         s = WatchdogStore(str(db_path))
         assert db_path.exists()
         s.close()
+
+
+def _report(*healths):
+    return MonitorReport(
+        timestamp=datetime.now(timezone.utc),
+        results=[
+            CheckResult(
+                process_key=key, display_name=key,
+                health=ProcessHealth(health), pid=100,
+                last_heartbeat=None, elapsed_seconds=None, timeout_seconds=60,
+            )
+            for key, health in healths
+        ],
+    )
+
+
+class TestRecordReport:
+    def test_returns_failures_per_process(self, store):
+        store.record_report(_report(("a", "timed_out"), ("b", "healthy")), 3)
+        failures = store.record_report(
+            _report(("a", "timed_out"), ("b", "stale_pid")), 3
+        )
+        assert failures == {"a": 2, "b": 1}
+        assert store.get_consecutive_failures("a") == 2
+
+    def test_healthy_resets(self, store):
+        store.record_check("a", "timed_out", 100, None, None)
+        assert store.record_report(_report(("a", "healthy")), 2) == {"a": 0}
+
+    def test_history_rows_and_actions(self, store):
+        store.record_report(_report(("a", "timed_out")), 2)
+        store.record_report(_report(("a", "timed_out")), 2)
+        rows = store.get_history("a")
+        assert [r["action_taken"] for r in rows] == [
+            "waiting_for_consecutive", "recovery_triggered",
+        ]
+
+    def test_single_commit_per_report(self, store):
+        statements = []
+        store._conn.set_trace_callback(statements.append)
+        report = _report(*[(f"p{i}", "timed_out") for i in range(50)])
+        store.record_report(report, 2)
+        commits = [s for s in statements if s.upper().startswith("COMMIT")]
+        assert len(commits) == 1
+
+
+@pytest.fixture
+def changes_store(tmp_path):
+    s = WatchdogStore(str(tmp_path / "test.db"), history_mode="changes")
+    yield s
+    s.close()
+
+
+class TestChangeOnlyHistory:
+    def test_unchanged_checks_extend_one_row(self, changes_store):
+        for _ in range(3):
+            changes_store.record_report(_report(("a", "healthy")), 2)
+        [row] = changes_store.get_history("a")
+        assert row["repeats"] == 2
+        assert row["last_checked_at"] >= row["checked_at"]
+
+    def test_change_writes_new_row(self, changes_store):
+        changes_store.record_check("a", "healthy", 100, None, None)
+        changes_store.record_check("a", "healthy", 100, None, None)
+        changes_store.record_check("a", "healthy", 200, None, None)
+        changes_store.record_check("a", "timed_out", 200, None, None)
+        rows = changes_store.get_history("a")
+        assert [(r["health"], r["pid"], r["repeats"]) for r in rows] == [
+            ("healthy", 100, 1), ("healthy", 200, 0), ("timed_out", 200, 0),
+        ]
+
+    def test_action_change_writes_new_row(self, changes_store):
+        changes_store.record_report(_report(("a", "timed_out")), 2)
+        changes_store.record_report(_report(("a", "timed_out")), 2)
+        assert len(changes_store.get_history("a")) == 2
+
+    def test_keyframe_after_interval(self, tmp_path):
+        s = WatchdogStore(
+            str(tmp_path / "k.db"), history_mode="changes", keyframe_seconds=0
+        )
+        s.record_check("a", "healthy", 100, None, None)
+        s.record_check("a", "healthy", 100, None, None)
+        assert len(s.get_history("a")) == 2
+        s.close()
+
+    def test_full_mode_writes_every_check(self, store):
+        for _ in range(3):
+            store.record_check("a", "healthy", 100, None, None)
+        assert len(store.get_history("a")) == 3
+
+    def test_expand_interpolates_checks(self, changes_store):
+        changes_store.record_check("a", "healthy", 100, None, None)
+        row_id = changes_store.get_history("a")[0]["id"]
+        changes_store.connection.execute(
+            "UPDATE check_history SET checked_at = ?, last_checked_at = ?,"
+            " repeats = 2 WHERE id = ?",
+            ("2026-01-01T00:00:00+00:00", "2026-01-01T00:02:00+00:00", row_id),
+        )
+        rows = changes_store.get_history("a", expand=True)
+        assert [r["checked_at"][11:19] for r in rows] == [
+            "00:00:00", "00:01:00", "00:02:00",
+        ]
+        assert all(r["repeats"] == 0 for r in rows)
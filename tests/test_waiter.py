@@ -0,0 +1,72 @@
+"""Tests for process exit waiting."""
+
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.recovery.waiter import (
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    open_pidfd,
+    wait_for_exit,
+    wait_polling,
+)
+
+needs_pidfd = pytest.mark.skipif(
+    open_pidfd(os.getpid()) is None, reason="pidfd_open unavailable"
+)
+
+
+class TestPolling:
+    @patch("src.recovery.waiter.time.sleep")
+    @patch("src.recovery.waiter.time.monotonic", return_value=0.0)
+    def test_backoff_doubles_to_cap(self, mock_mono, mock_sleep):
+        states = iter([True] * 8 + [False])
+        assert wait_polling(lambda: next(states), timeout=10.0) is True
+        intervals = [c.args[0] for c in mock_sleep.call_args_list]
+        assert intervals[0] == MIN_POLL_INTERVAL
+        assert intervals[1] == MIN_POLL_INTERVAL * 2
+        assert max(intervals) == MAX_POLL_INTERVAL
+
+    @patch("src.recovery.waiter.time.sleep")
+    @patch("src.recovery.waiter.time.monotonic")
+    def test_sleep_clipped_to_deadline(self, mock_mono, mock_sleep):
+        mock_mono.side_effect = [0.0, 0.998, 1.0]
+        assert wait_polling(lambda: True, timeout=1.0) is False
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.002)
+
+    def test_already_exited_does_not_sleep(self):
+        with patch("src.recovery.waiter.time.sleep") as mock_sleep:
+            assert wait_polling(lambda: False, timeout=1.0) is True
+        mock_sleep.assert_not_called()
+
+
+@needs_pidfd
+class TestPidfd:
+    def test_wakes_on_exit(self):
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.1)"])
+        fd = open_pidfd(proc.pid)
+        try:
+            assert wait_for_exit(fd, lambda: True, timeout=5.0) is True
+        finally:
+            os.close(fd)
+            proc.wait()
+
+    def test_times_out_while_running(self):
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        fd = open_pidfd(proc.pid)
+        try:
+            assert wait_for_exit(fd, lambda: True, timeout=0.05) is False
+        finally:
+            os.close(fd)
+            proc.kill()
+            proc.wait()
+
+    def test_missing_pid(self):
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        with pytest.raises(ProcessLookupError):
+            open_pidfd(proc.pid)